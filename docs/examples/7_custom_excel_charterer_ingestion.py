@@ -16,41 +16,21 @@ The below script returns:
 (The above data has been anonymised in this example)
 """
 from datetime import datetime, timedelta
-from typing import List
 
 import pandas as pd
 
-from vortexasdk import Corporations, VesselMovements
-from vortexasdk.api import ID
-
-
-def convert_to_corporation_ids(corporation_name: str) -> List[ID]:
-    """
-    Returns a list of all corporation IDs with the name `corporation_name`.
-    This function returns a list, instead of a single ID. This is because some charterers may share the same name.
-
-    :param corporation_name: The name of the corporation we'd like to look up
-    :return: A list of IDs of corporations with a matching name
-    """
-
-    # The search returns all corporations with similar names.
-    # For example, searching ADN would return both ADNOC and ADNATCO
-    corporations_with_encapsulating_names = Corporations().search(corporation_name).to_list()
-
-    # In this case we're only interested in corporations with an exact name match.
-    return [c.id for c in corporations_with_encapsulating_names if c.name.upper() == corporation_name.upper()]
-
-    # We could have chosen to keep the other corporations (with similar, but not exact names) like so:
-    # return [c.id for c in corporations_with_encapsulating_names]
-
+from vortexasdk import VesselMovements
+from vortexasdk.conversions import convert_to_corporation_ids_bulk
 
 if __name__ == "__main__":
     # Read our excel sheet of charterers into a dataframe
     charterers_df = pd.read_excel("./resources/my_charterers.xlsx")
 
-    # Convert the charterer names into ids
-    charterers_list_of_lists = charterers_df['charterers'].apply(convert_to_corporation_ids).to_list()
-    charterers = [item for sublist in charterers_list_of_lists for item in sublist]
+    # Convert all the charterer names into ids, searching every name at once.
+    # Each name maps to a list of IDs, because some charterers may share the same name.
+    # Only corporations with an exact name match are kept, pass `exact_term_match=False` to keep similar names too.
+    charterer_ids = convert_to_corporation_ids_bulk(charterers_df['charterers'].to_list())
+    charterers = [item for ids in charterer_ids.values() for item in ids]
 
     # Query API
     df = VesselMovements().search(
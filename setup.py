@@ -33,6 +33,9 @@ setuptools.setup(
         "tqdm==4.38.0",
     ],
     extras_require={
+        "async": ["aiohttp==3.6.2"],
+        "arrow": ["pyarrow==0.17.1"],
+        "orjson": ["orjson==3.8.3"],
         "tests": [
             "mypy==0.770",
             "pytest==5.2.4",
@@ -41,6 +44,8 @@ setuptools.setup(
             "pydoc-markdown==2.0.5",
             "tabulate==0.8.5",
             "six==1.12.0",
+            "aiohttp==3.6.2",
+            "pyarrow==0.17.1",
         ]
     },
 )
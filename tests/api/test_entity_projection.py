@@ -0,0 +1,128 @@
+import copy
+import math
+from unittest import TestCase
+
+from tests.mock_client import _read
+from vortexasdk.api.entity_flattening import (
+    convert_cargo_movement_to_flat_dict,
+    convert_vessel_movement_to_flat_dict,
+)
+from vortexasdk.api.entity_projection import (
+    CARGO_MOVEMENT_GROUPINGS,
+    CARGO_MOVEMENT_PROJECTOR,
+    VESSEL_MOVEMENT_PROJECTOR,
+    compile_column,
+)
+
+
+def _location(layer, label):
+    return {
+        "id": label,
+        "layer": layer,
+        "label": label,
+        "probability": 1,
+        "source": "model",
+    }
+
+
+def _event(event_type, port):
+    return {
+        "event_type": event_type,
+        "location": [_location("country", "NL"), _location("port", port)],
+        "start_timestamp": "2019-10-18T21:38:34+0000",
+    }
+
+
+def _with_sts_events(cm):
+    cm = copy.deepcopy(cm)
+    cm["events"] = [
+        _event("cargo_port_load_event", "Rotterdam"),
+        _event("cargo_sts_event", "Malta"),
+        _event("cargo_sts_event", "Lome"),
+        _event("cargo_port_unload_event", "Ningbo"),
+    ]
+    return cm
+
+
+def _assert_equal_with_nans(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if isinstance(e, float) and math.isnan(e):
+            assert isinstance(a, float) and math.isnan(a)
+        else:
+            assert a == e
+
+
+class TestCargoMovementProjection(TestCase):
+    records = [
+        cm
+        for cm in _read("cargo_movements.json")
+        for cm in [cm, _with_sts_events(cm)]
+    ]
+
+    def test_projection_matches_flattening(self):
+        flattened = [
+            convert_cargo_movement_to_flat_dict(copy.deepcopy(r))
+            for r in self.records
+        ]
+        columns = sorted({k for f in flattened for k in f.keys()}) + [
+            "events.cargo_port_unload_event.0.location.terminal.label",
+            "vessels.3.name",
+            "product",
+            "vessels.0.tags",
+        ]
+
+        projected = CARGO_MOVEMENT_PROJECTOR.project(self.records, columns)
+
+        for column in columns:
+            expected = [f.get(column, float("nan")) for f in flattened]
+            _assert_equal_with_nans(projected[column], expected)
+
+    def test_compile_column_reads_grouped_events(self):
+        accessor = compile_column(
+            "events.cargo_sts_event.1.location.port.label",
+            CARGO_MOVEMENT_GROUPINGS,
+        )
+
+        assert accessor(self.records[1]) == "Lome"
+
+    def test_projection_does_not_modify_records(self):
+        before = copy.deepcopy(self.records)
+
+        CARGO_MOVEMENT_PROJECTOR.project(self.records, ["product.grade.label"])
+
+        assert self.records == before
+
+
+class TestVesselMovementProjection(TestCase):
+    records = _read("vessel_movements.json")
+
+    def test_projection_matches_flattening(self):
+        flattened = [
+            convert_vessel_movement_to_flat_dict(r) for r in self.records
+        ]
+        columns = sorted({k for f in flattened for k in f.keys()}) + [
+            "cargoes.1.product.grade.label",
+            "origin.location",
+        ]
+
+        projected = VESSEL_MOVEMENT_PROJECTOR.project(self.records, columns)
+
+        for column in columns:
+            expected = [f.get(column, float("nan")) for f in flattened]
+            _assert_equal_with_nans(projected[column], expected)
+
+    def test_flattening_does_not_modify_records(self):
+        before = copy.deepcopy(self.records)
+
+        [convert_vessel_movement_to_flat_dict(r) for r in self.records]
+
+        assert self.records == before
+
+    def test_compiled_columns_are_reused(self):
+        columns = ["vessel.corporate_entities.charterer.label", "vessel.name"]
+
+        first = VESSEL_MOVEMENT_PROJECTOR._compile(tuple(columns))
+        second = VESSEL_MOVEMENT_PROJECTOR._compile(tuple(columns))
+
+        assert first is second
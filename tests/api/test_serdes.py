@@ -0,0 +1,119 @@
+import json
+import pickle
+from dataclasses import FrozenInstanceError, dataclass, field
+from typing import List, Optional, Tuple
+from unittest import TestCase
+
+import jsons
+from jsons.exceptions import UnfulfilledArgumentError
+
+from vortexasdk.api import CargoMovement, Vessel, VesselMovement
+from vortexasdk.api.serdes import add_slots, compile_decoder
+
+
+@dataclass(frozen=True)
+class Leaf:
+    name: str
+    weight: float = 1.0
+
+
+@add_slots
+@dataclass(frozen=True)
+class SlottedLeaf:
+    name: str
+    weight: float = 1.0
+
+
+@dataclass(frozen=True)
+class Tree:
+    leaves: List[Leaf]
+    position: Tuple[float, float]
+    tags: List[str] = field(default_factory=list)
+    root: Optional[Leaf] = None
+
+
+def _examples(name: str):
+    with open(f"tests/api/examples/{name}.json", "r") as f:
+        return json.load(f)
+
+
+class TestCompileDecoder(TestCase):
+    def test_decoder_is_cached_per_class(self):
+        assert compile_decoder(Tree) is compile_decoder(Tree)
+        assert compile_decoder(Tree) is not compile_decoder(Leaf)
+
+    def test_decode_nested(self):
+        d = {
+            "leaves": [{"name": "a", "weight": 2}, {"name": "b"}],
+            "position": [1, 2.5],
+            "root": {"name": "r"},
+        }
+
+        actual = compile_decoder(Tree)(d)
+
+        expected = Tree(
+            leaves=[Leaf("a", 2.0), Leaf("b")],
+            position=(1.0, 2.5),
+            tags=[],
+            root=Leaf("r"),
+        )
+        assert actual == expected
+        assert isinstance(actual.leaves[0].weight, float)
+
+    def test_skips_unknown_fields(self):
+        d = {"name": "a", "colour": "green"}
+
+        actual = compile_decoder(Leaf)(d)
+
+        assert actual == Leaf("a")
+        assert not hasattr(actual, "colour")
+
+    def test_missing_required_field_raises_like_jsons(self):
+        with self.assertRaises(UnfulfilledArgumentError):
+            compile_decoder(Leaf)({"weight": 1.0})
+
+    def test_matches_jsons_on_cargo_movements(self):
+        for d in _examples("cargo_movements"):
+            assert CargoMovement.from_dict(d) == jsons.load(d, CargoMovement)
+
+    def test_matches_jsons_on_vessel_movements(self):
+        for d in _examples("vessel_movements"):
+            assert VesselMovement.from_dict(d) == jsons.load(d, VesselMovement)
+
+    def test_matches_jsons_on_vessels(self):
+        for d in _examples("vessels"):
+            assert Vessel.from_dict(d) == jsons.load(d, Vessel)
+
+
+class TestAddSlots(TestCase):
+    def test_instances_have_no_dict(self):
+        movement = CargoMovement.from_dict(_examples("cargo_movements")[0])
+
+        assert not hasattr(movement, "__dict__")
+        assert not hasattr(movement.vessels[0], "__dict__")
+        assert not hasattr(movement.events[0].location[0], "__dict__")
+
+    def test_instances_stay_frozen(self):
+        leaf = SlottedLeaf("a")
+
+        with self.assertRaises(FrozenInstanceError):
+            leaf.name = "b"
+
+    def test_defaults_are_kept(self):
+        assert SlottedLeaf("a") == SlottedLeaf("a", 1.0)
+        assert SlottedLeaf.__slots__ == ("name", "weight")
+
+    def test_pickle(self):
+        movement = VesselMovement.from_dict(_examples("vessel_movements")[0])
+
+        assert pickle.loads(pickle.dumps(movement)) == movement
+
+    def test_repetitive_strings_are_interned(self):
+        records = json.loads(json.dumps(_examples("cargo_movements")))
+        copies = json.loads(json.dumps(_examples("cargo_movements")))
+
+        first = CargoMovement.from_dict(records[0]).events[0]
+        second = CargoMovement.from_dict(copies[0]).events[0]
+
+        assert first.event_type is second.event_type
+        assert first.location[0].layer is second.location[0].layer
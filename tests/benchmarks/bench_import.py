@@ -0,0 +1,50 @@
+"""
+Measure the cold import time of `vortexasdk`, and of an endpoint, each in a fresh interpreter.
+
+Run with `python -m tests.benchmarks.bench_import`. Exits with an error when an import is slower than its budget.
+"""
+import subprocess
+import sys
+import time
+
+N_REPEATS = 5
+
+# Statements timed, with the most seconds each may take. Python's own startup time is subtracted.
+BUDGETS = {
+    "import vortexasdk": 0.05,
+    "from vortexasdk import CargoMovements": 0.5,
+    "from vortexasdk.client import VortexaClient": 0.5,
+}
+
+
+def _seconds(statement: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return time.perf_counter() - start
+
+
+def _best(statement: str) -> float:
+    return min(_seconds(statement) for _ in range(N_REPEATS))
+
+
+def bench_import() -> bool:
+    startup = _best("pass")
+    print(
+        f"Cold import times, best of {N_REPEATS}, less {startup:.3f}s of startup"
+    )
+
+    within_budget = True
+    for statement, budget in BUDGETS.items():
+        seconds = _best(statement) - startup
+        over = seconds > budget
+        within_budget = within_budget and not over
+        print(
+            f"  {statement:<45} {seconds:.3f}s {'OVER' if over else 'within'} budget of {budget}s"
+        )
+
+    return within_budget
+
+
+if __name__ == "__main__":
+    if not bench_import():
+        sys.exit(1)
@@ -0,0 +1,55 @@
+"""
+Compare JSON decoders on a page of cargo movements, and `from_dict` against loading with `jsons`.
+
+Run with `python -m tests.benchmarks.bench_json_decoding`.
+"""
+import json
+import timeit
+
+import jsons
+
+from vortexasdk.api import CargoMovement
+from vortexasdk.json_decoding import DECODERS, create_json_decoder
+
+N_RECORDS = 5000
+N_REPEATS = 5
+
+
+def _page() -> bytes:
+    with open("tests/api/examples/cargo_movements.json", "r") as f:
+        records = json.load(f)
+    page = {"total": N_RECORDS, "data": records * N_RECORDS}
+    return json.dumps(page).encode()
+
+
+def _best(func) -> float:
+    return min(timeit.repeat(func, number=1, repeat=N_REPEATS))
+
+
+def bench_decoders(content: bytes) -> None:
+    print(f"Decoding a page of {N_RECORDS} cargo movements")
+    for name in DECODERS:
+        try:
+            decode = create_json_decoder(name)
+        except ImportError:
+            print(f"  {name:<10} not installed")
+            continue
+        print(f"  {name:<10} {_best(lambda: decode(content)):.3f}s")
+
+
+def bench_from_dict(records) -> None:
+    print(f"CargoMovement.from_dict on {len(records)} cargo movements")
+    before = _best(
+        lambda: [jsons.loads(jsons.dumps(r), CargoMovement) for r in records]
+    )
+    loaded = _best(lambda: [jsons.load(r, CargoMovement) for r in records])
+    after = _best(lambda: [CargoMovement.from_dict(r) for r in records])
+    print(f"  jsons.loads(jsons.dumps(d)) {before:.3f}s")
+    print(f"  jsons.load(d)               {loaded:.3f}s")
+    print(f"  from_dict, compiled decoder {after:.3f}s")
+
+
+if __name__ == "__main__":
+    content = _page()
+    bench_decoders(content)
+    bench_from_dict(json.loads(content)["data"][:500])
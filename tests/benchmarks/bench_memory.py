@@ -0,0 +1,44 @@
+"""
+Measure the memory held by 10k cargo and vessel movements, as raw records and converted to dataclasses.
+
+Run with `python -m tests.benchmarks.bench_memory`.
+"""
+import gc
+import json
+import tracemalloc
+
+from vortexasdk.api import CargoMovement, VesselMovement
+
+N_RECORDS = 10000
+
+
+def _records(name: str):
+    with open(f"tests/api/examples/{name}.json", "r") as f:
+        content = f.read()
+    n = len(json.loads(content))
+    # Decode each record from its own copy of the file, so records don't share strings, like records from the API
+    return [json.loads(content)[i % n] for i in range(N_RECORDS)]
+
+
+def _allocated(func) -> int:
+    gc.collect()
+    tracemalloc.start()
+    held = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def bench_memory(name: str, cls) -> None:
+    print(f"Memory held by {N_RECORDS} {name}")
+    raw = _allocated(lambda: _records(name))
+    # Raw records are released once converted, only the strings the dataclasses reference are kept
+    converted = _allocated(lambda: [cls.from_dict(r) for r in _records(name)])
+    print(f"  raw records  {raw / 1e6:.1f} MB")
+    print(f"  {cls.__name__:<12} {converted / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    bench_memory("cargo_movements", CargoMovement)
+    bench_memory("vessel_movements", VesselMovement)
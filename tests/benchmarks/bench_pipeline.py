@@ -0,0 +1,204 @@
+"""
+Benchmark each stage of a movements search: fetching pages, decoding to dataclasses, flattening, and DataFrames.
+
+Each stage runs in its own process, on synthetic records (see `synthetic_data`), and reports its throughput and
+the process' peak resident memory. Imports, the mock server and the client are set up before timing, and each
+stage runs once untimed first, so the timings measure the warm stage alone. Searches are served by a local mock server (see `mock_server`).
+
+Run with `python -m tests.benchmarks.bench_pipeline`, optionally with `--sizes 10000 100000 1000000` and
+`--output results.json` to keep the measurements of a release.
+"""
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List
+
+import pandas  # noqa: F401 - imported up front, so converting to DataFrames doesn't time the import
+
+from tests.benchmarks.mock_server import MockSearchServer
+from tests.benchmarks.synthetic_data import SyntheticRecords
+from tests.mock_client import API_KEY
+from vortexasdk.api import CargoMovement, VesselMovement
+from vortexasdk.api.entity_flattening import (
+    convert_cargo_movement_to_flat_dict,
+    convert_vessel_movement_to_flat_dict,
+)
+from vortexasdk.client import VortexaClient
+from vortexasdk.endpoints.cargo_movements_result import CargoMovementsResult
+from vortexasdk.endpoints.endpoints import (
+    CARGO_MOVEMENTS_RESOURCE,
+    VESSEL_MOVEMENTS_RESOURCE,
+)
+from vortexasdk.endpoints.vessel_movements_result import VesselMovementsResult
+from vortexasdk.version import __version__
+
+DEFAULT_SIZES = (int(1e4), int(1e5))
+
+_PAGE_SIZE = 500
+
+DATASETS = {
+    "cargo_movements": {
+        "resource": CARGO_MOVEMENTS_RESOURCE,
+        "dataclass": CargoMovement,
+        "flatten": convert_cargo_movement_to_flat_dict,
+        "result": CargoMovementsResult,
+    },
+    "vessel_movements": {
+        "resource": VESSEL_MOVEMENTS_RESOURCE,
+        "dataclass": VesselMovement,
+        "flatten": convert_vessel_movement_to_flat_dict,
+        "result": VesselMovementsResult,
+    },
+}
+
+
+@contextmanager
+def _search(dataset: Dict, records: SyntheticRecords) -> Iterator[Callable]:
+    with MockSearchServer(records), VortexaClient(api_key=API_KEY) as client:
+        yield lambda: client.search(dataset["resource"], size=_PAGE_SIZE)
+
+
+@contextmanager
+def _from_dict(dataset: Dict, records: SyntheticRecords) -> Iterator[Callable]:
+    raw = records.records()
+    yield lambda: [dataset["dataclass"].from_dict(r) for r in raw]
+
+
+@contextmanager
+def _flatten(dataset: Dict, records: SyntheticRecords) -> Iterator[Callable]:
+    raw = records.records()
+    yield lambda: [dataset["flatten"](r) for r in raw]
+
+
+@contextmanager
+def _to_df(dataset: Dict, records: SyntheticRecords) -> Iterator[Callable]:
+    result = dataset["result"](records.records())
+    yield lambda: result.to_df()
+
+
+@contextmanager
+def _to_df_all(dataset: Dict, records: SyntheticRecords) -> Iterator[Callable]:
+    result = dataset["result"](records.records())
+    yield lambda: result.to_df(columns="all")
+
+
+# Each stage prepares its input and tears it down, untimed, and yields the function timed.
+STAGES = {
+    "search": _search,
+    "from_dict": _from_dict,
+    "flatten": _flatten,
+    "to_df": _to_df,
+    "to_df_all": _to_df_all,
+}
+
+
+def _peak_rss_mb() -> float:
+    # Include the processes converting records in a pool, see `result_conversions.map_records`
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # Kilobytes on Linux, bytes on macOS
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def run_stage(stage: str, name: str, n_records: int) -> Dict:
+    """Run a stage on `n_records` synthetic records of the `name` dataset, in the current process."""
+    with STAGES[stage](
+        DATASETS[name], SyntheticRecords(name, n_records)
+    ) as run:
+        # Warm up, untimed, so lazy imports and first-call setup aren't measured
+        run()
+
+        start = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - start
+
+    return {
+        "stage": stage,
+        "dataset": name,
+        "records": n_records,
+        "seconds": round(seconds, 3),
+        "records_per_second": round(n_records / seconds),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def bench_pipeline(sizes: List[int], stages: List[str]) -> List[Dict]:
+    results = []
+    print(
+        f"{'dataset':<17} {'records':>9} {'stage':<10} {'seconds':>8} {'records/s':>10} {'peak RSS':>10}"
+    )
+    for name in DATASETS:
+        for n_records in sizes:
+            for stage in stages:
+                # A fresh process per stage, so each stage's peak memory is its own
+                output = subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "tests.benchmarks.bench_pipeline",
+                        "--run-stage",
+                        stage,
+                        name,
+                        str(n_records),
+                    ],
+                    check=True,
+                    stdout=subprocess.PIPE,
+                    universal_newlines=True,
+                ).stdout
+                result = json.loads(output.splitlines()[-1])
+                results.append(result)
+                print(
+                    f"{name:<17} {n_records:>9} {stage:<10} {result['seconds']:>8.3f} "
+                    f"{result['records_per_second']:>10} {result['peak_rss_mb']:>7.1f} MB"
+                )
+
+    return results
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES)
+    )
+    parser.add_argument(
+        "--stages", nargs="+", choices=list(STAGES), default=list(STAGES)
+    )
+    parser.add_argument(
+        "--output", help="Save the measurements to this JSON file"
+    )
+    parser.add_argument(
+        "--run-stage",
+        nargs=3,
+        metavar=("STAGE", "DATASET", "RECORDS"),
+        help=argparse.SUPPRESS,
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+
+    if args.run_stage:
+        stage, name, n_records = args.run_stage
+        print(json.dumps(run_stage(stage, name, int(n_records))))
+        sys.exit(0)
+
+    measurements = bench_pipeline(args.sizes, args.stages)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "version": __version__,
+                    "python": platform.python_version(),
+                    "results": measurements,
+                },
+                f,
+                indent=2,
+            )
@@ -0,0 +1,101 @@
+"""
+A local HTTP server mimicking the pagination of the search endpoints, e.g. `/cargo-movements/search`.
+
+Each POST to a path ending with `/search` is answered with the page of synthetic records at the payload's
+`offset` and `size`, and the `total` number of records. Other filters are ignored.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from tests.benchmarks.synthetic_data import SyntheticRecords
+
+
+class _SearchHandler(BaseHTTPRequestHandler):
+    # Keep connections alive, like the API, so the client's connection pool is exercised
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        if not self.path.split("?")[0].endswith("/search"):
+            self._respond(404, b'{"message": "Not Found"}')
+            return
+
+        payload = json.loads(body or b"{}")
+        self.server.requests += 1
+        self._respond(
+            200,
+            self.server.records.page(
+                payload.get("offset", 0), payload.get("size", 1000)
+            ),
+        )
+
+    def _respond(self, status: int, content: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockSearchServer:
+    """
+    Serve `records` on a free local port, while the context is entered.
+
+    Requests sent by `VortexaClient` are routed to the server, in place of the API.
+
+    # Example
+
+    ```python
+    >>> from tests.mock_client import API_KEY
+    >>> from vortexasdk.client import VortexaClient
+    >>> from vortexasdk.endpoints.endpoints import CARGO_MOVEMENTS_RESOURCE
+    >>> with MockSearchServer(SyntheticRecords("cargo_movements", 1000)) as server: # doctest: +SKIP
+    ...     records = VortexaClient(api_key=API_KEY).search(CARGO_MOVEMENTS_RESOURCE, size=500)
+    >>> len(records) # doctest: +SKIP
+    1000
+
+    ```
+    """
+
+    def __init__(self, records: SyntheticRecords):
+        self.records = records
+        self._server = None
+        self._thread = None
+        self._api_url = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> int:
+        """The number of search requests answered."""
+        return self._server.requests
+
+    def __enter__(self) -> "MockSearchServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _SearchHandler)
+        self._server.daemon_threads = True
+        self._server.records = self.records
+        self._server.requests = 0
+
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+        self._api_url = patch("vortexasdk.client.API_URL", self.url)
+        self._api_url.start()
+        return self
+
+    def __exit__(self, *args):
+        self._api_url.stop()
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
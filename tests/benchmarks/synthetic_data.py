@@ -0,0 +1,74 @@
+"""
+Synthetic cargo and vessel movements, scaled up from the example records in `tests/api/examples`.
+
+Record `i` is a copy of an example record with its own 64 character hex ID, so records survive de-duplication
+on their movement ID. Records are encoded on demand, a page at a time, so millions of records can be served
+without holding them all in memory.
+"""
+import json
+from typing import Dict, List
+
+# The field holding each dataset's record ID.
+ID_KEYS = {
+    "cargo_movements": "cargo_movement_id",
+    "vessel_movements": "vessel_movement_id",
+}
+
+_PLACEHOLDER = "__SYNTHETIC_ID__"
+
+
+class SyntheticRecords:
+    """
+    `n_records` synthetic records of the `name` dataset, either `cargo_movements` or `vessel_movements`.
+
+    # Example
+
+    ```python
+    >>> records = SyntheticRecords("cargo_movements", 100000)
+    >>> page = records.page(offset=0, size=500)
+    >>> len(json.loads(page)["data"])
+    500
+
+    ```
+    """
+
+    def __init__(self, name: str, n_records: int):
+        self.name = name
+        self.n_records = n_records
+
+        with open(f"tests/api/examples/{name}.json", "r") as f:
+            templates = json.load(f)
+
+        self._templates = []
+        for template in templates:
+            template[ID_KEYS[name]] = _PLACEHOLDER
+            prefix, suffix = json.dumps(template).split(
+                json.dumps(_PLACEHOLDER)
+            )
+            self._templates.append((prefix, suffix))
+
+    def __len__(self) -> int:
+        return self.n_records
+
+    def encode(self, offset: int = 0, size: int = None) -> str:
+        """Encode the records from `offset`, at most `size` of them, as a JSON array."""
+        end = (
+            self.n_records
+            if size is None
+            else min(offset + size, self.n_records)
+        )
+        return (
+            "[" + ",".join(self._encode(i) for i in range(offset, end)) + "]"
+        )
+
+    def page(self, offset: int, size: int) -> bytes:
+        """A search response body, holding the page of `size` records from `offset`, and the total."""
+        return f'{{"total": {self.n_records}, "data": {self.encode(offset, size)}}}'.encode()
+
+    def records(self) -> List[Dict]:
+        """All the records, decoded from JSON like records loaded from the API, so they don't share strings."""
+        return json.loads(self.encode())
+
+    def _encode(self, i: int) -> str:
+        prefix, suffix = self._templates[i % len(self._templates)]
+        return f'{prefix}"{i:064x}"{suffix}'
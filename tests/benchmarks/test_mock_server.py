@@ -0,0 +1,38 @@
+import json
+from unittest import TestCase
+
+from tests.benchmarks.mock_server import MockSearchServer
+from tests.benchmarks.synthetic_data import ID_KEYS, SyntheticRecords
+from tests.mock_client import API_KEY
+from vortexasdk.client import VortexaClient
+from vortexasdk.endpoints.endpoints import CARGO_MOVEMENTS_RESOURCE
+
+
+class TestSyntheticRecords(TestCase):
+    def test_records_have_unique_ids(self):
+        records = SyntheticRecords("vessel_movements", 25).records()
+
+        ids = {r[ID_KEYS["vessel_movements"]] for r in records}
+        assert len(ids) == 25
+
+    def test_page(self):
+        page = json.loads(SyntheticRecords("cargo_movements", 25).page(20, 10))
+
+        assert page["total"] == 25
+        assert len(page["data"]) == 5
+        assert page["data"][0]["cargo_movement_id"] == f"{20:064x}"
+
+
+class TestMockSearchServer(TestCase):
+    def test_client_search(self):
+        records = SyntheticRecords("cargo_movements", 1200)
+
+        with MockSearchServer(records) as server, VortexaClient(
+            api_key=API_KEY
+        ) as client:
+            result = client.search(CARGO_MOVEMENTS_RESOURCE, size=500)
+
+        assert len(result) == 1200
+        assert len({r["cargo_movement_id"] for r in result}) == 1200
+        # One probe, then three pages
+        assert server.requests == 4
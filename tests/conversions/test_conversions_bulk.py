@@ -0,0 +1,142 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from tests.mock_client import (
+    CountingMockVortexaClient,
+    example_corporations,
+    example_vessels,
+)
+from vortexasdk.client import set_client
+from vortexasdk.conversions import (
+    convert_to_corporation_ids,
+    convert_to_corporation_ids_bulk,
+    convert_to_vessel_ids,
+    convert_to_vessel_ids_bulk,
+)
+from vortexasdk.conversions import conversions
+
+
+class TestConvertBulk(TestCase):
+    def setUp(self) -> None:
+        conversions.__resolved_ids__.clear()
+        self.client = CountingMockVortexaClient()
+        set_client(self.client)
+
+    def test_names_are_resolved_in_a_single_search(self):
+        result = convert_to_corporation_ids_bulk(
+            ["3J", "5xjapanese", "3J", "Unknown"]
+        )
+
+        assert result == {
+            "3J": [example_corporations[0]["id"]],
+            "5xjapanese": [example_corporations[1]["id"]],
+            "Unknown": [],
+        }
+        assert len(self.client.searches) == 1
+        assert self.client.searches[0]["term"] == [
+            "3J",
+            "5xjapanese",
+            "Unknown",
+        ]
+
+    def test_resolved_names_are_memoised(self):
+        convert_to_corporation_ids_bulk(["3J"])
+        convert_to_corporation_ids_bulk(["3J", "5XJAPANESE"])
+
+        assert [s["term"] for s in self.client.searches] == [
+            ["3J"],
+            ["5XJAPANESE"],
+        ]
+
+    def test_ids_are_not_searched(self):
+        id = example_corporations[0]["id"]
+
+        assert convert_to_corporation_ids_bulk([id]) == {id: [id]}
+        assert self.client.searches == []
+
+    def test_terms_are_searched_in_batches(self):
+        with patch.object(conversions, "_MAX_TERMS_PER_SEARCH", 2):
+            convert_to_corporation_ids_bulk(["a", "b", "c", "d", "e"])
+
+        assert [s["term"] for s in self.client.searches] == [
+            ["a", "b"],
+            ["c", "d"],
+            ["e"],
+        ]
+
+    def test_missing_names_are_logged(self):
+        with self.assertLogs(conversions.logger, "WARNING") as logs:
+            convert_to_corporation_ids_bulk(["Unknown"])
+
+        assert "Unknown" in logs.output[0]
+
+    def test_convert_to_ids_returns_ids_given_then_every_id_found(self):
+        id = "f00e3068faf65af1345067f11dc6723b8da324a6f33c000118fccd81947deb4e"
+
+        result = convert_to_corporation_ids(["japan", id])
+
+        assert result == [id] + [c["id"] for c in example_corporations]
+        assert self.client.searches[0]["term"] == ["japan"]
+
+    def test_convert_to_ids_memoises_searches(self):
+        convert_to_corporation_ids(["japan"])
+        convert_to_corporation_ids(["japan"])
+
+        assert len(self.client.searches) == 1
+
+    def test_vessel_mmsis_and_classes(self):
+        result = convert_to_vessel_ids_bulk([413771781, "tiny_tanker"])
+
+        assert result == {
+            413771781: [example_vessels[1]["id"]],
+            "tiny_tanker": [v["id"] for v in example_vessels],
+        }
+
+    def test_convert_to_vessel_ids_removes_duplicates(self):
+        result = convert_to_vessel_ids([900403269, "tiny_tanker"])
+
+        assert result == [v["id"] for v in example_vessels]
+
+    def test_convert_to_vessel_ids_returns_ids_given_first(self):
+        id = example_vessels[1]["id"]
+
+        result = convert_to_vessel_ids(["tiny_tanker", id])
+
+        assert result == [id] + [v["id"] for v in example_vessels]
+
+    def test_set_client_forgets_resolved_names(self):
+        convert_to_corporation_ids_bulk(["3J"])
+        set_client(self.client)
+        convert_to_corporation_ids_bulk(["3J"])
+
+        assert len(self.client.searches) == 2
+
+    def test_resolved_names_expire(self):
+        with patch.object(conversions.__resolved_ids__, "ttl", 0):
+            convert_to_corporation_ids_bulk(["3J"])
+            convert_to_corporation_ids_bulk(["3J"])
+
+        assert len(self.client.searches) == 2
+
+
+class TestResolvedIds(TestCase):
+    def test_least_recently_used_are_evicted(self):
+        resolved = conversions.ResolvedIds(max_entries=2)
+        resolved.set(("/r", "term", "a", True), ["1"])
+        resolved.set(("/r", "term", "b", True), ["2"])
+        resolved.get(("/r", "term", "a", True))
+        resolved.set(("/r", "term", "c", True), ["3"])
+
+        assert len(resolved) == 2
+        assert resolved.get(("/r", "term", "a", True)) == ["1"]
+        assert resolved.get(("/r", "term", "b", True)) is None
+
+    def test_clear_resource(self):
+        resolved = conversions.ResolvedIds()
+        resolved.set(("/r", "term", "a", True), ["1"])
+        resolved.set(("/s", "term", "a", True), ["2"])
+
+        resolved.clear("/r")
+
+        assert resolved.get(("/r", "term", "a", True)) is None
+        assert resolved.get(("/s", "term", "a", True)) == ["2"]
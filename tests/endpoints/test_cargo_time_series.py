@@ -1,5 +1,7 @@
 from datetime import datetime
 
+import pandas as pd
+
 from tests.testcases import TestCaseUsingMockAPI
 from vortexasdk.endpoints.cargo_timeseries import CargoTimeSeries
 
@@ -20,3 +22,13 @@ class TestCargoTimeSeries(TestCaseUsingMockAPI):
         )
 
         assert len(df) == 3
+
+    def test_to_df_parses_keys(self):
+        df = (
+            CargoTimeSeries()
+            .search(filter_activity="loading_state")
+            .to_df(parse_timestamps=True)
+        )
+
+        assert str(df["key"].dtype) == "datetime64[ns, UTC]"
+        assert df["key"][0] == pd.Timestamp("2017-07-11T13:42:37Z")
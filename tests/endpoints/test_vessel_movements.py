@@ -0,0 +1,35 @@
+import pandas as pd
+
+from tests.testcases import TestCaseUsingMockAPI
+from vortexasdk.endpoints.vessel_movements import VesselMovements
+from vortexasdk.endpoints.vessel_movements_result import DEFAULT_COLUMNS
+
+
+class TestVesselMovements(TestCaseUsingMockAPI):
+    def test_to_df_default_columns(self):
+        df = VesselMovements().search().to_df()
+
+        assert list(df.columns) == DEFAULT_COLUMNS
+        assert df["vessel.name"].tolist() == ["17 FEBRUARY"]
+
+    def test_to_df_all_columns(self):
+        df = VesselMovements().search().to_df(columns="all")
+
+        assert df["vessel.corporate_entities.charterer.label"].tolist() == [
+            "VITOL"
+        ]
+
+    def test_to_df_parses_timestamps(self):
+        df = VesselMovements().search().to_df(parse_timestamps=True)
+
+        assert str(df["origin.start_timestamp"].dtype) == "datetime64[ns, UTC]"
+        assert df["origin.start_timestamp"].tolist() == [
+            pd.Timestamp("2017-11-19T06:59:05", tz="UTC")
+        ]
+
+    def test_to_df_keeps_timestamp_strings_by_default(self):
+        df = VesselMovements().search().to_df()
+
+        assert df["origin.start_timestamp"].tolist() == [
+            "2017-11-19T06:59:05+0000"
+        ]
@@ -2,6 +2,7 @@ from typing import List, Dict
 
 import jsons
 
+from tests.mock_session import MockResponse, MockSession
 from vortexasdk.api import ID
 from vortexasdk.abstract_client import AbstractVortexaClient
 from vortexasdk.endpoints.endpoints import (
@@ -14,6 +15,9 @@ from vortexasdk.endpoints.endpoints import (
 )
 
 
+API_KEY = "123e4567-e89b-12d3-a456-426614174000"
+
+
 def _read(example_file) -> List[Dict]:
     with open(f"tests/api/examples/{example_file}", "r") as f:
         return jsons.loads(f.read(), List)
@@ -44,3 +48,47 @@ class MockVortexaClient(AbstractVortexaClient):
 
     def search(self, resource: str, **data) -> List:
         return MockVortexaClient._results[resource]
+
+
+class CountingMockVortexaClient(MockVortexaClient):
+    """Records the payload of each search, and the ID of each reference lookup."""
+
+    def __init__(self):
+        self.searches = []
+        self.references = []
+
+    @property
+    def n_calls(self) -> int:
+        return len(self.searches) + len(self.references)
+
+    def get_reference(self, resource: str, id: ID) -> List[Dict]:
+        self.references.append(id)
+        return super().get_reference(resource, id)
+
+    def search(self, resource: str, **data) -> List:
+        self.searches.append(data)
+        return super().search(resource, **data)
+
+
+class FailingMockSession(MockSession):
+    """
+    Fails the first `n_failures` requests of the page at `offset`, with `failure`.
+
+    `failure` is either a status code or an exception raised. With `n_failures=None`, every request fails.
+    """
+
+    def __init__(self, records, offset, n_failures=None, failure=500):
+        super().__init__(records)
+        self.offset = offset
+        self.n_failures = n_failures
+        self.failure = failure
+
+    def post(self, url, json=None, **kwargs):
+        if json["offset"] == self.offset and self.n_failures != 0:
+            if self.n_failures is not None:
+                self.n_failures -= 1
+            self.payloads.append(json)
+            if isinstance(self.failure, Exception):
+                raise self.failure
+            return MockResponse({}, status_code=self.failure)
+        return super().post(url, json=json, **kwargs)
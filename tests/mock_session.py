@@ -0,0 +1,52 @@
+import json
+from typing import Dict, List
+
+
+class MockResponse:
+    """Minimal stand-in for `requests.Response`."""
+
+    def __init__(self, body: Dict, status_code: int = 200):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.reason = "OK" if self.ok else "Error"
+        self.content = json.dumps(body).encode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class MockSession:
+    """
+    Serves `records` page by page, honouring the `offset` and `size` of each POST payload.
+
+    Records with a `timestamp` are filtered on the payload's `filter_time_min` and `filter_time_max`, inclusively.
+    """
+
+    def __init__(self, records: List[Dict]):
+        self.records = records
+        self.payloads: List[Dict] = []
+        self.closed = False
+
+    def post(self, url, json=None, **kwargs) -> MockResponse:
+        self.payloads.append(json)
+        offset, size = json["offset"], json["size"]
+        records = [r for r in self.records if _in_time_window(r, json)]
+        return MockResponse(
+            {"total": len(records), "data": records[offset : offset + size]}
+        )
+
+    def get(self, url, **kwargs) -> MockResponse:
+        return MockResponse({"data": self.records[:1]})
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _in_time_window(record: Dict, payload: Dict) -> bool:
+    if "timestamp" not in record or "filter_time_min" not in payload:
+        return True
+    return (
+        payload["filter_time_min"]
+        <= record["timestamp"]
+        <= payload["filter_time_max"]
+    )
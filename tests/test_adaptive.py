@@ -0,0 +1,149 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests.exceptions import ConnectionError
+
+from tests.mock_client import API_KEY, FailingMockSession
+from tests.mock_session import MockResponse, MockSession
+from vortexasdk.adaptive import AdaptiveController
+from vortexasdk.client import VortexaClient
+from vortexasdk.exceptions import PartialResultException
+
+
+class ThrottlingMockSession(MockSession):
+    """Responds with a 429 to the first request of each page."""
+
+    def __init__(self, records):
+        super().__init__(records)
+        self.throttled = set()
+
+    def post(self, url, json=None, **kwargs):
+        offset = json["offset"]
+        if json["size"] > 1 and offset not in self.throttled:
+            self.throttled.add(offset)
+            self.payloads.append(json)
+            return MockResponse({}, status_code=429)
+        return super().post(url, json=json, **kwargs)
+
+
+class TestAdaptiveController(TestCase):
+    def test_concurrency_increases_after_each_round(self):
+        controller = AdaptiveController(
+            max_concurrency=4, initial_concurrency=2
+        )
+
+        for _ in range(2):
+            controller.record(100, 1000, 0.1, 200)
+
+        assert controller.concurrency == 3
+
+    def test_concurrency_is_capped(self):
+        controller = AdaptiveController(
+            max_concurrency=2, initial_concurrency=2
+        )
+
+        for _ in range(10):
+            controller.record(100, 1000, 0.1, 200)
+
+        assert controller.concurrency == 2
+
+    def test_throttling_halves_concurrency_and_page_size(self):
+        controller = AdaptiveController(
+            max_concurrency=16, initial_concurrency=8, max_page_size=1000
+        )
+
+        controller.record(0, 10, 0.1, 429)
+
+        assert controller.concurrency == 4
+        assert controller.page_size == 500
+        assert controller.metrics()["throttled"] == 1
+
+    def test_slow_pages_are_shrunk_and_fast_pages_grown(self):
+        controller = AdaptiveController(
+            max_concurrency=1,
+            initial_concurrency=1,
+            max_page_size=1000,
+            min_page_size=100,
+            target_latency=1,
+        )
+
+        controller.record(1000, 1000, 5, 200)
+        assert controller.page_size == 500
+
+        controller.record(500, 1000, 0.1, 200)
+        assert controller.page_size == 1000
+
+    def test_page_size_is_capped_by_endpoint(self):
+        controller = AdaptiveController(max_page_size=1000)
+
+        assert controller.page_size_for(500) == 500
+
+    def test_metrics(self):
+        controller = AdaptiveController()
+        controller.record(100, 1000, 0.1, 200)
+        controller.record(0, 10, 0.1, 503)
+
+        metrics = controller.metrics()
+
+        assert metrics["pages"] == 1
+        assert metrics["records"] == 100
+        assert metrics["bytes"] == 1010
+        assert metrics["server_errors"] == 1
+
+
+class TestAdaptiveClient(TestCase):
+    records = [{"id": i} for i in range(95)]
+
+    def test_search_loads_all_records_in_order(self):
+        client = VortexaClient(api_key=API_KEY, adaptive=True)
+        client._session = MockSession(self.records)
+
+        actual = client.search("/resource", size=10)
+
+        assert actual == self.records
+        assert client.controller.metrics()["records"] == len(self.records)
+
+    def test_throttled_pages_are_retried_with_smaller_pages(self):
+        client = VortexaClient(api_key=API_KEY, adaptive=True)
+        client.controller.backoff = lambda attempt: 0
+        client._session = ThrottlingMockSession(self.records)
+
+        actual = client.search("/resource", size=10)
+
+        assert actual == self.records
+        assert client.controller.metrics()["throttled"] > 0
+        assert client.controller.concurrency < VortexaClient._N_THREADS
+
+    @patch("vortexasdk.client._PAGE_BACKOFF_FACTOR", 0)
+    def test_connection_errors_are_retried_and_reported(self):
+        client = VortexaClient(api_key=API_KEY, adaptive=True)
+        client._session = FailingMockSession(
+            self.records, 20, 2, ConnectionError("Connection reset by peer")
+        )
+
+        actual = client.search("/resource", size=10)
+
+        assert actual == self.records
+        assert client.controller.metrics()["failed_requests"] == 2
+
+    @patch("vortexasdk.client._PAGE_BACKOFF_FACTOR", 0)
+    def test_connection_errors_are_retried_within_page_retries(self):
+        client = VortexaClient(api_key=API_KEY, adaptive=True, page_retries=1)
+        client._session = FailingMockSession(
+            self.records, 20, None, ConnectionError("Connection reset by peer")
+        )
+
+        with self.assertRaises(PartialResultException):
+            client.search("/resource", size=10)
+
+        assert [p["offset"] for p in client._session.payloads].count(20) == 2
+
+    def test_server_errors_are_retried_within_page_retries(self):
+        client = VortexaClient(api_key=API_KEY, adaptive=True, page_retries=1)
+        client.controller.backoff = lambda attempt: 0
+        client._session = FailingMockSession(self.records, 20, None, 503)
+
+        with self.assertRaises(PartialResultException):
+            client.search("/resource", size=10)
+
+        assert [p["offset"] for p in client._session.payloads].count(20) == 2
@@ -0,0 +1,88 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from tests.mock_client import _read, example_time_series, example_vessels
+from vortexasdk.arrow_conversions import write_parquet_pages
+from vortexasdk.endpoints.cargo_movements_result import CargoMovementsResult
+from vortexasdk.endpoints.timeseries_result import TimeSeriesResult
+from vortexasdk.endpoints.vessels_result import VesselsResult
+
+
+class TestArrowConversions(TestCase):
+    cargo_movements = _read("cargo_movements.json")
+
+    def test_to_arrow_converts_known_types(self):
+        table = CargoMovementsResult(self.cargo_movements).to_arrow()
+
+        schema = table.schema
+        assert schema.field("quantity").type == pa.int64()
+        assert schema.field(
+            "events.cargo_port_load_event.0.end_timestamp"
+        ).type == pa.timestamp("ms", tz="UTC")
+        assert pa.types.is_dictionary(schema.field("product.grade.label").type)
+        assert table.column("vessels.0.name").to_pylist() == [
+            "JOHANN ESSBERGER"
+        ]
+
+    def test_time_series_keys_are_timestamps(self):
+        table = TimeSeriesResult(example_time_series).to_arrow()
+
+        assert table.schema.field("key").type == pa.timestamp("ms", tz="UTC")
+        assert table.schema.field("value").type == pa.float64()
+
+    def test_to_arrow_stores_missing_values_as_nulls(self):
+        table = CargoMovementsResult(self.cargo_movements).to_arrow()
+
+        assert table.column(
+            "events.cargo_port_unload_event.0.start_timestamp"
+        ).to_pylist() == [None]
+
+    def test_reference_result_to_parquet(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "vessels.parquet")
+
+            VesselsResult(example_vessels).to_parquet(path)
+
+            table = pq.read_table(path)
+            assert table.column_names == ["id", "name", "imo", "vessel_class"]
+            assert table.num_rows == len(example_vessels)
+
+    def test_write_parquet_pages_writes_one_row_group_per_page(self):
+        pages = [self.cargo_movements * 3, [], self.cargo_movements * 2]
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "cargo_movements.parquet")
+
+            written = write_parquet_pages(
+                pages, path, lambda p: CargoMovementsResult(p).to_arrow()
+            )
+
+            parquet_file = pq.ParquetFile(path)
+            assert written == 5
+            assert parquet_file.metadata.num_rows == 5
+            assert parquet_file.num_row_groups == 2
+
+    def test_write_parquet_pages_merges_schemas_of_pages(self):
+        extended = dict(self.cargo_movements[0], extra_label="Crude")
+        pages = [self.cargo_movements, [extended]]
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "cargo_movements.parquet")
+
+            written = write_parquet_pages(
+                pages,
+                path,
+                lambda p: CargoMovementsResult(p).to_arrow(columns="all"),
+            )
+
+            table = pq.read_table(path)
+            assert written == 2
+            assert table.column("extra_label").to_pylist() == [None, "Crude"]
+            assert (
+                table.column("quantity").to_pylist()
+                == [self.cargo_movements[0]["quantity"]] * 2
+            )
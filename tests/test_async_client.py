@@ -0,0 +1,252 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import Dict, List
+from unittest import TestCase
+
+from tests.mock_client import API_KEY
+from vortexasdk import CargoMovements, Geographies
+from vortexasdk.async_client import AsyncVortexaClient, set_async_client
+from vortexasdk.endpoints.cargo_movements_result import CargoMovementsResult
+from vortexasdk.endpoints.geographies_result import GeographyResult
+from vortexasdk.exceptions import PartialResultException
+from vortexasdk.operations import Reference, Search
+
+
+class MockAsyncResponse:
+    def __init__(self, body: Dict, status: int = 200):
+        self.status = status
+        self.reason = "OK"
+        self._body = body
+
+    async def json(self, content_type=None):
+        return self._body
+
+    async def read(self):
+        return json.dumps(self._body).encode()
+
+    async def text(self):
+        return json.dumps(self._body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class MockAsyncSession:
+    """Serves `records`, and like `aiohttp.ClientSession`, only on the event loop it was created on."""
+
+    def __init__(self, records: List[Dict]):
+        self.records = records
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+        self.loop = asyncio.get_running_loop()
+        self.payloads = []
+
+    def request(self, method, url, json=None):
+        if asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError("Event loop is closed")
+        self.payloads.append(json)
+        return self._respond(method, json)
+
+    def _respond(self, method, payload):
+        session = self
+
+        class _Context:
+            async def __aenter__(self):
+                session.in_flight += 1
+                session.max_in_flight = max(
+                    session.max_in_flight, session.in_flight
+                )
+                await asyncio.sleep(0)
+                session.in_flight -= 1
+
+                if method == "GET":
+                    return MockAsyncResponse({"data": session.records[:1]})
+
+                offset, size = payload["offset"], payload["size"]
+                return MockAsyncResponse(
+                    {
+                        "total": len(session.records),
+                        "data": session.records[offset : offset + size],
+                    }
+                )
+
+            async def __aexit__(self, *args):
+                pass
+
+        return _Context()
+
+    async def close(self):
+        self.closed = True
+
+
+def _create_client(
+    records, session=MockAsyncSession, **kwargs
+) -> AsyncVortexaClient:
+    client = AsyncVortexaClient(api_key=API_KEY, **kwargs)
+    client.sessions = []
+
+    def create_session():
+        client.sessions.append(session(records))
+        return client.sessions[-1]
+
+    client._create_session = create_session
+    return client
+
+
+class TimingOutSession(MockAsyncSession):
+    """Times out on the first `n_timeouts` requests."""
+
+    def __init__(self, records: List[Dict], n_timeouts: int):
+        super().__init__(records)
+        self.n_timeouts = n_timeouts
+
+    def request(self, method, url, json=None):
+        if self.n_timeouts > 0:
+            self.n_timeouts -= 1
+            raise asyncio.TimeoutError()
+        return super().request(method, url, json)
+
+
+class FailingPageSession(MockAsyncSession):
+    """Fails every request of the page at `offset` with a server error."""
+
+    def __init__(self, records: List[Dict], offset: int):
+        super().__init__(records)
+        self.offset = offset
+
+    def request(self, method, url, json=None):
+        if json is not None and json["offset"] == self.offset:
+            self.payloads.append(json)
+            return MockAsyncResponse({}, status=500)
+        return super().request(method, url, json)
+
+
+class TestAsyncClient(TestCase):
+    def test_search_loads_all_pages(self):
+        records = [{"id": i, "name": str(i)} for i in range(95)]
+        client = _create_client(records)
+
+        actual = asyncio.run(client.search("/resource", size=10))
+
+        assert actual == records
+
+    def test_search_bounds_concurrency(self):
+        records = [{"id": i, "name": str(i)} for i in range(100)]
+        client = _create_client(records, max_concurrency=3)
+
+        asyncio.run(client.search("/resource", size=1))
+
+        assert client.sessions[0].max_in_flight <= 3
+
+    def test_session_is_recreated_on_each_event_loop(self):
+        records = [{"id": i, "name": str(i)} for i in range(25)]
+        client = _create_client(records)
+
+        first = asyncio.run(client.search("/resource", size=10))
+        second = asyncio.run(client.search("/resource", size=10))
+
+        assert first == records
+        assert second == records
+        assert len(client.sessions) == 2
+
+    def test_forked_client_opens_new_session(self):
+        client = _create_client([])
+
+        async def session_after_fork():
+            session = client._get_session()
+            # As if the session had been opened by a parent process
+            client._session_pid = -1
+            return session, client._get_session()
+
+        parent_session, child_session = asyncio.run(session_after_fork())
+
+        assert child_session is not parent_session
+
+    def test_retries_timeouts(self):
+        records = [{"id": i, "name": str(i)} for i in range(5)]
+        client = AsyncVortexaClient(api_key=API_KEY)
+        client._BACKOFF_FACTOR = 0
+        client._create_session = lambda: TimingOutSession(records, 2)
+
+        actual = asyncio.run(client.search("/resource", size=10))
+
+        assert actual == records
+
+    def test_failed_pages_raise_partial_result_within_page_retries(self):
+        records = [{"id": i, "name": str(i)} for i in range(25)]
+        client = _create_client(
+            records,
+            session=lambda r: FailingPageSession(r, 10),
+            page_retries=1,
+        )
+        client._BACKOFF_FACTOR = 0
+
+        with self.assertRaises(PartialResultException) as e:
+            asyncio.run(client.search("/resource", size=10))
+
+        assert e.exception.records == records[:10] + records[20:]
+        assert [f.offset for f in e.exception.failures] == [10]
+        assert [p["offset"] for p in client.sessions[0].payloads].count(
+            10
+        ) == 2
+
+    def test_operations_use_global_async_client(self):
+        records = [{"id": "a", "name": "China"}, {"id": "b", "name": "Chin"}]
+        set_async_client(_create_client(records))
+
+        searched = asyncio.run(
+            Search("/resource").search_async(
+                exact_term_match=True, term=["China"]
+            )
+        )
+        referenced = asyncio.run(Reference("/resource").reference_async("a"))
+
+        assert searched == [{"id": "a", "name": "China"}]
+        assert referenced == {"id": "a", "name": "China"}
+
+    def test_endpoints_build_their_search_payload(self):
+        client = _create_client([{"id": "a"}, {"id": "b"}])
+        set_async_client(client)
+
+        result = asyncio.run(
+            CargoMovements().search_async(
+                filter_activity="loading_state",
+                filter_time_min=datetime(2019, 1, 1),
+                exclude_origins="origin-id",
+            )
+        )
+
+        payload = client.sessions[0].payloads[-1]
+        assert isinstance(result, CargoMovementsResult)
+        assert list(result) == [{"id": "a"}, {"id": "b"}]
+        assert payload["filter_time_min"] == "2019-01-01T00:00:00.000Z"
+        assert payload["exclude"]["filter_origins"] == ["origin-id"]
+        assert payload["size"] == CargoMovements._MAX_PAGE_RESULT_SIZE
+
+    def test_reference_endpoints_filter_exact_matches(self):
+        records = [{"id": "a", "name": "China"}, {"id": "b", "name": "Chin"}]
+        client = _create_client(records)
+        set_async_client(client)
+
+        result = asyncio.run(
+            Geographies().search_async("China", exact_term_match=True)
+        )
+
+        assert isinstance(result, GeographyResult)
+        assert list(result) == [{"id": "a", "name": "China"}]
+        assert client.sessions[0].payloads[0]["term"] == ["China"]
+
+    def test_close_releases_session(self):
+        client = _create_client([])
+
+        async def use_and_close():
+            session = client._get_session()
+            await client.close()
+            return session
+
+        assert asyncio.run(use_and_close()).closed
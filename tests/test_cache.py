@@ -0,0 +1,114 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from tests.mock_client import CountingMockVortexaClient, example_vessels
+from vortexasdk import Vessels
+from vortexasdk.cache import ResponseCache, cache_key, set_cache
+from vortexasdk.client import set_client
+from vortexasdk.endpoints.endpoints import (
+    CARGO_MOVEMENTS_RESOURCE,
+    GEOGRAPHIES_REFERENCE,
+    VESSELS_REFERENCE,
+)
+
+
+class TestResponseCache(TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "responses.sqlite")
+        self.cache = ResponseCache(self.path)
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self.dir.cleanup()
+
+    def test_get_returns_cached_response(self):
+        self.cache.set(VESSELS_REFERENCE, {"term": ["DHT"]}, [{"id": "1"}])
+
+        assert self.cache.get(VESSELS_REFERENCE, {"term": ["DHT"]}) == [
+            {"id": "1"}
+        ]
+        assert self.cache.get(VESSELS_REFERENCE, {"term": ["ABC"]}) is None
+
+    def test_responses_persist_across_instances(self):
+        self.cache.set(VESSELS_REFERENCE, {}, [{"id": "1"}])
+
+        other = ResponseCache(self.path)
+        assert other.get(VESSELS_REFERENCE, {}) == [{"id": "1"}]
+        other.close()
+
+    def test_resources_without_ttl_are_not_cached(self):
+        self.cache.set(CARGO_MOVEMENTS_RESOURCE, {}, [{"id": "1"}])
+
+        assert self.cache.get(CARGO_MOVEMENTS_RESOURCE, {}) is None
+        assert len(self.cache) == 0
+
+    def test_expired_responses_are_not_returned(self):
+        cache = ResponseCache(self.path, ttls={VESSELS_REFERENCE: 0.01})
+        cache.set(VESSELS_REFERENCE, {}, [{"id": "1"}])
+        time.sleep(0.02)
+
+        assert cache.get(VESSELS_REFERENCE, {}) is None
+        cache.close()
+
+    def test_least_recently_used_responses_are_evicted(self):
+        cache = ResponseCache(self.path, max_entries=2)
+        cache.set(VESSELS_REFERENCE, {"term": ["a"]}, ["a"])
+        time.sleep(0.01)
+        cache.set(VESSELS_REFERENCE, {"term": ["b"]}, ["b"])
+        time.sleep(0.01)
+        cache.get(VESSELS_REFERENCE, {"term": ["a"]})
+        time.sleep(0.01)
+        cache.set(VESSELS_REFERENCE, {"term": ["c"]}, ["c"])
+
+        assert len(cache) == 2
+        assert cache.get(VESSELS_REFERENCE, {"term": ["a"]}) == ["a"]
+        assert cache.get(VESSELS_REFERENCE, {"term": ["b"]}) is None
+        cache.close()
+
+    def test_invalidate_resource(self):
+        self.cache.set(VESSELS_REFERENCE, {}, ["vessel"])
+        self.cache.set(GEOGRAPHIES_REFERENCE, {}, ["geography"])
+
+        self.cache.invalidate(VESSELS_REFERENCE)
+
+        assert self.cache.get(VESSELS_REFERENCE, {}) is None
+        assert self.cache.get(GEOGRAPHIES_REFERENCE, {}) == ["geography"]
+
+        self.cache.invalidate()
+        assert len(self.cache) == 0
+
+    def test_cache_key_is_canonical(self):
+        assert cache_key(
+            VESSELS_REFERENCE, {"term": ["a"], "ids": None, "size": 10}
+        ) == cache_key(VESSELS_REFERENCE, {"size": 10, "term": ["a"]})
+
+
+class TestCachedOperations(TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.client = CountingMockVortexaClient()
+        set_client(self.client)
+        set_cache(ResponseCache(os.path.join(self.dir.name, "r.sqlite")))
+
+    def tearDown(self) -> None:
+        set_cache(None)
+        self.dir.cleanup()
+
+    def test_load_all_is_cached(self):
+        first = Vessels().load_all()
+        second = Vessels().load_all()
+
+        assert self.client.n_calls == 1
+        assert len(second) == len(first) == len(example_vessels)
+
+    def test_reference_is_cached(self):
+        id = example_vessels[0]["id"]
+
+        first = Vessels().reference(id)
+        second = Vessels().reference(id)
+
+        assert self.client.n_calls == 1
+        assert first == second == example_vessels[0]
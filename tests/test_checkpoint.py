@@ -0,0 +1,105 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from tests.mock_client import API_KEY, FailingMockSession
+from tests.mock_session import MockSession
+from vortexasdk.checkpoint import Checkpoint
+from vortexasdk.client import VortexaClient
+from vortexasdk.exceptions import MissingPagesException
+
+
+class TestCheckpoint(TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def test_saved_pages_are_loaded_by_a_new_checkpoint(self):
+        checkpoint = Checkpoint(self.dir.name)
+        key = Checkpoint.page_key({"a": 1}, 10)
+        checkpoint.save(key, 10, [{"id": 1}], 100)
+
+        resumed = Checkpoint(self.dir.name)
+
+        assert len(resumed) == 1
+        assert resumed.load(key) == [{"id": 1}]
+        assert resumed.load(Checkpoint.page_key({"a": 1}, 20)) is None
+
+    def test_incomplete_pages_are_not_reused_once_total_changed(self):
+        checkpoint = Checkpoint(self.dir.name)
+        key = Checkpoint.page_key({"a": 1}, 10)
+        checkpoint.save(key, 10, [{"id": 1}], 11)
+
+        assert checkpoint.load(key, 11, 1) == [{"id": 1}]
+        assert checkpoint.load(key, 15, 5) is None
+
+    def test_clear_removes_directory(self):
+        checkpoint = Checkpoint(os.path.join(self.dir.name, "search"))
+        checkpoint.save("key", 0, [])
+
+        checkpoint.clear()
+
+        assert not os.path.exists(checkpoint.directory)
+
+
+class TestCheckpointedClient(TestCase):
+    records = [{"id": i} for i in range(50)]
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def test_search_resumes_from_saved_pages(self):
+        client = VortexaClient(
+            api_key=API_KEY, checkpoint_dir=self.dir.name, page_retries=0
+        )
+        client._session = FailingMockSession(self.records, offset=40)
+
+        self.assertRaises(
+            MissingPagesException, lambda: client.search("/resource", size=10),
+        )
+
+        client._session = MockSession(self.records)
+        actual = client.search("/resource", size=10)
+
+        assert actual == self.records
+        # The probe request, and the single page that failed
+        assert [p["offset"] for p in client._session.payloads] == [0, 40]
+
+    def test_search_resumes_once_more_records_match(self):
+        client = VortexaClient(
+            api_key=API_KEY, checkpoint_dir=self.dir.name, page_retries=0
+        )
+        client._session = FailingMockSession(self.records, offset=40)
+
+        self.assertRaises(
+            MissingPagesException, lambda: client.search("/resource", size=10),
+        )
+
+        # New records are appended, the saved pages still hold the same records
+        records = self.records + [{"id": i} for i in range(50, 55)]
+        client._session = MockSession(records)
+        actual = client.search("/resource", size=10)
+
+        assert actual == records
+        assert [p["offset"] for p in client._session.payloads] == [0, 40, 50]
+
+    def test_checkpoint_is_removed_once_search_completes(self):
+        client = VortexaClient(api_key=API_KEY, checkpoint_dir=self.dir.name)
+        client._session = MockSession(self.records)
+
+        client.search("/resource", size=10)
+
+        assert os.listdir(self.dir.name) == []
+
+    def test_checkpoint_cannot_be_adaptive(self):
+        self.assertRaises(
+            ValueError,
+            lambda: VortexaClient(
+                api_key=API_KEY, checkpoint_dir=self.dir.name, adaptive=True
+            ),
+        )
@@ -1,6 +1,25 @@
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.pool import ThreadPool
 from unittest import TestCase
+from unittest.mock import patch
 
-from vortexasdk.client import VortexaClient, verify_api_key_format
+from requests.exceptions import ConnectionError
+
+from tests.mock_client import API_KEY, FailingMockSession
+from tests.mock_session import MockSession
+from vortexasdk.api.shared_types import to_ISODate
+from vortexasdk import client as client_module
+from vortexasdk.client import (
+    VortexaClient,
+    create_client,
+    default_client,
+    verify_api_key_format,
+)
+from vortexasdk.exceptions import PageFetchException, PartialResultException
 
 
 class TestClient(TestCase):
@@ -31,3 +50,281 @@ class TestClient(TestCase):
     def test_accepts_valid_uuid(self):
         sample_valid_key = "123e4567-e89b-12d3-a456-426614174000"
         verify_api_key_format(sample_valid_key)
+
+    def test_pool_size_defaults_to_number_of_threads(self):
+        client = VortexaClient(api_key=API_KEY)
+
+        adapter = client._session.get_adapter("https://")
+
+        assert adapter._pool_maxsize == VortexaClient._N_THREADS
+        client.close()
+
+    def test_search_reuses_pooled_session_for_every_page(self):
+        records = [{"id": i} for i in range(25)]
+        client = VortexaClient(api_key=API_KEY)
+        client._session = MockSession(records)
+
+        actual = client.search("/resource", size=10)
+
+        assert sorted(actual, key=lambda r: r["id"]) == records
+        # probe request, followed by 3 pages
+        assert len(client._session.payloads) == 4
+
+    def test_context_manager_closes_session(self):
+        with VortexaClient(api_key=API_KEY) as client:
+            client._session = MockSession([])
+
+        assert client._session.closed
+
+    def test_iter_pages_yields_pages_in_order(self):
+        records = [{"id": i} for i in range(25)]
+        client = VortexaClient(api_key=API_KEY)
+        client._session = MockSession(records)
+
+        pages = list(client.iter_pages("/resource", size=10))
+
+        assert pages == [records[0:10], records[10:20], records[20:25]]
+
+    def test_iter_pages_bounds_pages_in_flight(self):
+        records = [{"id": i} for i in range(100)]
+        client = VortexaClient(api_key=API_KEY)
+        client._session = MockSession(records)
+
+        pages = client.iter_pages("/resource", size=1)
+        next(pages)
+
+        # probe request, followed by the window of pages requested ahead
+        assert (
+            len(client._session.payloads)
+            <= 1 + VortexaClient._MAX_PAGES_IN_FLIGHT
+        )
+        pages.close()
+
+    def test_search_splits_time_window_when_too_many_records(self):
+        start = datetime(2019, 1, 1)
+        records = [
+            {
+                "cargo_movement_id": i,
+                "timestamp": to_ISODate(start + timedelta(hours=i)),
+            }
+            for i in range(100)
+        ]
+        client = VortexaClient(api_key=API_KEY)
+        client._MAX_ALLOWED_TOTAL = 30
+        client._session = MockSession(records)
+
+        actual = client.search(
+            "/resource",
+            size=7,
+            filter_time_min=to_ISODate(start),
+            filter_time_max=to_ISODate(start + timedelta(hours=100)),
+        )
+
+        assert sorted(actual, key=lambda r: r["cargo_movement_id"]) == records
+
+    def test_search_raises_when_too_many_records_without_time_window(self):
+        client = VortexaClient(api_key=API_KEY)
+        client._MAX_ALLOWED_TOTAL = 30
+        client._session = MockSession([{"id": i} for i in range(31)])
+
+        self.assertRaises(Exception, lambda: client.search("/resource"))
+
+
+class TestClientLifecycle(TestCase):
+    def tearDown(self):
+        client_module.__client__ = None
+
+    def test_default_client_is_created_once_by_concurrent_threads(self):
+        client_module.__client__ = None
+
+        def create():
+            time.sleep(0.05)
+            return VortexaClient(api_key=API_KEY)
+
+        with patch("vortexasdk.client.create_client", side_effect=create) as c:
+            with ThreadPool(4) as pool:
+                clients = pool.map(lambda _: default_client(), range(4))
+
+        assert c.call_count == 1
+        assert all(client is clients[0] for client in clients)
+
+    def test_forked_client_opens_new_connection_pool(self):
+        client = VortexaClient(api_key=API_KEY)
+        session = client._session
+
+        # As if the client had been created by a parent process
+        client._pid = -1
+        client._after_fork()
+
+        assert client._session is not session
+        assert client._pid == os.getpid()
+        client.close()
+        session.close()
+
+    def test_version_check_runs_in_background(self):
+        checked = threading.Event()
+
+        def check(cache_path):
+            checked.wait(5)
+            return "0.0.1", False
+
+        with patch.dict(os.environ, {"VORTEXA_API_KEY": API_KEY}), patch(
+            "vortexasdk.client.is_sdk_version_outdated", side_effect=check
+        ) as is_outdated:
+            create_client()
+            checked.set()
+
+        assert is_outdated.call_count == 1
+
+    def test_version_check_can_be_disabled(self):
+        with patch.dict(os.environ, {"VORTEXA_API_KEY": API_KEY}), patch(
+            "vortexasdk.client.VERSION_CHECK", False
+        ), patch("vortexasdk.client.is_sdk_version_outdated") as is_outdated:
+            create_client()
+
+        assert is_outdated.call_count == 0
+
+
+@patch("vortexasdk.client._PAGE_BACKOFF_FACTOR", 0)
+class TestPageErrors(TestCase):
+    records = [{"id": i} for i in range(50)]
+
+    def _client(self, session, page_retries=3):
+        client = VortexaClient(api_key=API_KEY, page_retries=page_retries)
+        client._session = session
+        return client
+
+    def test_throttled_page_is_retried(self):
+        session = FailingMockSession(self.records, 20, 2, 429)
+
+        actual = self._client(session).search("/resource", size=10)
+
+        assert actual == self.records
+        assert [p["offset"] for p in session.payloads].count(20) == 3
+
+    def test_connection_reset_is_retried(self):
+        session = FailingMockSession(
+            self.records, 20, 1, ConnectionError("Connection reset by peer")
+        )
+
+        actual = self._client(session).search("/resource", size=10)
+
+        assert actual == self.records
+
+    def test_client_error_is_not_retried(self):
+        session = FailingMockSession(self.records, 20, 1, 400)
+        pages = self._client(session).iter_pages("/resource", size=10)
+
+        with self.assertRaises(PageFetchException) as raised:
+            list(pages)
+
+        assert raised.exception.status_code == 400
+        assert raised.exception.offset == 20
+        assert len(raised.exception.payload_hash) == 12
+
+    def test_search_reports_partial_result(self):
+        session = FailingMockSession(self.records, 20, 10, 503)
+
+        with self.assertRaises(PartialResultException) as raised:
+            self._client(session, page_retries=1).search("/resource", size=10)
+
+        assert (
+            raised.exception.records == self.records[:20] + self.records[30:]
+        )
+        assert [f.offset for f in raised.exception.failures] == [20]
+        assert raised.exception.failures[0].status_code == 503
+
+
+class _ServerErrorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _fail(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests += 1
+        self.send_response(500)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = _fail
+    do_POST = _fail
+
+    def log_message(self, format, *args):
+        pass
+
+
+@patch("vortexasdk.client._PAGE_BACKOFF_FACTOR", 0)
+class TestRetryBudget(TestCase):
+    """Requests sent through the real pooled session, to a local server failing every request."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), _ServerErrorHandler
+        )
+        self.server.requests = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address
+        self.api_url = patch(
+            "vortexasdk.client.API_URL", f"http://{host}:{port}"
+        )
+        self.api_url.start()
+
+    def tearDown(self):
+        self.api_url.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_search_sends_page_retries_plus_one_requests(self):
+        with VortexaClient(api_key=API_KEY, page_retries=2) as client:
+            with self.assertRaises(PageFetchException):
+                client.search("/resource", size=10)
+
+        assert self.server.requests == 3
+
+    def test_get_reference_is_retried_within_budget(self):
+        with VortexaClient(
+            api_key=API_KEY, page_retries=2, coalesce=False
+        ) as client:
+            with self.assertRaises(PageFetchException) as raised:
+                client.get_reference("/resource", "id")
+
+        assert raised.exception.status_code == 500
+        assert self.server.requests == 3
+
+
+class MutatingMockSession(MockSession):
+    """Inserts `inserted` records at the start of the results, once `after` requests have been served."""
+
+    def __init__(self, records, inserted, after):
+        super().__init__(records)
+        self.inserted = inserted
+        self.after = after
+
+    def post(self, url, json=None, **kwargs):
+        if len(self.payloads) == self.after:
+            self.records = self.inserted + self.records
+        return super().post(url, json=json, **kwargs)
+
+
+class TestConsistentSearch(TestCase):
+    records = [{"cargo_movement_id": i} for i in range(50)]
+    inserted = [{"cargo_movement_id": i} for i in range(50, 53)]
+
+    def test_records_inserted_while_loading_are_not_duplicated(self):
+        client = VortexaClient(api_key=API_KEY, consistent=True)
+        client._session = MutatingMockSession(
+            self.records, self.inserted, after=3
+        )
+
+        actual = client.search("/resource", size=10)
+
+        assert actual == self.inserted + self.records
+
+    def test_records_are_loaded_once_when_unchanged(self):
+        client = VortexaClient(api_key=API_KEY, consistent=True)
+        client._session = MockSession(self.records)
+
+        actual = client.search("/resource", size=10)
+
+        assert actual == self.records
+        # The probe, 5 pages, and a final probe checking the total
+        assert len(client._session.payloads) == 7
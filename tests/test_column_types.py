@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+import pandas as pd
+
+from vortexasdk import column_types
+from vortexasdk.column_types import (
+    CATEGORY,
+    FLOAT,
+    INTEGER,
+    OTHER,
+    TIMESTAMP,
+    column_kind,
+    parse_timestamps,
+    register_column_kind,
+    timestamp_columns,
+)
+
+
+class TestColumnKinds(TestCase):
+    def tearDown(self):
+        column_types._PATH_KINDS.pop("origin.pos", None)
+        column_types._FIELD_KINDS.pop("voyage_id", None)
+
+    def test_kinds_of_known_fields(self):
+        assert column_kind("vessels.0.name") == CATEGORY
+        assert column_kind("quantity") == INTEGER
+        assert column_kind("origin.location.port.probability") == FLOAT
+        assert column_kind("origin.start_timestamp") == TIMESTAMP
+        assert column_kind("vessel_movement_id") == OTHER
+
+    def test_register_field(self):
+        register_column_kind("voyage_id", CATEGORY)
+
+        assert column_kind("vessels.0.voyage_id") == CATEGORY
+
+    def test_register_path_takes_precedence(self):
+        register_column_kind("origin.pos", FLOAT)
+
+        assert column_kind("origin.pos") == FLOAT
+        assert column_kind("destination.pos") == OTHER
+
+    def test_register_unknown_kind_raises(self):
+        with self.assertRaises(ValueError):
+            register_column_kind("quantity", "decimal")
+
+    def test_timestamp_columns(self):
+        columns = ["quantity", "origin.end_timestamp", "start_timestamp"]
+
+        assert timestamp_columns(columns) == [
+            "origin.end_timestamp",
+            "start_timestamp",
+        ]
+
+
+class TestParseTimestamps(TestCase):
+    def test_parses_iso_timestamps_to_utc(self):
+        parsed = parse_timestamps(
+            [
+                "2019-10-20T16:41:49+0000",
+                "2019-10-21T01:00:00.500+01:00",
+                None,
+                float("nan"),
+                "not a timestamp",
+            ]
+        )
+
+        assert str(parsed.dtype) == "datetime64[ns, UTC]"
+        assert parsed.tolist()[:2] == [
+            pd.Timestamp("2019-10-20T16:41:49", tz="UTC"),
+            pd.Timestamp("2019-10-21T00:00:00.500", tz="UTC"),
+        ]
+        assert parsed.isna().tolist() == [False, False, True, True, True]
@@ -0,0 +1,129 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from tests.mock_client import _read
+from vortexasdk.columnar import MISSING_CODE, MISSING_TIMESTAMP, ColumnStore
+from vortexasdk.endpoints.cargo_movements_result import CargoMovementsResult
+from vortexasdk.endpoints.vessel_movements_result import VesselMovementsResult
+
+_TIMESTAMP = "events.cargo_port_load_event.0.end_timestamp"
+
+
+class TestColumnStore(TestCase):
+    store = ColumnStore.from_columns(
+        {
+            "product.group.label": ["Crude", "Clean products", "Crude", None],
+            "quantity": [100, 200, 300, 400],
+            "probability": [1, 0.5, float("nan"), 1],
+            _TIMESTAMP: [
+                "2019-10-20T16:41:49+0000",
+                None,
+                "2019-10-21T00:00:00.500Z",
+                float("nan"),
+            ],
+        }
+    )
+
+    def test_labels_are_dictionary_encoded(self):
+        codes = self.store.codes("product.group.label")
+
+        assert codes.dtype == np.int32
+        assert codes.tolist() == [0, 1, 0, MISSING_CODE]
+        assert self.store.categories("product.group.label").tolist() == [
+            "Crude",
+            "Clean products",
+        ]
+        assert self.store["product.group.label"].tolist() == [
+            "Crude",
+            "Clean products",
+            "Crude",
+            None,
+        ]
+
+    def test_timestamps_are_epoch_milliseconds(self):
+        stored = self.store.codes(_TIMESTAMP)
+
+        assert stored.dtype == np.int64
+        assert stored.tolist() == [
+            1571589709000,
+            MISSING_TIMESTAMP,
+            1571616000500,
+            MISSING_TIMESTAMP,
+        ]
+        assert self.store[_TIMESTAMP].dtype == np.dtype("datetime64[ms]")
+
+    def test_numeric_columns(self):
+        assert self.store["quantity"].dtype == np.int64
+        assert np.isnan(self.store["probability"][2])
+
+    def test_to_numpy_does_not_copy(self):
+        assert np.shares_memory(
+            self.store.to_numpy("quantity"), self.store.codes("quantity")
+        )
+        assert np.shares_memory(
+            self.store.to_numpy(_TIMESTAMP), self.store.codes(_TIMESTAMP)
+        )
+
+    def test_select_and_slice_share_arrays(self):
+        selected = self.store.select(["quantity"])[1:3]
+
+        assert selected.columns == ["quantity"]
+        assert selected["quantity"].tolist() == [200, 300]
+        assert np.shares_memory(selected["quantity"], self.store["quantity"])
+
+    def test_filter(self):
+        crude = self.store.filter(
+            self.store.equals("product.group.label", "Crude")
+        )
+
+        assert len(crude) == 2
+        assert crude["quantity"].sum() == 400
+        assert not self.store.equals("product.group.label", "Fuel").any()
+        assert self.store.isin(
+            "product.group.label", ["Crude", "Clean products"]
+        ).tolist() == [True, True, True, False]
+
+    def test_to_pandas(self):
+        df = self.store.to_pandas()
+
+        assert list(df.columns) == self.store.columns
+        assert isinstance(df["product.group.label"].dtype, pd.CategoricalDtype)
+        assert df["product.group.label"].isna().tolist() == [
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert str(df[_TIMESTAMP].dtype) == "datetime64[ns, UTC]"
+        assert df[_TIMESTAMP].isna().tolist() == [False, True, False, True]
+
+    def test_timestamps_kept_as_strings(self):
+        store = ColumnStore.from_columns(
+            {_TIMESTAMP: ["2019-10-20T16:41:49+0000"]}, parse_timestamps=False
+        )
+
+        assert store[_TIMESTAMP].tolist() == ["2019-10-20T16:41:49+0000"]
+
+
+class TestResultToColumns(TestCase):
+    def test_cargo_movements_match_to_df(self):
+        result = CargoMovementsResult(_read("cargo_movements.json"))
+
+        store = result.to_columns()
+        df = result.to_df()
+
+        assert store.columns == list(df.columns)
+        assert (
+            store["vessels.0.name"].tolist() == df["vessels.0.name"].tolist()
+        )
+        assert store["quantity"].tolist() == df["quantity"].tolist()
+
+    def test_vessel_movements_all_columns(self):
+        result = VesselMovementsResult(_read("vessel_movements.json"))
+
+        store = result.to_columns("all")
+
+        assert len(store) == 1
+        assert set(store.columns) == set(result.to_df("all").columns)
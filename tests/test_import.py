@@ -0,0 +1,56 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+import vortexasdk
+from vortexasdk.logger import get_logger
+
+# Dependencies only imported once they're needed.
+_HEAVY_MODULES = ["pandas", "numpy", "requests", "aiohttp", "tqdm", "jsons"]
+
+
+def _imported_after(statement: str):
+    """The heavy modules imported by running `statement` in a fresh interpreter."""
+    script = f"import sys; {statement}; print(' '.join(m for m in {_HEAVY_MODULES} if m in sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+
+    return output.split()
+
+
+class TestImport(TestCase):
+    def test_import_package_imports_no_dependencies(self):
+        assert _imported_after("import vortexasdk") == []
+
+    def test_import_endpoint_imports_no_dependencies(self):
+        assert (
+            _imported_after("from vortexasdk import CargoMovements, Vessels")
+            == []
+        )
+
+    def test_to_df_imports_pandas(self):
+        imported = _imported_after(
+            "from vortexasdk.endpoints.vessels_result import VesselsResult; VesselsResult([]).to_df()"
+        )
+
+        assert "pandas" in imported
+
+    def test_lazy_attributes(self):
+        from vortexasdk.endpoints.cargo_movements import CargoMovements
+
+        assert vortexasdk.CargoMovements is CargoMovements
+        assert "Geographies" in dir(vortexasdk)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            vortexasdk.NotAnEndpoint
+
+    def test_get_logger_adds_handlers_once(self):
+        get_logger("tests.test_import")
+        logger = get_logger("tests.test_import")
+
+        assert len(logger.handlers) == 1
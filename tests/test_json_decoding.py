@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from tests.mock_session import MockResponse
+from vortexasdk.client import _handle_response
+from vortexasdk.exceptions import PageFetchException
+from vortexasdk.json_decoding import (
+    DECODERS,
+    create_json_decoder,
+    decode_json,
+    set_json_decoder,
+)
+
+document = (
+    b'{"total": 2, "data": [{"id": "a", "quantity": 1.5}, {"id": "\\u00e9"}]}'
+)
+expected = {"total": 2, "data": [{"id": "a", "quantity": 1.5}, {"id": "é"}]}
+
+
+def _installed_decoders():
+    for name in DECODERS:
+        try:
+            yield name, create_json_decoder(name)
+        except ImportError:
+            pass
+
+
+class TestJsonDecoding(TestCase):
+    def tearDown(self) -> None:
+        set_json_decoder("auto")
+
+    def test_decoders_agree(self):
+        for name, decode in _installed_decoders():
+            assert decode(document) == expected, name
+            assert decode(document.decode()) == expected, name
+
+    def test_decoders_raise_value_error_on_invalid_json(self):
+        for name, decode in _installed_decoders():
+            self.assertRaises(ValueError, lambda: decode(b"{"))
+
+    def test_set_json_decoder(self):
+        set_json_decoder("json")
+
+        assert decode_json(document) == expected
+
+    def test_invalid_response_raises(self):
+        response = MockResponse({})
+        response.content = b"<html>"
+
+        self.assertRaises(
+            PageFetchException, lambda: _handle_response(response)
+        )
@@ -0,0 +1,128 @@
+import json
+from itertools import islice
+from unittest import TestCase
+
+from tests.mock_client import API_KEY, _read
+from tests.mock_session import MockSession
+from vortexasdk.api import CargoMovement
+from vortexasdk.client import VortexaClient
+from vortexasdk.endpoints.cargo_movements_result import CargoMovementsResult
+from vortexasdk.exceptions import MissingPagesException
+from vortexasdk.lazy_records import LazyRecords, RawPage
+
+
+def _raw_pages(records, size):
+    pages = []
+    for offset in range(0, len(records), size):
+        page = list(islice(records, offset, offset + size))
+        content = json.dumps({"data": page}).encode()
+        pages.append(RawPage(content, len(page), offset))
+    return pages
+
+
+class TestLazyRecords(TestCase):
+    records = [{"id": i} for i in range(25)]
+
+    def test_len_decodes_no_page(self):
+        lazy = LazyRecords(_raw_pages(self.records, 10))
+
+        assert len(lazy) == 25
+        assert lazy.decoded_pages == 0
+
+    def test_index_decodes_one_page(self):
+        lazy = LazyRecords(_raw_pages(self.records, 10))
+
+        assert lazy[12] == {"id": 12}
+        assert lazy[-1] == {"id": 24}
+        assert lazy.decoded_pages == 2
+
+    def test_slice_decodes_pages_holding_the_slice(self):
+        lazy = LazyRecords(_raw_pages(self.records, 10))
+
+        assert lazy[0:10] == self.records[0:10]
+        assert lazy.decoded_pages == 1
+
+    def test_iterates_all_records(self):
+        lazy = LazyRecords(_raw_pages(self.records, 10) + [[{"id": 25}]])
+
+        assert list(lazy) == self.records + [{"id": 25}]
+
+    def test_index_out_of_range_raises(self):
+        lazy = LazyRecords(_raw_pages(self.records, 10))
+
+        with self.assertRaises(IndexError):
+            lazy[25]
+
+    def test_map_memoises_conversions(self):
+        calls = []
+
+        def convert(record):
+            calls.append(record["id"])
+            return record["id"]
+
+        lazy = LazyRecords(_raw_pages(self.records, 10))
+        converted = lazy.map(convert)
+
+        assert converted[3] == 3
+        assert converted[3] == 3
+        assert list(converted) == list(range(25))
+        assert lazy.map(convert) is converted
+        assert sorted(calls) == list(range(25))
+
+    def test_copy_decodes_its_own_records(self):
+        lazy = LazyRecords(_raw_pages(self.records, 10) + [[{"id": 25}]])
+        copied = lazy.copy()
+
+        copied[0]["id"] = -1
+        copied[25]["id"] = -1
+
+        assert lazy[0] == {"id": 0}
+        assert lazy[25] == {"id": 25}
+        assert len(copied) == 26
+
+    def test_incomplete_page_raises_on_access(self):
+        page = RawPage(json.dumps({"data": [{"id": 1}]}).encode(), 2, 0)
+        lazy = LazyRecords([page])
+
+        with self.assertRaises(MissingPagesException):
+            lazy[0]
+
+
+class TestLazyResult(TestCase):
+    def test_to_list_converts_records_on_access(self):
+        records = _read("cargo_movements.json")
+        result = CargoMovementsResult(
+            LazyRecords(_raw_pages(records * 10, len(records)))
+        )
+
+        movements = result.to_list()
+
+        assert len(movements) == len(records) * 10
+        assert movements[0] == CargoMovement.from_dict(records[0])
+        assert result.to_list() is movements
+        assert result._records.decoded_pages == 1
+
+    def test_head(self):
+        result = CargoMovementsResult(
+            LazyRecords(_raw_pages([{"id": i} for i in range(25)], 10))
+        )
+
+        head = result.head(3)
+
+        assert isinstance(head, CargoMovementsResult)
+        assert list(head) == [{"id": 0}, {"id": 1}, {"id": 2}]
+        assert result._records.decoded_pages == 1
+
+
+class TestLazyClient(TestCase):
+    def test_search_returns_undecoded_pages(self):
+        records = [{"id": i} for i in range(25)]
+        client = VortexaClient(api_key=API_KEY, lazy=True)
+        client._session = MockSession(records)
+
+        actual = client.search("/resource", size=10)
+
+        assert isinstance(actual, LazyRecords)
+        assert len(actual) == 25
+        assert actual.decoded_pages == 0
+        assert list(actual) == records
@@ -1,5 +1,19 @@
-from tests.testcases import TestCaseUsingRealAPI
-from vortexasdk import Products, Geographies, Corporations, Vessels
+from datetime import datetime
+
+from tests.mock_client import (
+    CountingMockVortexaClient,
+    example_vessel_movements,
+    example_vessels,
+)
+from tests.testcases import TestCaseUsingMockAPI, TestCaseUsingRealAPI
+from vortexasdk import (
+    Products,
+    Geographies,
+    Corporations,
+    Vessels,
+    VesselMovements,
+)
+from vortexasdk.client import set_client
 
 endpoints_and_searchterms = [
     (Products(), "Gasoil"),
@@ -35,3 +49,30 @@ class TestSearchReal(TestCaseUsingRealAPI):
 
             # result must be the exact term, or must contain no results if there's no reference objects with that names
             assert actual_names == {term} or actual_names == set()
+
+
+class TestSearchIter(TestCaseUsingMockAPI):
+    def test_search_iter_yields_every_record(self):
+        actual = list(Vessels().search_iter())
+
+        assert actual == example_vessels
+
+    def test_search_iter_builds_the_endpoint_payload(self):
+        client = CountingMockVortexaClient()
+        set_client(client)
+
+        actual = list(
+            VesselMovements().search_iter(
+                filter_time_min=datetime(2019, 1, 1),
+                exclude_origins="origin-id",
+            )
+        )
+
+        assert actual == example_vessel_movements
+        assert (
+            client.searches[0]["filter_time_min"] == "2019-01-01T00:00:00.000Z"
+        )
+        assert client.searches[0]["exclude"]["filter_origins"] == ["origin-id"]
+        assert (
+            client.searches[0]["size"] == VesselMovements._MAX_PAGE_RESULT_SIZE
+        )
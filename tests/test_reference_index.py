@@ -0,0 +1,93 @@
+from unittest import TestCase
+
+from tests.mock_client import MockVortexaClient, example_vessels
+from vortexasdk import Vessels
+from vortexasdk.client import set_client
+from vortexasdk.conversions import convert_to_vessel_ids
+from vortexasdk.endpoints.endpoints import VESSELS_REFERENCE
+from vortexasdk.reference_index import (
+    ReferenceIndex,
+    load_reference_index,
+    set_reference_index,
+)
+
+records = [
+    {"id": "1", "name": "Rotterdam [NL]", "related_names": ["Rotterdam"]},
+    {"id": "2", "name": "Rotterdam Botlek", "related_names": []},
+    {"id": "3", "name": "Antwerp [BE]", "related_names": ["Antwerpen"]},
+    {"id": "4", "name": "DHT  Lotus", "imo": 9000001, "mmsi": 538000001},
+]
+
+
+class FailingMockVortexaClient(MockVortexaClient):
+    def get_reference(self, resource, id):
+        raise AssertionError("Lookup should be answered by the index")
+
+    def search(self, resource, **data):
+        raise AssertionError("Search should be answered by the index")
+
+
+class TestReferenceIndex(TestCase):
+    index = ReferenceIndex(records)
+
+    def test_get(self):
+        assert self.index.get("3")["name"] == "Antwerp [BE]"
+        assert self.index.get("5") is None
+
+    def test_exact_matches_names_and_related_names(self):
+        assert [r["id"] for r in self.index.exact("antwerpen")] == ["3"]
+        assert [r["id"] for r in self.index.exact("dht lotus")] == ["4"]
+        assert self.index.exact("antwer") == []
+
+    def test_search_matches_partial_names(self):
+        assert [r["id"] for r in self.index.search("ROTTERDAM")] == ["1", "2"]
+        assert [r["id"] for r in self.index.search("nl")] == ["1"]
+
+    def test_search_matches_imo_and_mmsi(self):
+        assert [r["id"] for r in self.index.search("9000001")] == ["4"]
+        assert [r["id"] for r in self.index.search(538000001)] == ["4"]
+
+    def test_fuzzy_ranks_most_similar_names_first(self):
+        assert [r["id"] for r in self.index.fuzzy("Roterdam")][0] == "1"
+        assert self.index.fuzzy("Singapore") == []
+
+    def test_can_answer_term_and_id_searches_only(self):
+        assert self.index.can_answer(
+            {"term": ["a"], "ids": [], "vessel_scrubbers": "disabled"}
+        )
+        assert not self.index.can_answer(
+            {"term": ["a"], "vessel_classes": ["vlcc"]}
+        )
+
+    def test_answer_combines_term_and_ids(self):
+        result = self.index.answer({"term": ["rotterdam"], "ids": ["2", "3"]})
+
+        assert [r["id"] for r in result] == ["2"]
+
+
+class TestReferenceIndexOperations(TestCase):
+    def setUp(self) -> None:
+        set_client(MockVortexaClient())
+        load_reference_index(Vessels())
+        set_client(FailingMockVortexaClient())
+
+    def tearDown(self) -> None:
+        set_reference_index(VESSELS_REFERENCE, None)
+
+    def test_search_is_answered_by_index(self):
+        result = Vessels().search(term="05").to_list()
+
+        assert [v.name for v in result] == ["058"]
+
+    def test_exact_term_match_is_answered_by_index(self):
+        result = Vessels().search(term=["0"], exact_term_match=True).to_list()
+
+        assert [v.name for v in result] == ["0"]
+
+    def test_reference_is_answered_by_index(self):
+        vessel = example_vessels[1]
+
+        assert Vessels().reference(vessel["id"]) == vessel
+
+    def test_conversions_are_answered_by_index(self):
+        assert convert_to_vessel_ids([413771781]) == [example_vessels[1]["id"]]
@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from vortexasdk.sharding import (
+    UnsplittableTimeWindowException,
+    deduplicate_pages,
+    deduplicate_records,
+    split_time_window,
+)
+
+
+class TestSharding(TestCase):
+    def test_split_time_window(self):
+        actual = split_time_window(
+            "2019-01-01T00:00:00.000Z", "2019-01-03T00:00:00.000Z"
+        )
+
+        expected = [
+            ("2019-01-01T00:00:00.000Z", "2019-01-02T00:00:00.000Z"),
+            ("2019-01-02T00:00:00.000Z", "2019-01-03T00:00:00.000Z"),
+        ]
+
+        assert actual == expected
+
+    def test_split_time_window_raises_for_tiny_window(self):
+        self.assertRaises(
+            UnsplittableTimeWindowException,
+            lambda: split_time_window(
+                "2019-01-01T00:00:00.000Z", "2019-01-01T00:00:00.001Z"
+            ),
+        )
+
+    def test_deduplicate_records_keeps_records_without_id(self):
+        records = [
+            {"cargo_movement_id": "a"},
+            {"key": "2019-01-01"},
+            {"cargo_movement_id": "a"},
+            {"key": "2019-01-01"},
+        ]
+
+        actual = deduplicate_records(records)
+
+        expected = [
+            {"cargo_movement_id": "a"},
+            {"key": "2019-01-01"},
+            {"key": "2019-01-01"},
+        ]
+
+        assert actual == expected
+
+    def test_deduplicate_pages_removes_records_seen_in_earlier_pages(self):
+        pages = [
+            [{"vessel_movement_id": "a"}, {"vessel_movement_id": "b"}],
+            [{"vessel_movement_id": "b"}, {"vessel_movement_id": "c"}],
+        ]
+
+        actual = list(deduplicate_pages(pages))
+
+        expected = [
+            [{"vessel_movement_id": "a"}, {"vessel_movement_id": "b"}],
+            [{"vessel_movement_id": "c"}],
+        ]
+
+        assert actual == expected
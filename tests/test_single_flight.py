@@ -0,0 +1,141 @@
+import copy
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+from unittest import TestCase
+from unittest.mock import patch
+
+from tests.mock_client import API_KEY
+from tests.mock_session import MockSession
+from vortexasdk.client import VortexaClient
+from vortexasdk.single_flight import SingleFlight
+
+
+class SlowMockSession(MockSession):
+    """Holds each request until `release` is set."""
+
+    def __init__(self, records):
+        super().__init__(records)
+        self.release = threading.Event()
+
+    def post(self, url, json=None, **kwargs):
+        self.release.wait(5)
+        return super().post(url, json, **kwargs)
+
+
+class TestSingleFlight(TestCase):
+    def test_concurrent_calls_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        with ThreadPool(4) as pool:
+            results = pool.map_async(
+                lambda _: flight.do("key", load), range(4)
+            )
+            while flight.coalesced < 3:
+                time.sleep(0.01)
+            release.set()
+            assert results.get(5) == ["result"] * 4
+
+        assert len(calls) == 1
+
+    def test_calls_after_completion_run_again(self):
+        flight = SingleFlight()
+        calls = []
+
+        flight.do("key", lambda: calls.append(1))
+        flight.do("key", lambda: calls.append(1))
+
+        assert len(calls) == 2
+
+    def test_memo_ttl_reuses_completed_results(self):
+        flight = SingleFlight(memo_ttl=60)
+        calls = []
+
+        flight.do("key", lambda: calls.append(1))
+        flight.do("key", lambda: calls.append(1))
+
+        assert len(calls) == 1
+
+    def test_memoised_results_expire(self):
+        flight = SingleFlight(memo_ttl=60)
+        calls = []
+
+        with patch("vortexasdk.single_flight.time.monotonic", return_value=0):
+            flight.do("key", lambda: calls.append(1))
+        with patch("vortexasdk.single_flight.time.monotonic", return_value=61):
+            flight.do("key", lambda: calls.append(1))
+
+        assert len(calls) == 2
+
+    def test_errors_are_shared_and_not_memoised(self):
+        flight = SingleFlight(memo_ttl=60)
+
+        def fail():
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            flight.do("key", fail)
+
+        assert flight.do("key", lambda: "retried") == "retried"
+
+    def test_shared_results_are_copied(self):
+        flight = SingleFlight(memo_ttl=60)
+        result = [{"id": 1}]
+
+        first = flight.do("key", lambda: result, copy=copy.deepcopy)
+        second = flight.do("key", lambda: result, copy=copy.deepcopy)
+        first[0]["id"] = 2
+
+        assert second == [{"id": 1}]
+        assert result == [{"id": 1}]
+
+    def test_results_not_shared_are_not_copied(self):
+        flight = SingleFlight()
+        result = [{"id": 1}]
+
+        assert flight.do("key", lambda: result, copy=copy.deepcopy) is result
+
+
+class TestClientCoalescing(TestCase):
+    def test_identical_concurrent_searches_share_requests(self):
+        records = [{"id": i} for i in range(5)]
+        client = VortexaClient(api_key=API_KEY)
+        client._session = SlowMockSession(records)
+
+        with ThreadPool(3) as pool:
+            results = pool.map_async(
+                lambda _: client.search("/resource", size=10, term="a"),
+                range(3),
+            )
+            while client.single_flight.coalesced < 2:
+                time.sleep(0.01)
+            client._session.release.set()
+            first, second, third = results.get(5)
+
+        assert first == second == third == records
+        first[0]["id"] = "modified"
+        assert second[0] == third[0] == records[0]
+        # A single search: its probe request, followed by a single page
+        assert len(client._session.payloads) == 2
+
+    def test_different_payloads_are_not_coalesced(self):
+        client = VortexaClient(api_key=API_KEY)
+        client._session = MockSession([{"id": 1}])
+
+        client.search("/resource", term="a")
+        client.search("/resource", term="b")
+
+        assert client.single_flight.coalesced == 0
+        assert len(client._session.payloads) == 2
+
+    def test_coalescing_can_be_disabled(self):
+        client = VortexaClient(api_key=API_KEY, coalesce=False)
+
+        assert client.single_flight is None
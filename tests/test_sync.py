@@ -0,0 +1,143 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from vortexasdk.sync import MovementStore, sync, sync_scope
+
+_START = datetime(2020, 1, 1)
+
+
+class FakeEndpoint:
+    """Returns the movements whose day falls in the searched time window."""
+
+    _resource = "/cargo-movements"
+
+    def __init__(self, movements):
+        self.movements = movements
+        self.windows = []
+
+    def search(self, filter_time_min, filter_time_max, **filters):
+        self.windows.append((filter_time_min, filter_time_max))
+        return [
+            m
+            for m in self.movements
+            if filter_time_min <= _time(m) < filter_time_max
+        ]
+
+
+def _movement(id, day, quantity=100):
+    return {
+        "cargo_movement_id": id,
+        "day": day,
+        "quantity": quantity,
+    }
+
+
+def _time(movement):
+    return _START + timedelta(days=movement["day"], hours=12)
+
+
+class TestSync(TestCase):
+    filters = {"filter_activity": "loading_state", "filter_time_min": _START}
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "movements.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _stored(self, endpoint):
+        with MovementStore(self.path) as store:
+            records = store.records(sync_scope(endpoint, self.filters))
+        return {r["cargo_movement_id"]: r["quantity"] for r in records}
+
+    def test_first_sync_loads_every_window(self):
+        endpoint = FakeEndpoint([_movement("a", 0), _movement("b", 9)])
+
+        report = sync(
+            self.path, endpoint, self.filters, now=_START + timedelta(days=10)
+        )
+
+        assert report.windows == 10
+        assert report.inserted == 2
+        assert self._stored(endpoint) == {"a": 100, "b": 100}
+
+    def test_later_sync_only_loads_the_lookback(self):
+        endpoint = FakeEndpoint([_movement("a", 0), _movement("b", 9)])
+        sync(
+            self.path, endpoint, self.filters, now=_START + timedelta(days=10)
+        )
+        endpoint.windows.clear()
+
+        report = sync(
+            self.path,
+            endpoint,
+            self.filters,
+            lookback=timedelta(days=2),
+            now=_START + timedelta(days=10, hours=1),
+        )
+
+        assert endpoint.windows[0][0] == _START + timedelta(days=8)
+        assert report.windows == 3
+        assert report.unchanged == 1
+        assert report.inserted == report.updated == report.deleted == 0
+
+    def test_sync_upserts_and_deletes(self):
+        endpoint = FakeEndpoint(
+            [_movement("a", 0), _movement("b", 8), _movement("c", 9)]
+        )
+        sync(
+            self.path, endpoint, self.filters, now=_START + timedelta(days=10)
+        )
+
+        endpoint.movements = [
+            _movement("a", 0),
+            _movement("b", 8, quantity=200),
+            _movement("d", 9),
+        ]
+        report = sync(
+            self.path,
+            endpoint,
+            self.filters,
+            lookback=timedelta(days=3),
+            now=_START + timedelta(days=10, hours=1),
+        )
+
+        assert (report.inserted, report.updated, report.deleted) == (1, 1, 1)
+        assert self._stored(endpoint) == {"a": 100, "b": 200, "d": 100}
+        with MovementStore(self.path) as store:
+            assert store.deleted_ids(sync_scope(endpoint, self.filters)) == [
+                "c"
+            ]
+
+    def test_movements_outside_the_lookback_are_kept(self):
+        endpoint = FakeEndpoint([_movement("a", 0), _movement("b", 9)])
+        sync(
+            self.path, endpoint, self.filters, now=_START + timedelta(days=10)
+        )
+
+        endpoint.movements = [_movement("b", 9)]
+        report = sync(
+            self.path,
+            endpoint,
+            self.filters,
+            lookback=timedelta(days=2),
+            now=_START + timedelta(days=10, hours=1),
+        )
+
+        assert report.deleted == 0
+        assert self._stored(endpoint) == {"a": 100, "b": 100}
+
+    def test_searches_are_stored_in_separate_scopes(self):
+        endpoint = FakeEndpoint([_movement("a", 0)])
+        other = {**self.filters, "filter_activity": "unloading_state"}
+
+        assert sync_scope(endpoint, self.filters) != sync_scope(
+            endpoint, other
+        )
+        assert sync_scope(endpoint, self.filters) == sync_scope(
+            endpoint, {**self.filters, "filter_time_max": datetime(2021, 1, 1)}
+        )
@@ -1,10 +1,16 @@
+import json
+import os
+import tempfile
+import time
 from unittest import TestCase
+from unittest.mock import patch
 from distutils.version import LooseVersion
 
 from vortexasdk.utils import (
     convert_to_list,
     convert_values_to_list,
     get_latest_sdk_version,
+    get_latest_sdk_version_cached,
     filter_exact_match,
 )
 
@@ -30,6 +36,29 @@ class TestUtils(TestCase):
 
         assert lv > LooseVersion(sdk_old_version)
 
+    def test_get_latest_sdk_version_cached(self):
+        path = os.path.join(tempfile.mkdtemp(), "latest_version.json")
+
+        with patch(
+            "vortexasdk.utils.get_latest_sdk_version", return_value="1.0.0"
+        ) as pypi:
+            assert get_latest_sdk_version_cached(path) == "1.0.0"
+            assert get_latest_sdk_version_cached(path) == "1.0.0"
+
+        assert pypi.call_count == 1
+
+    def test_get_latest_sdk_version_cached_expires(self):
+        path = os.path.join(tempfile.mkdtemp(), "latest_version.json")
+        with open(path, "w") as f:
+            json.dump(
+                {"latest_version": "0.1.0", "checked_at": time.time() - 1e6}, f
+            )
+
+        with patch(
+            "vortexasdk.utils.get_latest_sdk_version", return_value="1.0.0"
+        ):
+            assert get_latest_sdk_version_cached(path) == "1.0.0"
+
     def test_filter_doesn_not_match_part_name(self):
         search_result = [{"name": "China"}, {"name": "South China"}]
 
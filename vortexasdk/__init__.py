@@ -1,18 +1,37 @@
-"""Vortexa Python SDK."""
-# noinspection PyUnresolvedReferences
-from vortexasdk.endpoints import (
-    Attributes,
-    CargoMovements,
-    CargoTimeSeries,
-    Corporations,
-    Geographies,
-    Products,
-    VesselMovements,
-    Vessels,
-)
+"""
+Vortexa Python SDK.
+
+Endpoints, and their dependencies such as `pandas` and `requests`, are imported on first access.
+"""
+import importlib
 
 # noinspection PyUnresolvedReferences
 from vortexasdk.version import __version__
 
-# noinspection PyUnresolvedReferences
-from vortexasdk.check_setup import run_all_checks
+# The module defining each lazily imported attribute.
+_LAZY_ATTRIBUTES = {
+    "Attributes": "vortexasdk.endpoints",
+    "CargoMovements": "vortexasdk.endpoints",
+    "CargoTimeSeries": "vortexasdk.endpoints",
+    "Corporations": "vortexasdk.endpoints",
+    "Geographies": "vortexasdk.endpoints",
+    "Products": "vortexasdk.endpoints",
+    "VesselMovements": "vortexasdk.endpoints",
+    "Vessels": "vortexasdk.endpoints",
+    "run_all_checks": "vortexasdk.check_setup",
+}
+
+__all__ = ["__version__"] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import List
+from typing import Iterator, List
 
 from vortexasdk.api import ID
 
@@ -14,3 +14,7 @@ class AbstractVortexaClient(ABC):
     def search(self, resource: str, **data) -> List:
         """Search."""
         raise NotImplementedError
+
+    def iter_pages(self, resource: str, **data) -> Iterator[List]:
+        """Search, yielding each page of results."""
+        yield self.search(resource, **data)
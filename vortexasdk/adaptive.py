@@ -0,0 +1,199 @@
+"""
+Tune the number of concurrent page requests, and the size of each page, while a search downloads.
+
+The controller measures each page's latency, response size and status code. Concurrency is tuned AIMD-style:
+it grows by one request after each round of successful pages while throughput (records per second) keeps up,
+and halves as soon as the API throttles (429) or fails (5xx). The page size halves when pages are slow, and
+doubles back towards the endpoint's maximum page size when pages are fast.
+"""
+import threading
+import time
+from typing import Dict
+
+from vortexasdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+THROTTLED = 429
+
+
+def is_congestion(status_code: int) -> bool:
+    """Check whether a response status shows the API is overloaded."""
+    return status_code == THROTTLED or status_code >= 500
+
+
+class AdaptiveController:
+    """
+    Adaptive controller of page size and concurrency, shared by all the searches of a `VortexaClient`.
+
+    # Arguments
+        max_concurrency: The maximum number of concurrent page requests.
+        initial_concurrency: The number of concurrent page requests to start with.
+        max_page_size: The maximum number of records per page, further capped by each endpoint's own maximum.
+        min_page_size: The minimum number of records per page.
+        target_latency: Pages slower than `target_latency` seconds are shrunk, pages 4 times faster are grown.
+
+    # Example
+
+    ```python
+    >>> client = VortexaClient(api_key="...", adaptive=True) # doctest: +SKIP
+    >>> df = CargoMovements().search(filter_activity="loading_state").to_df() # doctest: +SKIP
+    >>> client.controller.metrics() # doctest: +SKIP
+    {'pages': 86, 'records': 42791, 'records_per_second': 5120.3, 'concurrency': 11, 'page_size': 500, ...}
+
+    ```
+    """
+
+    # An increase of concurrency is reverted if throughput falls below this fraction of the previous round's.
+    _THROUGHPUT_TOLERANCE = 0.9
+    _MAX_BACKOFF = 30
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        initial_concurrency: int = 6,
+        max_page_size: int = int(1e4),
+        min_page_size: int = 100,
+        target_latency: float = 10,
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.target_latency = target_latency
+
+        self.concurrency = min(initial_concurrency, max_concurrency)
+        self.page_size = max_page_size
+
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._totals = {
+            "pages": 0,
+            "records": 0,
+            "bytes": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "failed_requests": 0,
+        }
+        self._previous_throughput = 0.0
+        self._last_increased = False
+        self._reset_round()
+
+    def page_size_for(self, max_size: int) -> int:
+        """The size of the next page, at most `max_size`, the endpoint's maximum page size."""
+        return max(1, min(self.page_size, max_size))
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait before retrying a page after its `attempt`-th congested response."""
+        return min(self._MAX_BACKOFF, 2 ** attempt)
+
+    def record(
+        self, n_records: int, n_bytes: int, latency: float, status_code: int
+    ) -> None:
+        """Record the outcome of a page request, and adjust concurrency and page size."""
+        with self._lock:
+            self._totals["bytes"] += n_bytes
+
+            if is_congestion(status_code):
+                key = (
+                    "throttled"
+                    if status_code == THROTTLED
+                    else "server_errors"
+                )
+                self._totals[key] += 1
+                self._back_off(f"received status {status_code}")
+                return
+
+            self._totals["pages"] += 1
+            self._totals["records"] += n_records
+
+            self._round_pages += 1
+            self._round_records += n_records
+            self._round_latency += latency
+            if self._round_pages >= self._round_size:
+                self._end_round()
+
+    def record_failure(self, reason: str) -> None:
+        """Record a request failing without a response, e.g. a connection reset or a timeout, and back off."""
+        with self._lock:
+            self._totals["failed_requests"] += 1
+            self._back_off(reason)
+
+    def metrics(self) -> Dict:
+        """A snapshot of the controller's measurements and current settings."""
+        with self._lock:
+            elapsed = time.monotonic() - self._start
+            return {
+                **self._totals,
+                "records_per_second": round(
+                    self._totals["records"] / elapsed, 1
+                ),
+                "concurrency": self.concurrency,
+                "page_size": self.page_size,
+            }
+
+    def _end_round(self) -> None:
+        elapsed = max(time.monotonic() - self._round_start, 1e-9)
+        throughput = self._round_records / elapsed
+        latency = self._round_latency / self._round_pages
+
+        if (
+            self._last_increased
+            and throughput
+            < self._previous_throughput * self._THROUGHPUT_TOLERANCE
+        ):
+            # The last increase didn't pay off, step back and hold
+            self._set_concurrency(
+                self.concurrency - 1,
+                f"throughput fell to {throughput:.0f} records/s",
+            )
+            self._last_increased = False
+        elif self.concurrency < self.max_concurrency:
+            self._set_concurrency(
+                self.concurrency + 1, f"throughput {throughput:.0f} records/s",
+            )
+            self._last_increased = True
+        else:
+            self._last_increased = False
+
+        if latency > self.target_latency:
+            self._set_page_size(
+                self.page_size // 2, f"mean page latency {latency:.1f}s"
+            )
+        elif latency < self.target_latency / 4:
+            self._set_page_size(
+                self.page_size * 2, f"mean page latency {latency:.1f}s"
+            )
+
+        self._previous_throughput = throughput
+        self._reset_round()
+
+    def _back_off(self, reason: str) -> None:
+        self._set_concurrency(self.concurrency // 2, reason)
+        self._set_page_size(self.page_size // 2, reason)
+        self._last_increased = False
+        self._previous_throughput = 0.0
+        self._reset_round()
+
+    def _set_concurrency(self, concurrency: int, reason: str) -> None:
+        concurrency = max(1, min(concurrency, self.max_concurrency))
+        if concurrency != self.concurrency:
+            logger.info(
+                f"Adaptive controller: concurrency {self.concurrency} -> {concurrency}, {reason}"
+            )
+            self.concurrency = concurrency
+
+    def _set_page_size(self, page_size: int, reason: str) -> None:
+        page_size = max(self.min_page_size, min(page_size, self.max_page_size))
+        if page_size != self.page_size:
+            logger.info(
+                f"Adaptive controller: page size {self.page_size} -> {page_size}, {reason}"
+            )
+            self.page_size = page_size
+
+    def _reset_round(self) -> None:
+        # A round ends once as many pages have loaded as there were concurrent requests at its start.
+        self._round_start = time.monotonic()
+        self._round_size = self.concurrency
+        self._round_pages = 0
+        self._round_records = 0
+        self._round_latency = 0.0
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 
-from vortexasdk.api.serdes import FromDictMixin
+from vortexasdk.api.serdes import FromDictMixin, add_slots
 from vortexasdk.api.shared_types import Node
 
 
+@add_slots
 @dataclass(frozen=True,)
 class Attribute(Node, FromDictMixin):
     """
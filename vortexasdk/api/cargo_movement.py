@@ -3,12 +3,13 @@ from typing import List, Optional
 
 from vortexasdk.api.geography import GeographyEntity
 from vortexasdk.api.product import ProductEntity
-from vortexasdk.api.serdes import FromDictMixin
+from vortexasdk.api.serdes import FromDictMixin, add_slots
 from vortexasdk.api.shared_types import ISODate
 from vortexasdk.api.id import ID
 from vortexasdk.api.vessel import VesselEntity
 
 
+@add_slots
 @dataclass(frozen=True)
 class CargoEvent:
     """
@@ -29,6 +30,7 @@ class CargoEvent:
     end_timestamp: Optional[ISODate] = None
 
 
+@add_slots
 @dataclass(frozen=True)
 class CargoMovement(FromDictMixin):
     """
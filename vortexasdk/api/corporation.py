@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import List
 
-from vortexasdk.api.serdes import FromDictMixin
+from vortexasdk.api.serdes import FromDictMixin, add_slots
 from vortexasdk.api.shared_types import IDName, EntityWithProbability
 
 
+@add_slots
 @dataclass(frozen=True)
 class Corporation(IDName, FromDictMixin):
     """Represent a Corporation reference record returned by the API."""
@@ -15,6 +16,7 @@ class Corporation(IDName, FromDictMixin):
     parent: List[str]
 
 
+@add_slots
 @dataclass(frozen=True)
 class CorporateEntity(EntityWithProbability):
     """
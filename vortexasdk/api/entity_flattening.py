@@ -45,6 +45,9 @@ def convert_vessel_movement_to_flat_dict(vm: Dict, cols="all") -> Dict:
 
 def _group_vessel_movement_attributes_by_layer(vm: Dict) -> Dict:
     """Group relevant `VesselMovement` attributes by `Entity.layer`."""
+    # Copy the top level, so the caller's record isn't modified
+    vm = dict(vm)
+
     if "origin" in vm.keys():
         flat_origin = _flatten_attributes(vm["origin"], "location")
         vm["origin"] = flat_origin
@@ -0,0 +1,176 @@
+"""
+Project nested API records directly onto flattened columns.
+
+A flattened column name such as `events.cargo_port_load_event.0.location.port.label` is compiled once into an
+accessor, reading the value straight from the nested record. This gives the same values as flattening each record
+with `entity_flattening`, without copying or flattening the parts of each record that aren't requested.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Value used for columns that aren't present in a record, matching the `NaN`s pandas uses for missing keys.
+MISSING = float("nan")
+
+Step = Callable[[Any], Any]
+Groupings = Dict[Tuple[str, ...], Callable[[str], Step]]
+
+
+def _key_step(token: str) -> Step:
+    """Step into a dictionary key, or a list index."""
+    index = int(token) if token.isdigit() else None
+
+    def step(value):
+        if isinstance(value, list):
+            if index is None:
+                raise KeyError(token)
+            return value[index]
+        return value[token]
+
+    return step
+
+
+def _layer_step(layer: str) -> Step:
+    """Step into the entity with a given `layer`, the last entity wins if several share the same layer."""
+
+    def step(entities):
+        found = None
+        for entity in entities:
+            if entity["layer"] == layer:
+                found = entity
+        if found is None:
+            raise KeyError(layer)
+        return found
+
+    return step
+
+
+def _event_type_step(event_type: str) -> Step:
+    """Step into the last run of consecutive events with a given `event_type`."""
+
+    def step(events):
+        run: List = []
+        previous = None
+        for event in events:
+            current = event["event_type"]
+            if current == event_type:
+                if previous != event_type:
+                    run = []
+                run.append(event)
+            previous = current
+        if not run:
+            raise KeyError(event_type)
+        return run
+
+    return step
+
+
+# Lists of entities grouped by layer (or by event type), keyed by the path leading to the list.
+# `*` matches any list index, or any layer / event type.
+CARGO_MOVEMENT_GROUPINGS: Groupings = {
+    ("product",): _layer_step,
+    ("vessels", "*", "corporate_entities"): _layer_step,
+    ("events",): _event_type_step,
+    ("events", "*", "*", "location"): _layer_step,
+}
+
+VESSEL_MOVEMENT_GROUPINGS: Groupings = {
+    ("origin", "location"): _layer_step,
+    ("destination", "location"): _layer_step,
+    ("cargoes", "*", "product"): _layer_step,
+    ("vessel", "corporate_entities"): _layer_step,
+}
+
+
+def compile_column(column: str, groupings: Groupings) -> Callable[[Dict], Any]:
+    """
+    Compile a flattened column name into an accessor, reading the column's value from a nested record.
+
+    # Arguments
+        column: The flattened column name, e.g. `vessels.0.corporate_entities.charterer.label`
+        groupings: Lists of entities grouped by layer, see `CARGO_MOVEMENT_GROUPINGS`.
+
+    # Returns
+    A function returning the value of the column for a given record, or `MISSING` if the record has no such column.
+
+    """
+    tokens = column.split(".")
+    steps = [
+        _grouping_step(tokens[:i], groupings, token)
+        for i, token in enumerate(tokens)
+    ]
+
+    def accessor(record: Dict) -> Any:
+        value = record
+        try:
+            for step in steps:
+                value = step(value)
+        except (KeyError, IndexError, TypeError):
+            return MISSING
+
+        # Flattening expands nested values into further columns, so a column can only hold a leaf value.
+        if isinstance(value, (dict, list)):
+            return MISSING
+        return value
+
+    return accessor
+
+
+class ColumnProjector:
+    """
+    Project nested records onto flattened columns, caching the compiled accessors of recently used column lists.
+
+    # Example
+
+    ```python
+    >>> projector = ColumnProjector(VESSEL_MOVEMENT_GROUPINGS)
+    >>> projector.project([{"vessel": {"name": "ADEBOMI 3"}}], ["vessel.name", "vessel.imo"])
+    {'vessel.name': ['ADEBOMI 3'], 'vessel.imo': [nan]}
+
+    ```
+    """
+
+    def __init__(self, groupings: Groupings):
+        self._groupings = groupings
+        self._compile = lru_cache(maxsize=32)(self._compile_columns)
+
+    def project(
+        self, records: Iterable[Dict], columns: Sequence[str]
+    ) -> Dict[str, List]:
+        """
+        Read `columns` from each of the nested `records`, in a single pass.
+
+        # Returns
+        A dictionary mapping each column to a list of values, one value per record.
+
+        """
+        accessors = self._compile(tuple(columns))
+        data: Dict[str, List] = {c: [] for c, _ in accessors}
+        appenders = [(data[c].append, accessor) for c, accessor in accessors]
+
+        for record in records:
+            for append, accessor in appenders:
+                append(accessor(record))
+
+        return data
+
+    def _compile_columns(
+        self, columns: Tuple[str, ...]
+    ) -> List[Tuple[str, Callable[[Dict], Any]]]:
+        return [
+            (c, compile_column(c, self._groupings))
+            for c in dict.fromkeys(columns)
+        ]
+
+
+CARGO_MOVEMENT_PROJECTOR = ColumnProjector(CARGO_MOVEMENT_GROUPINGS)
+VESSEL_MOVEMENT_PROJECTOR = ColumnProjector(VESSEL_MOVEMENT_GROUPINGS)
+
+
+def _grouping_step(path: List[str], groupings: Groupings, token: str) -> Step:
+    for pattern, step in groupings.items():
+        if len(pattern) == len(path) and all(
+            p == "*" or p == t for p, t in zip(pattern, path)
+        ):
+            return step(token)
+
+    return _key_step(token)
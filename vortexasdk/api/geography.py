@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
-from vortexasdk.api.serdes import FromDictMixin
+from vortexasdk.api.serdes import FromDictMixin, add_slots
 from vortexasdk.api.shared_types import (
     EntityWithProbability,
     ID,
@@ -13,6 +13,7 @@ from vortexasdk.api.shared_types import (
 Position = Tuple[float, float]
 
 
+@add_slots
 @dataclass(frozen=True)
 class BoundingBox:
     """Polygon with list of bounding lon lat coords."""
@@ -21,6 +22,7 @@ class BoundingBox:
     coordinates: List[Position]
 
 
+@add_slots
 @dataclass(frozen=True)
 class Geography(Node, FromDictMixin):
     """Represent a Geography reference record returned by the API."""
@@ -35,6 +37,7 @@ class Geography(Node, FromDictMixin):
     location: Optional[Position]
 
 
+@add_slots
 @dataclass(frozen=True)
 class GeographyEntity(EntityWithProbability):
     """
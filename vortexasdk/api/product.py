@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import List
 
-from vortexasdk.api.serdes import FromDictMixin
+from vortexasdk.api.serdes import FromDictMixin, add_slots
 from vortexasdk.api.shared_types import Entity, EntityWithProbability, Node
 
 
+@add_slots
 @dataclass(frozen=True)
 class Product(Node, FromDictMixin):
     """
@@ -18,6 +19,7 @@ class Product(Node, FromDictMixin):
     hierarchy: List[Entity]
 
 
+@add_slots
 @dataclass(frozen=True)
 class ProductEntity(EntityWithProbability):
     """
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import TYPE_CHECKING, Dict, List
 
-import pandas as pd
+from vortexasdk.arrow_conversions import create_arrow_table, write_parquet
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -16,10 +19,62 @@ class Result(ABC):
         return self._records
 
     @abstractmethod
-    def to_df(self, columns=None) -> pd.DataFrame:
+    def to_df(self, columns=None) -> "pd.DataFrame":
         """Represent *_records* as a `pd.DataFrame` with given columns."""
         pass
 
+    def head(self, n: int = 5) -> "Result":
+        """
+        Return a result holding the first `n` records.
+
+        Lazy results only decode the pages holding these records, so `head` is a cheap way to explore a large search.
+        """
+        return self.__class__(self._records[:n])
+
+    def to_arrow(self, columns=None):
+        """
+        Represent *_records* as a `pyarrow.Table` with given columns.
+
+        Values are converted straight from the raw records into typed Arrow arrays: timestamps as
+        `timestamp[ms, UTC]`, labels as dictionary encoded strings, and quantities as `int64`.
+        `columns` are chosen as in `to_df`. Requires `pyarrow`, installed with `pip install vortexasdk[arrow]`.
+        """
+        return create_arrow_table(self._to_columns(columns))
+
+    def to_parquet(
+        self, path: str, columns=None, row_group_size: int = None
+    ) -> None:
+        """
+        Write *_records* to a Parquet file at `path`, with given columns.
+
+        # Arguments
+            path: The Parquet file to write.
+            columns: Columns present in the file, chosen as in `to_df`.
+            row_group_size: Maximum number of rows in each row group.
+
+        """
+        write_parquet(self.to_arrow(columns), path, row_group_size)
+
+    def to_columns(self, columns=None, parse_timestamps: bool = True):
+        """
+        Represent *_records* as a `ColumnStore`, holding one NumPy array per column, with given columns.
+
+        Labels are dictionary encoded and timestamps parsed once into `int64` milliseconds, so the store can be
+        filtered, sliced and aggregated repeatedly without flattening the records again. `columns` are chosen as
+        in `to_df`. Without `parse_timestamps`, timestamps are kept as ISO 8601 strings.
+        """
+        # NumPy is only imported once results are held as columns
+        from vortexasdk.columnar import ColumnStore
+
+        return ColumnStore.from_columns(
+            self._to_columns(columns), parse_timestamps
+        )
+
+    @abstractmethod
+    def _to_columns(self, columns=None) -> Dict[str, List]:
+        """Represent *_records* as a dictionary mapping each of the given columns to its list of values."""
+        pass
+
     def __len__(self):
         """Delegate to *_records*."""
         return len(self._records)
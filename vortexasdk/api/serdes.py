@@ -1,19 +1,247 @@
-from typing import Dict, TypeVar
-
-import jsons
+import dataclasses
+import sys
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, TypeVar, Union, get_type_hints
 
 T = TypeVar("T")
 
+Decoder = Callable[[Any], Any]
+
+_PRIMITIVES = (str, int, float, bool)
+
+# Fields holding a handful of distinct strings, repeated across records. Their values are interned when decoded,
+# so all records share a single copy of each string.
+_INTERNED_FIELDS = {"layer", "source", "event_type", "label", "status"}
+
 
 def serialize_to_dict(dataclass) -> Dict:
     """Serialize data class attributes."""
+    import jsons
+
     return jsons.loads(jsons.dumps(dataclass))
 
 
 class FromDictMixin:
     """Mixin allowing serialization of a dictionary to a dataclass."""
 
+    __slots__ = ()
+
     @classmethod
     def from_dict(cls: T, d: Dict) -> T:
-        """Serialize dictionary to dataclass of type T."""
-        return jsons.loads(jsons.dumps(d), cls)
+        """Serialize dictionary to dataclass of type T, with the decoder compiled for the class."""
+        return compile_decoder(cls)(d)
+
+
+@lru_cache(maxsize=None)
+def compile_decoder(cls: type) -> Decoder:
+    """
+    Compile a decoder of dictionaries to instances of the dataclass `cls`.
+
+    The decoder is built once per class from the class's type hints, nested dataclasses getting their own
+    compiled decoders. Keys that aren't fields of the class are skipped, missing fields take their default.
+    Records the compiled decoder can't decode, e.g. missing a required field, are loaded by `jsons`, so
+    the decoder returns, or raises, exactly what `jsons.load(d, cls)` does.
+
+    # Arguments
+        cls: A dataclass.
+
+    # Returns
+    A function decoding a dictionary to an instance of `cls`.
+
+    # Example
+
+    ```python
+    >>> from vortexasdk.api import CargoMovement
+    >>> decode = compile_decoder(CargoMovement)
+    >>> movements = [decode(d) for d in records] # doctest: +SKIP
+
+    ```
+    """
+    hints = get_type_hints(cls)
+    fields = [
+        (f.name, _compile_field(f.name, hints[f.name]), _default(f))
+        for f in dataclasses.fields(cls)
+        if f.init
+    ]
+    slotted = "__dict__" not in dir(cls)
+
+    def decode(d: Dict):
+        try:
+            values = {}
+            for name, decode_field, default in fields:
+                if name in d:
+                    values[name] = decode_field(d[name])
+                elif default is not dataclasses.MISSING:
+                    values[name] = default()
+                else:
+                    raise KeyError(name)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return _jsons_load(d, cls)
+
+        # Populate the frozen dataclass directly, bypassing its generated __init__ and __setattr__
+        instance = object.__new__(cls)
+        if slotted:
+            for name, value in values.items():
+                object.__setattr__(instance, name, value)
+        else:
+            instance.__dict__.update(values)
+        return instance
+
+    return decode
+
+
+def add_slots(cls: type) -> type:
+    """
+    Recreate the dataclass `cls` with `__slots__` holding its fields, so its instances don't each hold a `__dict__`.
+
+    Apply above `@dataclass`. Base classes must be slotted too, for instances to be free of a `__dict__`.
+
+    # Example
+
+    ```python
+    >>> from dataclasses import dataclass
+    >>> @add_slots
+    ... @dataclass(frozen=True)
+    ... class Point:
+    ...     x: float
+    ...     y: float = 0.0
+    >>> Point(1.0).__slots__
+    ('x', 'y')
+
+    ```
+    """
+    inherited = set(
+        chain.from_iterable(
+            getattr(base, "__slots__", ()) for base in cls.__mro__[1:]
+        )
+    )
+    field_names = [f.name for f in dataclasses.fields(cls)]
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(n for n in field_names if n not in inherited)
+    # Class attributes holding field defaults would clash with the slots, dataclass' __init__ holds the defaults
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    if cls.__dataclass_params__.frozen:  # type: ignore
+        # The generated methods refer to the class being replaced, so replace them too
+        cls_dict["__setattr__"] = _frozen_setattr
+        cls_dict["__delattr__"] = _frozen_delattr
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+
+    # Frozen instances can't be unpickled by setting attributes, so restore their slots directly
+    slotted.__getstate__ = _getstate
+    slotted.__setstate__ = _setstate
+
+    return slotted
+
+
+def _frozen_setattr(self, name: str, value) -> None:
+    raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self, name: str) -> None:
+    raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _getstate(self) -> Dict:
+    return {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+
+
+def _setstate(self, state: Dict) -> None:
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
+def _compile_field(name: str, tp) -> Decoder:
+    decode = _compile_type(tp)
+    if name not in _INTERNED_FIELDS:
+        return decode
+
+    return lambda value: _intern(decode(value))
+
+
+def _intern(value):
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is list:
+        return [sys.intern(v) if type(v) is str else v for v in value]
+    return value
+
+
+def _compile_type(tp) -> Decoder:
+    if dataclasses.is_dataclass(tp):
+        return _compile_nested(tp)
+
+    if tp in _PRIMITIVES:
+        return _compile_primitive(tp)
+
+    origin = getattr(tp, "__origin__", None)
+    args = getattr(tp, "__args__", ())
+
+    if origin is list and len(args) == 1:
+        decode_item = _compile_type(args[0])
+        return lambda value: [decode_item(v) for v in value]
+
+    if origin is tuple and args and args[-1] is not Ellipsis:
+        decode_items = [_compile_type(a) for a in args]
+        return lambda value: tuple(
+            decode(v) for decode, v in zip(decode_items, value)
+        )
+
+    if origin is Union and len(args) == 2 and type(None) in args:
+        decode_optional = _compile_type(
+            next(a for a in args if a is not type(None))
+        )
+        return lambda value: None if value is None else decode_optional(value)
+
+    if tp in (dict, Dict, Any):
+        return _identity
+
+    return lambda value: _jsons_load(value, tp)
+
+
+def _compile_nested(cls: type) -> Decoder:
+    # Nested classes are decoded lazily, so classes referencing each other don't recurse at compile time
+    def decode(value):
+        if not isinstance(value, dict):
+            raise TypeError(f"Cannot decode {type(value)} to {cls}")
+        return compile_decoder(cls)(value)
+
+    return decode
+
+
+def _compile_primitive(tp: type) -> Decoder:
+    def decode(value):
+        if type(value) is tp:
+            return value
+        if tp is float and type(value) is int:
+            return float(value)
+        if value is None:
+            raise TypeError(f"Cannot decode None to {tp}")
+        return _jsons_load(value, tp)
+
+    return decode
+
+
+def _default(field: dataclasses.Field) -> Callable[[], Any]:
+    if field.default is not dataclasses.MISSING:
+        return lambda: field.default
+    if field.default_factory is not dataclasses.MISSING:  # type: ignore
+        return field.default_factory  # type: ignore
+    return dataclasses.MISSING  # type: ignore
+
+
+def _identity(value):
+    return value
+
+
+def _jsons_load(value, tp):
+    # jsons is only imported for the values compiled decoders can't decode
+    import jsons
+
+    return jsons.load(value, tp)
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import List, Optional, Union
 
 from vortexasdk.api.id import ID
+from vortexasdk.api.serdes import add_slots
 
 IDsNames = Union[List[Union[ID, str]], str, ID]
 
@@ -15,6 +16,7 @@ def to_ISODate(utc_datetime: datetime) -> str:
     return utc_datetime.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
 
+@add_slots
 @dataclass(frozen=True)
 class Entity:
     """Holds commonly used properties."""
@@ -24,6 +26,7 @@ class Entity:
     layer: str
 
 
+@add_slots
 @dataclass(frozen=True)
 class EntityWithProbability(Entity):
     """
@@ -37,6 +40,7 @@ class EntityWithProbability(Entity):
     source: str
 
 
+@add_slots
 @dataclass(frozen=True)
 class IDName:
     """Tuple containing `id` and `name`."""
@@ -45,6 +49,7 @@ class IDName:
     name: str
 
 
+@add_slots
 @dataclass(frozen=True)
 class IDLayer:
     """Tuple containing `id` and `layer`."""
@@ -53,6 +58,7 @@ class IDLayer:
     layer: str
 
 
+@add_slots
 @dataclass(frozen=True)
 class IDNameLayer:
     """Triple holding `id`, `name`, and `layer`."""
@@ -62,6 +68,7 @@ class IDNameLayer:
     name: str
 
 
+@add_slots
 @dataclass(frozen=True)
 class Node(ABC, IDName):
     """
@@ -79,6 +86,7 @@ class Node(ABC, IDName):
     parent: List[IDNameLayer]
 
 
+@add_slots
 @dataclass(frozen=True)
 class Tag:
     """
@@ -96,6 +104,7 @@ class Tag:
     end_timestamp: Optional[ISODate] = None
 
 
+@add_slots
 @dataclass(frozen=True)
 class Flag:
     """
@@ -114,6 +123,7 @@ class Flag:
     flag_country: str
 
 
+@add_slots
 @dataclass(frozen=True)
 class Scrubber:
     """
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 
 from vortexasdk.api import ISODate
-from vortexasdk.api.serdes import FromDictMixin
+from vortexasdk.api.serdes import FromDictMixin, add_slots
 
 
+@add_slots
 @dataclass(frozen=True)
 class TimeSeriesItem(FromDictMixin):
     """
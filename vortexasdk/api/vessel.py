@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from vortexasdk.api.corporation import CorporateEntity
 from vortexasdk.api.id import ID
-from vortexasdk.api.serdes import FromDictMixin
+from vortexasdk.api.serdes import FromDictMixin, add_slots
 from vortexasdk.api.shared_types import (
     IDName,
     ISODate,
@@ -14,6 +14,7 @@ from vortexasdk.api.shared_types import (
 )
 
 
+@add_slots
 @dataclass(frozen=True,)
 class Vessel(Node, FromDictMixin):
     """
@@ -47,6 +48,7 @@ class Vessel(Node, FromDictMixin):
     propulsion: Optional[str] = None
 
 
+@add_slots
 @dataclass(frozen=True)
 class VesselEntity(IDName):
     """
@@ -3,11 +3,12 @@ from typing import List, Optional
 
 from vortexasdk.api.geography import GeographyEntity
 from vortexasdk.api.id import ID
-from vortexasdk.api.serdes import FromDictMixin
+from vortexasdk.api.serdes import FromDictMixin, add_slots
 from vortexasdk.api.shared_types import ISODate
 from vortexasdk.api.vessel import VesselEntity
 
 
+@add_slots
 @dataclass(frozen=True)
 class VesselEvent:
     """Represent an event that occurred to a vessel during a vessel movement."""
@@ -21,6 +22,7 @@ class VesselEvent:
     end_timestamp: Optional[ISODate] = None
 
 
+@add_slots
 @dataclass(frozen=True)
 class VesselMovement(FromDictMixin):
     """
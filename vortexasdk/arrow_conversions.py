@@ -0,0 +1,162 @@
+import math
+import os
+import tempfile
+from typing import Callable, Dict, Iterable, List
+
+from vortexasdk.column_types import (
+    CATEGORY,
+    FLOAT,
+    INTEGER,
+    TIMESTAMP,
+    column_kind,
+    parse_timestamps,
+)
+from vortexasdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "Arrow and Parquet exports require pyarrow. Install it with 'pip install vortexasdk[arrow]'"
+        )
+    return pyarrow
+
+
+def create_arrow_table(data: Dict[str, List]):
+    """
+    Build a `pyarrow.Table` from columns of raw values.
+
+    Timestamps are parsed into `timestamp[ms, UTC]`, labels are dictionary encoded, and quantities are `int64`.
+    Missing values are stored as nulls.
+
+    # Arguments
+        data: A dictionary mapping each column name to its list of values.
+
+    # Returns
+    A `pyarrow.Table`, holding one column per key of `data`.
+
+    """
+    pa = _import_pyarrow()
+    logger.debug(f"Creating Arrow table with {len(data)} columns")
+
+    return pa.table(
+        {column: _create_array(pa, column, v) for column, v in data.items()}
+    )
+
+
+def write_parquet(table, path: str, row_group_size: int = None) -> None:
+    """Write a `pyarrow.Table` to a Parquet file."""
+    pa = _import_pyarrow()
+    pa.parquet.write_table(table, path, row_group_size=row_group_size)
+
+
+def write_parquet_pages(
+    pages: Iterable[List[Dict]],
+    path: str,
+    to_arrow: Callable[[List[Dict]], object],
+) -> int:
+    """
+    Write each page of records to a Parquet file, one row group per page.
+
+    Pages may hold different columns, e.g. with `columns="all"`, so the schema of the file is the union of
+    the pages' schemas. Each page is spooled to a temporary Arrow file as soon as it arrives, then the pages
+    are written one at a time, missing columns filled with nulls. Only a single page is held in memory.
+
+    # Arguments
+        pages: Pages of records, for example yielded by `Search.iter_pages`.
+        path: The Parquet file to write.
+        to_arrow: Converts a page of records to a `pyarrow.Table`.
+
+    # Returns
+    The number of records written.
+
+    # Example
+    ```python
+    >>> from vortexasdk import CargoMovements
+    >>> from vortexasdk.endpoints.cargo_movements_result import CargoMovementsResult
+    >>> pages = CargoMovements().iter_pages(filter_activity="loading_state", filter_time_min=datetime(2019, 1, 1), filter_time_max=datetime(2019, 2, 1)) # doctest: +SKIP
+    >>> write_parquet_pages(pages, "cargo_movements.parquet", lambda page: CargoMovementsResult(page).to_arrow()) # doctest: +SKIP
+
+    ```
+    """
+    pa = _import_pyarrow()
+
+    with tempfile.TemporaryDirectory(
+        dir=os.path.dirname(os.path.abspath(path))
+    ) as spool:
+        spooled, schemas = [], []
+        for page in pages:
+            if len(page) == 0:
+                continue
+
+            table = to_arrow(page)
+            spooled.append(os.path.join(spool, f"page-{len(spooled)}.arrow"))
+            with pa.OSFile(spooled[-1], "wb") as sink:
+                spool_writer = pa.ipc.new_file(sink, table.schema)
+                spool_writer.write_table(table)
+                spool_writer.close()
+            schemas.append(table.schema)
+            logger.debug(f"Spooled page {len(spooled)} to {spool}")
+
+        if not spooled:
+            return 0
+
+        schema = pa.unify_schemas(schemas)
+        n_records = 0
+        writer = pa.parquet.ParquetWriter(path, schema)
+        try:
+            for file in spooled:
+                with pa.memory_map(file) as source:
+                    table = pa.ipc.open_file(source).read_all()
+                writer.write_table(_conform(pa, table, schema))
+                n_records += table.num_rows
+                logger.debug(f"Written {n_records} records to {path}")
+        finally:
+            writer.close()
+
+    return n_records
+
+
+def _conform(pa, table, schema):
+    """Cast `table` to `schema`, adding the columns it's missing, filled with nulls."""
+    columns = [
+        table.column(field.name).cast(field.type)
+        if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _create_array(pa, column: str, values: List):
+    kind = column_kind(column)
+    cleaned = [None if _is_missing(v) else v for v in values]
+
+    # noinspection PyBroadException
+    try:
+        if kind == TIMESTAMP:
+            parsed = parse_timestamps(cleaned)
+            return pa.array(parsed, type=pa.timestamp("ms", tz="UTC"))
+        elif kind == CATEGORY:
+            return pa.array(cleaned, type=pa.string()).dictionary_encode()
+        elif kind == INTEGER:
+            return pa.array(cleaned, type=pa.int64())
+        elif kind == FLOAT:
+            return pa.array(cleaned, type=pa.float64())
+    except Exception:
+        logger.debug(f"Could not convert {column} to {kind}, inferring type")
+
+    array = pa.array(cleaned, from_pandas=True)
+    if pa.types.is_null(array.type):
+        # Keep a concrete type, so that pages with values can share the schema of pages without values
+        return pa.array(cleaned, type=pa.string())
+    return array
+
+
+def _is_missing(value) -> bool:
+    return isinstance(value, float) and math.isnan(value)
@@ -0,0 +1,284 @@
+import asyncio
+import os
+import random
+import threading
+from typing import Dict, List
+
+from vortexasdk.abstract_client import AbstractVortexaClient
+from vortexasdk.api.id import ID
+from vortexasdk.client import (
+    _PAGE_RETRIES,
+    VortexaClient,
+    _create_url,
+    _load_api_key,
+    _payload_hash,
+    _with_page,
+    verify_api_key_format,
+)
+from vortexasdk.exceptions import PageFetchException, PartialResultException
+from vortexasdk.json_decoding import decode_json
+from vortexasdk.logger import get_logger
+from vortexasdk.retry_session import _HEADERS
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+logger = get_logger(__name__)
+
+
+class AsyncVortexaClient(AbstractVortexaClient):
+    """
+    An asyncio native API client, calling Vortexa's Public API without blocking the event loop.
+
+    Pages are requested concurrently on the event loop, with at most `max_concurrency` requests in flight at once.
+    No threads are used. The client requires `aiohttp`, installed with `pip install vortexasdk[async]`.
+
+    Connections are bound to the event loop they were opened on, so the client opens a new connection pool
+    whenever it's used on a new event loop, e.g. by successive calls to `asyncio.run`, or in a forked child process.
+
+    Each failed request is retried up to `page_retries` times, as with `VortexaClient`. `search` first loads every
+    other page, then raises a `PartialResultException` holding the records loaded and the failures.
+
+    # Example
+
+    ```python
+    >>> async def load_geography(id):  # doctest: +SKIP
+    ...     async with AsyncVortexaClient(api_key="...") as client:
+    ...         set_async_client(client)
+    ...         return await Geographies().reference_async(id)
+
+    ```
+    """
+
+    _DEFAULT_MAX_CONCURRENCY = 20
+    _BACKOFF_FACTOR = 1
+    _STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+    def __init__(self, **kwargs):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncVortexaClient requires aiohttp. Install it with 'pip install vortexasdk[async]'"
+            )
+        self.api_key = kwargs["api_key"]
+        self._max_concurrency = kwargs.get(
+            "max_concurrency", self._DEFAULT_MAX_CONCURRENCY
+        )
+        self._page_retries = kwargs.get("page_retries", _PAGE_RETRIES)
+        self._session = None
+        self._session_loop = None
+        self._session_pid = None
+
+    async def close(self) -> None:
+        """Close all pooled connections held by the client."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._session_loop = None
+            self._session_pid = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def get_reference(self, resource: str, id: ID) -> List[Dict]:
+        """Lookup reference data."""
+        url = self._create_url(f"{resource}/{id}")
+        response = await self._send("GET", url)
+        return response["data"]
+
+    async def search(self, resource: str, **data) -> List:
+        """Search using `resource` using `**data` as filter params."""
+        url = self._create_url(resource)
+        payload = VortexaClient._cleanse_payload(data)
+        logger.info(f"Payload: {payload}")
+
+        probe_response = await self._send_post_request(
+            url, payload, size=1, offset=0
+        )
+        total = VortexaClient._calculate_total(probe_response)
+        VortexaClient._check_total(total)
+
+        if total == 1:
+            return probe_response["data"]
+        else:
+            size = data.get("size", 1000)
+            offsets = list(range(0, total, size))
+            logger.info(
+                f"{total} Results to retrieve."
+                f" Sending {len(offsets)}"
+                f" post requests with at most {self._max_concurrency} in flight."
+            )
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+
+            async def send(offset: int) -> List:
+                async with semaphore:
+                    response = await self._send_post_request(
+                        url, payload, size, offset
+                    )
+                    return response.get("data", [])
+
+            responses = await asyncio.gather(
+                *[send(o) for o in offsets], return_exceptions=True
+            )
+            pages, failures = [], []
+            for response in responses:
+                if isinstance(response, PageFetchException):
+                    logger.error(f"Page failed: {response}")
+                    failures.append(response)
+                elif isinstance(response, BaseException):
+                    raise response
+                else:
+                    pages.append(response)
+
+            flattened = VortexaClient._flatten_response(pages)
+            if failures:
+                raise PartialResultException(flattened, failures)
+
+            assert len(flattened) == total, (
+                f"Incorrect number of records returned from API. "
+                f"Actual: {len(flattened)}, expected: {total}"
+            )
+            return flattened
+
+    def _create_url(self, path: str) -> str:
+        return _create_url(path, self.api_key)
+
+    def _get_session(self):
+        """The session of the running event loop, opened on first use on each loop, and in each process."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session_loop is not loop
+            or self._session_pid != os.getpid()
+        ):
+            if self._session is not None:
+                # The previous loop or process is gone, and its connections with it
+                logger.debug(
+                    "Event loop or process changed, opening a new session"
+                )
+            self._session = self._create_session()
+            self._session_loop = loop
+            self._session_pid = os.getpid()
+        return self._session
+
+    def _create_session(self):
+        connector = aiohttp.TCPConnector(limit=self._max_concurrency)
+        return aiohttp.ClientSession(connector=connector, headers=_HEADERS)
+
+    async def _send_post_request(self, url, payload, size, offset) -> Dict:
+        logger.debug(f"Sending post request, offset: {offset}, size: {size}")
+
+        return await self._send(
+            "POST", url, json=_with_page(payload, size, offset)
+        )
+
+    async def _send(self, method: str, url: str, json: Dict = None) -> Dict:
+        """Send a request, retrying with jittered exponential backoff on connection errors, timeouts and `_STATUS_FORCELIST`."""
+        session = self._get_session()
+        for attempt in range(self._page_retries + 1):
+            is_last_attempt = attempt == self._page_retries
+            try:
+                async with session.request(method, url, json=json) as response:
+                    if (
+                        response.status in self._STATUS_FORCELIST
+                        and not is_last_attempt
+                    ):
+                        logger.debug(
+                            f"Retrying request, got status {response.status}"
+                        )
+                    else:
+                        return await _handle_response(response, json)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if is_last_attempt:
+                    raise PageFetchException(
+                        f"Request failed: {e}",
+                        offset=(json or {}).get("offset"),
+                        payload_hash=_payload_hash(json or {}),
+                    ) from e
+                logger.debug(f"Retrying request, got exception {e}")
+
+            await asyncio.sleep(
+                self._BACKOFF_FACTOR
+                * (2 ** attempt)
+                * random.uniform(0.5, 1.5)
+            )
+
+
+async def _handle_response(response, payload: Dict = None) -> Dict:
+    """Decode the response, raising a `PageFetchException` if the request failed or the response isn't JSON."""
+    payload = payload or {}
+    offset = payload.get("offset")
+
+    if response.status >= 400:
+        logger.debug(f"payload: {payload}")
+        # noinspection PyBroadException
+        try:
+            logger.debug(await response.text())
+        except Exception:
+            pass
+
+        raise PageFetchException(
+            f"Request failed: {response.reason}",
+            status_code=response.status,
+            offset=offset,
+            payload_hash=_payload_hash(payload),
+        )
+
+    try:
+        return decode_json(await response.read())
+    except ValueError as e:
+        raise PageFetchException(
+            f"Could not decode response: {e}",
+            offset=offset,
+            payload_hash=_payload_hash(payload),
+        ) from e
+
+
+__async_client__ = None
+__async_client_lock__ = threading.Lock()
+
+
+def _reset_async_client_lock() -> None:
+    # A thread of the parent may have held the lock while forking, the child starts with a released lock
+    global __async_client_lock__
+    __async_client_lock__ = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_async_client_lock)
+
+
+def default_async_client() -> AsyncVortexaClient:
+    """Instantiate AsyncVortexaClient as global variable, once, whatever the number of threads calling."""
+    global __async_client__
+
+    if __async_client__ is None:
+        with __async_client_lock__:
+            if __async_client__ is None:
+                __async_client__ = create_async_client()
+
+    return __async_client__
+
+
+def create_async_client(**kwargs) -> AsyncVortexaClient:
+    """Create new AsyncVortexaClient."""
+    logger.info("Creating new AsyncVortexaClient")
+
+    api_key = _load_api_key()
+    verify_api_key_format(api_key)
+
+    return AsyncVortexaClient(api_key=api_key, **kwargs)
+
+
+def set_async_client(client) -> None:
+    """Set the global async client, used by all `*_async` endpoint methods."""
+    global __async_client__
+    with __async_client_lock__:
+        __async_client__ = client
+    logger.debug(
+        f"global __async_client__ has been set {__async_client__.__class__.__name__} \n"
+    )
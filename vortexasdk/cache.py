@@ -0,0 +1,274 @@
+"""
+Cache API responses on local disk, in a SQLite database.
+
+Reference data (geographies, products, vessels, corporations, attributes) changes slowly, so responses can be reused
+across processes instead of being downloaded again at each start up.
+Responses are keyed on the resource and a canonical form of the payload, and expire after a per-resource TTL.
+The least recently used responses are evicted once the cache holds more than `max_entries` responses.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from vortexasdk.config import CACHE_DIR, CACHE_MAX_ENTRIES
+from vortexasdk.endpoints.endpoints import (
+    ATTRIBUTES_REFERENCE,
+    CORPORATIONS_REFERENCE,
+    GEOGRAPHIES_REFERENCE,
+    PRODUCTS_REFERENCE,
+    VESSELS_REFERENCE,
+)
+from vortexasdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+_ONE_DAY = 24 * 60 * 60
+
+# Time to live of cached responses, in seconds. Responses of resources not listed here aren't cached.
+DEFAULT_TTLS: Dict[str, float] = {
+    ATTRIBUTES_REFERENCE: 7 * _ONE_DAY,
+    CORPORATIONS_REFERENCE: _ONE_DAY,
+    GEOGRAPHIES_REFERENCE: 7 * _ONE_DAY,
+    PRODUCTS_REFERENCE: 7 * _ONE_DAY,
+    VESSELS_REFERENCE: _ONE_DAY,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    resource TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+)
+"""
+
+
+class ResponseCache:
+    """
+    Cache of API responses, stored in a SQLite database.
+
+    # Arguments
+        path: The SQLite database file, created if it doesn't exist.
+        ttls: Time to live of cached responses in seconds, keyed by resource. Only the listed resources are cached.
+        max_entries: The maximum number of responses held, least recently used responses are evicted first.
+
+    # Example
+
+    ```python
+    >>> from vortexasdk.cache import ResponseCache, set_cache
+    >>> set_cache(ResponseCache("/tmp/vortexasdk-cache.sqlite")) # doctest: +SKIP
+    >>> df = Vessels().load_all().to_df() # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Dict[str, float] = None,
+        max_entries: int = CACHE_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+
+    def is_cached(self, resource: str) -> bool:
+        """Check whether responses of `resource` are cached."""
+        return resource in self.ttls
+
+    def get(self, resource: str, payload: Dict) -> Optional[Any]:
+        """Return the cached response of `resource` for `payload`, or `None` if no unexpired response is cached."""
+        if not self.is_cached(resource):
+            return None
+
+        key = cache_key(resource, payload)
+        now = time.time()
+
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                logger.debug(f"Cache miss for {resource}")
+                return None
+
+            value, expires_at = row
+            if expires_at <= now:
+                logger.debug(f"Cached response for {resource} has expired")
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key = ?", (key,)
+                )
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET last_used_at = ? WHERE key = ?",
+                (now, key),
+            )
+
+        logger.debug(f"Cache hit for {resource}")
+        return json.loads(value)
+
+    def set(self, resource: str, payload: Dict, value: Any) -> None:
+        """Cache the response of `resource` for `payload`, evicting the least recently used responses if needed."""
+        if not self.is_cached(resource):
+            return
+
+        key = cache_key(resource, payload)
+        now = time.time()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    resource,
+                    # Lazy sequences of records are cached as lists
+                    json.dumps(value, default=list),
+                    now + self.ttls[resource],
+                    now,
+                ),
+            )
+            self._evict()
+
+    def invalidate(self, resource: str = None) -> None:
+        """
+        Remove cached responses.
+
+        # Arguments
+            resource: Only remove the responses of this resource. All responses are removed by default.
+
+        """
+        from vortexasdk.conversions.conversions import clear_resolved_ids
+
+        clear_resolved_ids(resource)
+        with self._lock, self._connection:
+            if resource is None:
+                logger.info("Invalidating all cached responses")
+                self._connection.execute("DELETE FROM responses")
+            else:
+                logger.info(f"Invalidating cached responses for {resource}")
+                self._connection.execute(
+                    "DELETE FROM responses WHERE resource = ?", (resource,)
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the SQLite database."""
+        self._connection.close()
+
+    def _evict(self) -> None:
+        self._connection.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+        )
+        self._connection.execute(
+            """
+            DELETE FROM responses WHERE key NOT IN (
+                SELECT key FROM responses ORDER BY last_used_at DESC LIMIT ?
+            )
+            """,
+            (self.max_entries,),
+        )
+
+
+def cache_key(resource: str, payload: Dict) -> str:
+    """Hash `resource` and `payload` into a key, independent of the order of the payload's keys."""
+    canonical = json.dumps(
+        {"resource": resource, "payload": _canonical(payload)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _canonical(payload: Dict) -> Dict:
+    # `None` values aren't sent to the API, so payloads only differing by `None` values get the same response.
+    return {k: v for k, v in payload.items() if v is not None}
+
+
+__cache__: Optional[ResponseCache] = None
+__cache_loaded__ = False
+
+
+def default_cache() -> Optional[ResponseCache]:
+    """
+    Return the global cache, used by all endpoints.
+
+    No cache is used by default, unless the `VORTEXA_CACHE_DIR` environment variable is set.
+    """
+    global __cache__, __cache_loaded__
+
+    if not __cache_loaded__:
+        __cache_loaded__ = True
+        if CACHE_DIR is not None and __cache__ is None:
+            __cache__ = create_cache(CACHE_DIR)
+
+    return __cache__
+
+
+def create_cache(cache_dir: str) -> ResponseCache:
+    """Create a new `ResponseCache`, storing responses in `cache_dir`."""
+    logger.info(f"Caching reference data in {cache_dir}")
+    os.makedirs(cache_dir, exist_ok=True)
+    return ResponseCache(os.path.join(cache_dir, "responses.sqlite"))
+
+
+def set_cache(cache: Optional[ResponseCache]) -> None:
+    """Set the global cache, used by all endpoints. Pass `None` to disable caching."""
+    from vortexasdk.conversions.conversions import clear_resolved_ids
+
+    global __cache__, __cache_loaded__
+    __cache__ = cache
+    __cache_loaded__ = True
+    clear_resolved_ids()
+    logger.debug(f"global __cache__ has been set to {cache}")
+
+
+def cached_response(
+    resource: str, payload: Dict, load: Callable[[], Any]
+) -> Any:
+    """Return the cached response of `resource` for `payload`, calling `load` to load and cache missing responses."""
+    cache = default_cache()
+    if cache is None or not cache.is_cached(resource):
+        return load()
+
+    cached = cache.get(resource, payload)
+    if cached is not None:
+        return cached
+
+    response = load()
+    cache.set(resource, payload, response)
+    return response
+
+
+async def cached_response_async(
+    resource: str, payload: Dict, load: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Awaitable variant of `cached_response`, awaiting `load` to load and cache missing responses."""
+    cache = default_cache()
+    if cache is None or not cache.is_cached(resource):
+        return await load()
+
+    cached = cache.get(resource, payload)
+    if cached is not None:
+        return cached
+
+    response = await load()
+    cache.set(resource, payload, response)
+    return response
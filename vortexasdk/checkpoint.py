@@ -0,0 +1,145 @@
+"""
+Save each loaded page of a search to local disk, so an interrupted search resumes where it stopped.
+
+Each search gets its own directory, named after a hash of the search, holding one gzipped JSON file per page,
+and a `manifest.json` listing the saved pages. Once all pages are loaded, the directory is removed.
+
+Pages are keyed on their window payload and offset, so a search still resumes when more records match it than
+when it was interrupted. The total saved with each page is checked against the search's total when resuming.
+"""
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+from typing import Dict, List, Optional
+
+from vortexasdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+_MANIFEST = "manifest.json"
+
+
+class Checkpoint:
+    """
+    Pages of a search saved to `directory`.
+
+    # Arguments
+        directory: The directory holding the saved pages, created if it doesn't exist.
+
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._manifest = self._read_manifest()
+
+        if self._manifest["pages"]:
+            logger.info(
+                f"Resuming search from {len(self._manifest['pages'])} pages saved in {directory}"
+            )
+
+    @classmethod
+    def for_search(cls, checkpoint_dir: str, url: str, data: Dict):
+        """The checkpoint of the search sent to `url` with `data`, stored in a subdirectory of `checkpoint_dir`."""
+        resource = url.split("?")[0]
+        search_hash = _hash({"resource": resource, "data": data})
+
+        return cls(os.path.join(checkpoint_dir, search_hash[:16]))
+
+    def __len__(self) -> int:
+        return len(self._manifest["pages"])
+
+    @staticmethod
+    def page_key(payload: Dict, offset: int) -> str:
+        """Identify a page by its window payload and offset."""
+        return _hash([payload, offset])
+
+    def load(
+        self, key: str, total: int = None, expected: int = None
+    ) -> Optional[List]:
+        """
+        Return the records of a saved page, or `None` if the page isn't saved.
+
+        If the window's `total` changed since the page was saved, the page is only reused if it holds the
+        `expected` number of records, otherwise it must be loaded again.
+        """
+        with self._lock:
+            page = self._manifest["pages"].get(key)
+
+        if page is None:
+            return None
+
+        saved_total = page.get("total")
+        if total is not None and saved_total != total:
+            if expected is not None and page["records"] != expected:
+                logger.info(
+                    f"Search total changed from {saved_total} to {total}, loading page at offset {page['offset']} again"
+                )
+                return None
+            logger.warning(
+                f"Search total changed from {saved_total} to {total} since page at offset {page['offset']} was saved,"
+                f" records may have moved between pages"
+            )
+
+        try:
+            with gzip.open(self._path(page["file"]), "rt") as f:
+                records = json.load(f)
+        except (OSError, EOFError, ValueError):
+            logger.warning(
+                f"Could not read page at offset {page['offset']}, loading it again"
+            )
+            return None
+
+        logger.debug(f"Loaded page at offset {page['offset']} from disk")
+        return records
+
+    def save(
+        self, key: str, offset: int, records: List, total: int = None
+    ) -> None:
+        """Save the records of a page, loaded while the window matched `total` records, and add it to the manifest."""
+        file = f"page-{key[:16]}.json.gz"
+
+        tmp = self._path(f"{file}.tmp")
+        with gzip.open(tmp, "wt") as f:
+            json.dump(records, f)
+        os.replace(tmp, self._path(file))
+
+        with self._lock:
+            self._manifest["pages"][key] = {
+                "file": file,
+                "offset": offset,
+                "records": len(records),
+                "total": total,
+            }
+            self._write_manifest()
+
+    def clear(self) -> None:
+        """Remove the saved pages, once the search has completed."""
+        logger.debug(f"Removing checkpoint {self.directory}")
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _read_manifest(self) -> Dict:
+        try:
+            with open(self._path(_MANIFEST)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"pages": {}}
+
+    def _write_manifest(self) -> None:
+        tmp = self._path(f"{_MANIFEST}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._manifest, f)
+        os.replace(tmp, self._path(_MANIFEST))
+
+    def _path(self, file: str) -> str:
+        return os.path.join(self.directory, file)
+
+
+def _hash(value) -> str:
+    canonical = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
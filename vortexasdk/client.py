@@ -1,107 +1,590 @@
 import copy
 import functools
 import getpass
+import hashlib
+import json
 import os
-from json import JSONDecodeError
-from multiprocessing.pool import ThreadPool
-from random import shuffle
-from typing import Dict, List
+import random
+import threading
+import time
+from collections import deque
+from multiprocessing.pool import AsyncResult, ThreadPool
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 import uuid
 
-from requests import Response
-from tqdm import tqdm
+from requests import Response, Session
+from requests.exceptions import ChunkedEncodingError, ConnectionError, Timeout
 
 from vortexasdk.abstract_client import AbstractVortexaClient
+from vortexasdk.adaptive import AdaptiveController, is_congestion
 from vortexasdk.api.id import ID
+from vortexasdk.checkpoint import Checkpoint
+from vortexasdk.config import VERSION_CHECK, VERSION_CHECK_FILE
 from vortexasdk.endpoints.endpoints import API_URL
+from vortexasdk.exceptions import (
+    MissingPagesException,
+    PageFetchException,
+    PartialResultException,
+)
+from vortexasdk.json_decoding import decode_json
+from vortexasdk.lazy_records import LazyRecords, RawPage
 from vortexasdk.logger import get_logger
 from vortexasdk.retry_session import (
+    create_pooled_session,
     retry_get,
     retry_post,
 )
+from vortexasdk.sharding import (
+    TIME_MAX_KEY,
+    TIME_MIN_KEY,
+    deduplicate_pages,
+    deduplicate_records,
+    get_record_id,
+    has_time_window,
+    split_time_window,
+    with_time_window,
+)
+from vortexasdk.single_flight import SingleFlight
 from vortexasdk.utils import filter_empty_values, is_sdk_version_outdated
 from vortexasdk.version import __version__
 from vortexasdk import __name__ as sdk_pkg_name
 
+if TYPE_CHECKING:
+    from tqdm import tqdm
+
 logger = get_logger(__name__)
 
+# Attempts at loading a complete page, when saving pages to a checkpoint.
+_MAX_CHECKPOINTED_PAGE_ATTEMPTS = 3
+
+# Retries of each failed request, on throttling (429), server errors (5xx), connection errors and invalid responses.
+_PAGE_RETRIES = 3
+_PAGE_BACKOFF_FACTOR = 1
+
 
 class VortexaClient(AbstractVortexaClient):
-    """The API client responsible for calling Vortexa's Public API."""
+    """
+    The API client responsible for calling Vortexa's Public API.
+
+    The client owns a pool of keep-alive HTTP connections, shared by all the threads used to load pages in parallel.
+    The pool holds `pool_size` connections, defaulting to one connection per thread.
+    Call `close()` to release the connections, or use the client as a context manager.
+
+    With `adaptive=True`, the number of concurrent page requests and the size of each page are tuned as pages load,
+    see `vortexasdk.adaptive`. The controller's decisions are logged, and its measurements are returned by
+    `client.controller.metrics()`.
+
+    With `checkpoint_dir` set, each loaded page is saved to disk, see `vortexasdk.checkpoint`. Incomplete pages are
+    retried, and a search that fails or is interrupted resumes from its saved pages when run again.
+    Checkpoints use fixed page sizes, so can't be combined with `adaptive=True`.
+
+    Each failed request is retried up to `page_retries` times, with jittered exponential backoff. In adaptive mode,
+    throttled pages and requests failing without a response draw from the same `page_retries` budget. Pages still
+    failing raise a `PageFetchException`. `search` first loads every other page, then raises a
+    `PartialResultException` holding the records loaded and the failures.
+
+    With `consistent=True`, `search` checks that records didn't change while pages were loading: each page's
+    `total` must match the search's latest total, and neighbouring pages mustn't share movement IDs. Pages failing
+    these checks are loaded again, up to `_MAX_CONSISTENCY_PASSES` times, and records are de-duplicated on their
+    movement ID. Consistent searches can't be combined with `adaptive` or `checkpoint_dir`.
+
+    With `lazy=True`, `search` keeps each page as the undecoded response body, and returns a `LazyRecords` sequence
+    decoding a page only when one of its records is accessed, see `vortexasdk.lazy_records`. Searches split into
+    several time windows are still decoded as they load, to remove duplicate records.
+
+    Identical concurrent calls to `search` and `get_reference`, with the same resource and payload, share a single
+    request and its result, each caller getting its own copy of the records, see `vortexasdk.single_flight`.
+    With `memo_ttl` set, results are also reused for
+    `memo_ttl` seconds after their request completed. Pass `coalesce=False` to send every call separately.
+
+    Clients are fork-aware: a client used in a forked child process opens its own connection pool, rather than
+    sharing the parent's connections.
+
+    # Example
+
+    ```python
+    >>> with VortexaClient(api_key="...") as client: # doctest: +SKIP
+    ...     set_client(client)
+    ...     df = CargoMovements().search(filter_activity="loading_state").to_df()
+
+    ```
+    """
 
     _DEFAULT_PAGE_LOAD_SIZE = int(1e4)
     _N_THREADS = 6
+    _MAX_PAGES_IN_FLIGHT = 2 * _N_THREADS
     _MAX_ALLOWED_TOTAL = int(1e6)
+    _MAX_CONSISTENCY_PASSES = 4
 
     def __init__(self, **kwargs):
         self.api_key = kwargs["api_key"]
+        self.controller: Optional[AdaptiveController] = (
+            AdaptiveController(
+                max_concurrency=kwargs.get("max_concurrency", 16),
+                initial_concurrency=self._N_THREADS,
+                max_page_size=self._DEFAULT_PAGE_LOAD_SIZE,
+            )
+            if kwargs.get("adaptive", False)
+            else None
+        )
+        self._pool_size = kwargs.get(
+            "pool_size",
+            self.controller.max_concurrency
+            if self.controller is not None
+            else self._N_THREADS,
+        )
+        self._session = create_pooled_session(pool_maxsize=self._pool_size)
+        self._pid = os.getpid()
+
+        self._page_retries = kwargs.get("page_retries", _PAGE_RETRIES)
+        self._checkpoint_dir = kwargs.get("checkpoint_dir", None)
+        if self._checkpoint_dir is not None and self.controller is not None:
+            raise ValueError(
+                "checkpoint_dir can't be combined with adaptive=True, checkpoints require fixed page sizes."
+            )
+
+        self._consistent = kwargs.get("consistent", False)
+        if self._consistent and (
+            self._checkpoint_dir is not None or self.controller is not None
+        ):
+            raise ValueError(
+                "consistent=True can't be combined with adaptive=True or checkpoint_dir."
+            )
+
+        self._lazy = kwargs.get("lazy", False)
+
+        self.single_flight: Optional[SingleFlight] = (
+            SingleFlight(memo_ttl=kwargs.get("memo_ttl", 0))
+            if kwargs.get("coalesce", True)
+            else None
+        )
+
+    def close(self) -> None:
+        """Close all pooled connections held by the client."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def get_reference(self, resource: str, id: ID) -> List[Dict]:
         """Lookup reference data."""
-        url = self._create_url(f"{resource}/{id}")
-        response = retry_get(url)
-        return _handle_response(response)["data"]
+        return self._coalesced(
+            "get_reference",
+            resource,
+            {"id": id},
+            lambda: self._get_reference(resource, id),
+        )
 
     def search(self, resource: str, **data) -> List:
-        """Search using `resource` using `**data` as filter params."""
-        url = self._create_url(resource)
-        payload = self._cleanse_payload(data)
-        logger.info(f"Payload: {payload}")
+        """
+        Search using `resource` using `**data` as filter params.
 
-        probe_response = _send_post_request(url, payload, size=1, offset=0)
-        total = self._calculate_total(probe_response)
+        Searches matching more than `_MAX_ALLOWED_TOTAL` records are split into smaller time windows,
+        which are loaded in parallel, then merged. Records returned by more than one window are removed.
+        """
+        return self._coalesced(
+            "search", resource, data, lambda: self._search(resource, **data)
+        )
 
-        if total > self._MAX_ALLOWED_TOTAL:
-            raise Exception(
-                f"Attempting to query too many records at once. Attempted records: {total}, Max allowed records: {self._MAX_ALLOWED_TOTAL} . "
-                f"Try reducing the date range to return fewer records."
-            )
-        elif total == 1:
+    def _coalesced(self, method: str, resource: str, data: Dict, load):
+        """Call `load`, sharing its result with identical concurrent calls. Each caller gets its own copy of the records."""
+        self._after_fork()
+        if self.single_flight is None:
+            return load()
+
+        key = (method, resource, json.dumps(data, sort_keys=True, default=str))
+        return self.single_flight.do(key, load, copy=_copy_records)
+
+    def _after_fork(self) -> None:
+        """Open a new connection pool in a forked child, connections inherited from the parent being shared."""
+        if self._pid == os.getpid():
+            return
+
+        logger.debug("Process forked, opening a new connection pool")
+        self._pid = os.getpid()
+        self._session = create_pooled_session(pool_maxsize=self._pool_size)
+        if self.single_flight is not None:
+            self.single_flight = SingleFlight(self.single_flight.memo_ttl)
+
+    def _get_reference(self, resource: str, id: ID) -> List[Dict]:
+        url = self._create_url(f"{resource}/{id}")
+        response = _with_retries(
+            lambda: _handle_response(
+                _get(url, {"id": id}, self._session), {"id": id}
+            ),
+            self._page_retries,
+        )
+        return response["data"]
+
+    def _search(self, resource: str, **data) -> List:
+        url, payload, probe_response, total = self._probe(resource, data)
+
+        if total == 1:
             # Only one page response, no need to send another request, so return flattened response
             return probe_response["data"]
         else:
             # Multiple pages available, create offsets and fetch all responses
+            windows = self._plan_time_windows(url, payload, total)
+            if self._consistent:
+                return self._search_consistently(url, windows, data)
+
             responses = self._process_multiple_pages(
-                total=total, url=url, payload=payload, data=data
+                url=url, windows=windows, data=data
             )
+            if self._lazy and len(windows) == 1:
+                return LazyRecords(responses)
+
             flattened = self._flatten_response(responses)
-            assert len(flattened) == total, (
+            expected = sum(window_total for _, window_total in windows)
+            assert len(flattened) == expected, (
                 f"Incorrect number of records returned from API. "
-                f"Actual: {len(flattened)}, expected: {total}"
+                f"Actual: {len(flattened)}, expected: {expected}"
             )
+            if len(windows) > 1:
+                return deduplicate_records(flattened)
             return flattened
 
+    def iter_pages(self, resource: str, **data) -> Iterator[List]:
+        """
+        Search using `resource` using `**data` as filter params, yielding each page of records as soon as it's loaded.
+
+        Pages are yielded in order. At most `_MAX_PAGES_IN_FLIGHT` pages are requested ahead of the page being
+        consumed, so memory use stays constant regardless of the number of records matching the search.
+        """
+        self._after_fork()
+        url, payload, probe_response, total = self._probe(resource, data)
+
+        if total == 1:
+            yield probe_response["data"]
+        else:
+            windows = self._plan_time_windows(url, payload, total)
+            pages = self._iter_multiple_pages(
+                url=url, windows=windows, data=data
+            )
+            if len(windows) > 1:
+                pages = deduplicate_pages(pages)
+            yield from pages
+
     def _create_url(self, path: str) -> str:
-        return (
-            f"{API_URL}{path}?_sdk=python_v{__version__}&apikey={self.api_key}"
+        return _create_url(path, self.api_key)
+
+    def _probe(self, resource: str, data: Dict) -> Tuple[str, Dict, Dict, int]:
+        """Request a single record, to find the total number of records matching the search."""
+        url = self._create_url(resource)
+        payload = self._cleanse_payload(data)
+        logger.info(f"Payload: {payload}")
+
+        probe_response = _send_post_request(
+            url,
+            payload,
+            size=1,
+            offset=0,
+            session=self._session,
+            retries=self._page_retries,
         )
+        total = self._calculate_total(probe_response)
 
-    def _process_multiple_pages(
-        self, total: int, url: str, payload: Dict, data: Dict
+        return url, payload, probe_response, total
+
+    def _plan_time_windows(
+        self, url: str, payload: Dict, total: int
+    ) -> List[Tuple[Dict, int]]:
+        """
+        Recursively split the search time window, until each window matches at most `_MAX_ALLOWED_TOTAL` records.
+
+        Returns a list of `(payload, total)` pairs, one per time window.
+        """
+        if total <= self._MAX_ALLOWED_TOTAL:
+            return [(payload, total)]
+
+        if not has_time_window(payload):
+            self._check_total(total)
+
+        logger.info(
+            f"{total} records match the search, more than the {self._MAX_ALLOWED_TOTAL} allowed in a single search."
+            f" Splitting time window {payload[TIME_MIN_KEY]} - {payload[TIME_MAX_KEY]}"
+        )
+
+        windows = []
+        for time_min, time_max in split_time_window(
+            payload[TIME_MIN_KEY], payload[TIME_MAX_KEY]
+        ):
+            window_payload = with_time_window(payload, time_min, time_max)
+            probe_response = _send_post_request(
+                url,
+                window_payload,
+                size=1,
+                offset=0,
+                session=self._session,
+                retries=self._page_retries,
+            )
+            window_total = self._calculate_total(probe_response)
+            windows += self._plan_time_windows(
+                url, window_payload, window_total
+            )
+
+        return windows
+
+    def _search_consistently(
+        self, url: str, windows: List[Tuple[Dict, int]], data: Dict
     ) -> List:
         size = data.get("size", 1000)
+        with ThreadPool(self._N_THREADS) as pool:
+            records = [
+                record
+                for payload, total in windows
+                for record in self._load_consistent_window(
+                    pool, url, payload, total, size
+                )
+            ]
+
+        return deduplicate_records(records)
+
+    def _load_consistent_window(
+        self, pool: ThreadPool, url: str, payload: Dict, total: int, size: int
+    ) -> List:
+        """
+        Load all pages of a time window, loading pages again until all pages agree with the window's latest total.
+
+        Returns the window's records, de-duplicated on their movement ID.
+        """
+        pages: Dict[int, Tuple[List, int]] = {}
         offsets = list(range(0, total, size))
-        shuffle(offsets)
+
+        for n_pass in range(self._MAX_CONSISTENCY_PASSES):
+            func = functools.partial(
+                _send_offset_post_request,
+                url=url,
+                payload=payload,
+                size=size,
+                session=self._session,
+                retries=self._page_retries,
+            )
+            for offset, response in zip(offsets, pool.map(func, offsets)):
+                pages[offset] = (
+                    response.get("data", []),
+                    self._calculate_total(response),
+                )
+
+            total = self._calculate_total(
+                _send_post_request(
+                    url,
+                    payload,
+                    size=1,
+                    offset=0,
+                    session=self._session,
+                    retries=self._page_retries,
+                )
+            )
+            offsets = _inconsistent_offsets(pages, total, size)
+            if len(offsets) == 0:
+                break
+
+            logger.warning(
+                f"Records changed while loading, the search now matches {total} records."
+                f" Loading {len(offsets)} pages again, pass {n_pass + 2} of {self._MAX_CONSISTENCY_PASSES}"
+            )
+        else:
+            logger.warning(
+                f"Records kept changing while loading, after {self._MAX_CONSISTENCY_PASSES} passes."
+                f" Some records may be missing."
+            )
+
+        return deduplicate_records(
+            [
+                record
+                for offset in sorted(pages)
+                if offset < total
+                for record in pages[offset][0]
+            ]
+        )
+
+    def _process_multiple_pages(
+        self, url: str, windows: List[Tuple[Dict, int]], data: Dict
+    ) -> List:
+        """Load all pages, raising a `PartialResultException` once all pages are done if any page failed."""
+        pages, failures = [], []
+        for page in self._iter_multiple_pages(
+            url=url,
+            windows=windows,
+            data=data,
+            raise_on_failure=False,
+            lazy=self._lazy,
+        ):
+            if isinstance(page, PageFetchException):
+                failures.append(page)
+            else:
+                pages.append(page)
+
+        if failures:
+            raise PartialResultException(
+                self._flatten_response(pages), failures
+            )
+
+        return pages
+
+    def _iter_multiple_pages(
+        self,
+        url: str,
+        windows: List[Tuple[Dict, int]],
+        data: Dict,
+        raise_on_failure: bool = True,
+        lazy: bool = False,
+    ) -> Iterator[List]:
+        """
+        Yield pages in order. Failed pages raise, or are yielded as `PageFetchException`s if not `raise_on_failure`.
+
+        With `lazy`, pages loaded without a checkpoint are yielded as undecoded `RawPage`s.
+        """
+        if self.controller is not None:
+            yield from self._iter_adaptive_pages(
+                url, windows, data, raise_on_failure
+            )
+            return
+
+        size = data.get("size", 1000)
+        requests = [
+            (payload, window_total, offset)
+            for payload, window_total in windows
+            for offset in range(0, window_total, size)
+        ]
+        from tqdm import tqdm
+
+        total = sum(window_total for _, window_total in windows)
+
+        checkpoint = (
+            Checkpoint.for_search(self._checkpoint_dir, url, data)
+            if self._checkpoint_dir is not None
+            else None
+        )
 
         with tqdm(
-            total=total, desc="Loading from API", disable=(len(offsets) == 1)
+            total=total, desc="Loading from API", disable=(len(requests) == 1)
         ) as pbar:
             with ThreadPool(self._N_THREADS) as pool:
                 logger.info(
                     f"{total} Results to retrieve."
-                    f" Sending {len(offsets)}"
+                    f" Sending {len(requests)}"
                     f" post requests in parallel using {self._N_THREADS} threads."
                 )
 
+                if checkpoint is not None:
+                    send = _send_checkpointed_post_request_data
+                elif lazy:
+                    send = _send_raw_post_request_data
+                else:
+                    send = _send_post_request_data
+
                 func = functools.partial(
-                    _send_post_request_data,
+                    send,
                     url=url,
-                    payload=payload,
                     size=size,
                     progress_bar=pbar,
+                    session=self._session,
+                    retries=self._page_retries,
                 )
+                if checkpoint is not None:
+                    func = functools.partial(func, checkpoint=checkpoint)
+
+                # Keep a bounded window of requests in flight, so a slow consumer applies back-pressure
+                in_flight: Deque[AsyncResult] = deque()
+                for payload, window_total, offset in requests:
+                    kwds = {"payload": payload}
+                    if checkpoint is not None or lazy:
+                        kwds["total"] = window_total
+                    in_flight.append(pool.apply_async(func, (offset,), kwds))
+                    if len(in_flight) >= self._MAX_PAGES_IN_FLIGHT:
+                        yield _page_result(
+                            in_flight.popleft(), raise_on_failure
+                        )
+
+                while in_flight:
+                    yield _page_result(in_flight.popleft(), raise_on_failure)
+
+        if checkpoint is not None:
+            checkpoint.clear()
+
+    def _iter_adaptive_pages(
+        self,
+        url: str,
+        windows: List[Tuple[Dict, int]],
+        data: Dict,
+        raise_on_failure: bool = True,
+    ) -> Iterator[List]:
+        """
+        Load pages in order, carving each page's offset and size as it's requested.
+
+        The size of each page, and the number of pages requested concurrently, are set by the adaptive controller.
+        """
+        controller = self.controller
+        max_size = data.get("size", 1000)
+        pages = self._carve_pages(windows, max_size)
+        from tqdm import tqdm
 
-                return pool.map(func, offsets)
+        total = sum(window_total for _, window_total in windows)
+
+        with tqdm(
+            total=total, desc="Loading from API", disable=(total <= max_size)
+        ) as pbar:
+            with ThreadPool(controller.max_concurrency) as pool:
+                logger.info(
+                    f"{total} Results to retrieve."
+                    f" Starting with {controller.concurrency} concurrent requests,"
+                    f" {controller.page_size_for(max_size)} results per request."
+                )
+
+                func = functools.partial(
+                    _send_adaptive_post_request_data,
+                    url=url,
+                    controller=controller,
+                    progress_bar=pbar,
+                    session=self._session,
+                    retries=self._page_retries,
+                )
+
+                in_flight: Deque[AsyncResult] = deque()
+                for payload, offset, size in pages:
+                    in_flight.append(
+                        pool.apply_async(
+                            func,
+                            (offset,),
+                            {"payload": payload, "size": size},
+                        )
+                    )
+                    while len(in_flight) >= controller.concurrency:
+                        yield _page_result(
+                            in_flight.popleft(), raise_on_failure
+                        )
+
+                while in_flight:
+                    yield _page_result(in_flight.popleft(), raise_on_failure)
+
+        logger.info(f"Adaptive controller metrics: {controller.metrics()}")
+
+    def _carve_pages(
+        self, windows: List[Tuple[Dict, int]], max_size: int
+    ) -> Iterator[Tuple[Dict, int, int]]:
+        """Lazily split each window into `(payload, offset, size)` pages, sized by the controller."""
+        for payload, total in windows:
+            offset = 0
+            while offset < total:
+                size = self.controller.page_size_for(max_size)
+                yield payload, offset, size
+                offset += size
 
     @staticmethod
     def _cleanse_payload(payload: Dict) -> Dict:
@@ -110,6 +593,15 @@ class VortexaClient(AbstractVortexaClient):
 
         return filter_empty_values(payload)
 
+    @classmethod
+    def _check_total(cls, total: int) -> None:
+        """Raise if `total` records are more than a single search can load."""
+        if total > cls._MAX_ALLOWED_TOTAL:
+            raise Exception(
+                f"Attempting to query too many records at once. Attempted records: {total}, Max allowed records: {cls._MAX_ALLOWED_TOTAL} . "
+                f"Try reducing the date range to return fewer records."
+            )
+
     @staticmethod
     def _calculate_total(response: Dict) -> int:
         """ Get total number of pages, if total key does not exist, return 1 """
@@ -120,8 +612,60 @@ class VortexaClient(AbstractVortexaClient):
         return [x for y in response for x in y]
 
 
+def _copy_records(records):
+    if isinstance(records, LazyRecords):
+        return records.copy()
+    return copy.deepcopy(records)
+
+
+def _page_result(result: AsyncResult, raise_on_failure: bool):
+    try:
+        return result.get()
+    except PageFetchException as e:
+        if raise_on_failure:
+            raise
+        logger.error(f"Page failed: {e}")
+        return e
+
+
+def _send_offset_post_request(
+    offset, url, payload, size, session=None, retries: int = _PAGE_RETRIES
+) -> Dict:
+    return _send_post_request(url, payload, size, offset, session, retries)
+
+
+def _inconsistent_offsets(
+    pages: Dict[int, Tuple[List, int]], total: int, size: int
+) -> List[int]:
+    """
+    Find the offsets of pages to load again: pages missing, pages loaded while the search matched a different
+    total, and neighbouring pages sharing a movement ID.
+    """
+    offsets = list(range(0, total, size))
+    inconsistent: Set[int] = {
+        offset
+        for offset in offsets
+        if offset not in pages or pages[offset][1] != total
+    }
+
+    for previous, offset in zip(offsets, offsets[1:]):
+        if previous in pages and offset in pages:
+            previous_ids = {get_record_id(r) for r in pages[previous][0]}
+            ids = {get_record_id(r) for r in pages[offset][0]}
+            if (previous_ids & ids) - {None}:
+                inconsistent.update({previous, offset})
+
+    return sorted(inconsistent)
+
+
 def _send_post_request_data(
-    offset, url, payload, size, progress_bar: tqdm
+    offset,
+    url,
+    payload,
+    size,
+    progress_bar: "tqdm",
+    session: Session = None,
+    retries: int = _PAGE_RETRIES,
 ) -> List:
     # noinspection PyBroadException
     try:
@@ -129,14 +673,243 @@ def _send_post_request_data(
     except Exception:
         logger.warn("Could not update progress bar")
 
-    dict_response = _send_post_request(url, payload, size, offset)
+    dict_response = _send_post_request(
+        url, payload, size, offset, session, retries
+    )
 
     return dict_response.get("data", [])
 
 
-def _send_post_request(url, payload, size, offset) -> Dict:
+def _send_raw_post_request_data(
+    offset,
+    url,
+    payload,
+    size,
+    total,
+    progress_bar: "tqdm",
+    session: Session = None,
+    retries: int = _PAGE_RETRIES,
+) -> RawPage:
+    """Load a page, keeping the response body undecoded."""
+    # noinspection PyBroadException
+    try:
+        progress_bar.update(size)
+    except Exception:
+        logger.warn("Could not update progress bar")
+
+    content = _send_post_request(
+        url, payload, size, offset, session, retries, decode=False
+    )
+
+    return RawPage(content, min(size, total - offset), offset)
+
+
+def _send_adaptive_post_request_data(
+    offset,
+    url,
+    payload,
+    size,
+    controller: AdaptiveController,
+    progress_bar: "tqdm",
+    session: Session = None,
+    retries: int = _PAGE_RETRIES,
+) -> List:
+    """
+    Load a page, reporting its latency, size and status to `controller`.
+
+    The page is retried up to `retries` times, whether throttled and failed (5xx), backing off as the controller
+    advises, or failing without a response, e.g. on a connection reset, backing off with jitter.
+    """
     logger.debug(f"Sending post request, offset: {offset}, size: {size}")
+    payload_with_offset = _with_page(payload, size, offset)
+
+    for attempt in range(retries + 1):
+        last_attempt = attempt == retries
+        start = time.monotonic()
+        try:
+            response = _post(url, payload_with_offset, session)
+        except PageFetchException as e:
+            controller.record_failure(str(e))
+            if last_attempt:
+                raise
 
+            delay = _jittered_backoff(attempt + 1)
+            logger.warning(
+                f"{e}. Retrying in {delay:.1f}s, retry {attempt + 1} of {retries}"
+            )
+            time.sleep(delay)
+            continue
+
+        latency = time.monotonic() - start
+        if not is_congestion(response.status_code) or last_attempt:
+            break
+
+        controller.record(
+            0, len(response.content), latency, response.status_code
+        )
+        time.sleep(controller.backoff(attempt))
+
+    if is_congestion(response.status_code):
+        controller.record(
+            0, len(response.content), latency, response.status_code
+        )
+
+    data = _handle_response(response, payload_with_offset).get("data", [])
+    controller.record(
+        len(data), len(response.content), latency, response.status_code
+    )
+
+    # noinspection PyBroadException
+    try:
+        progress_bar.update(size)
+    except Exception:
+        logger.warn("Could not update progress bar")
+
+    return data
+
+
+def _send_checkpointed_post_request_data(
+    offset,
+    url,
+    payload,
+    size,
+    total,
+    checkpoint: Checkpoint,
+    progress_bar: "tqdm",
+    session: Session = None,
+    retries: int = _PAGE_RETRIES,
+) -> List:
+    """Load a page from the checkpoint, else from the API, retrying incomplete pages and saving complete pages."""
+    key = checkpoint.page_key(payload, offset)
+    expected = min(size, total - offset)
+    page = checkpoint.load(key, total, expected)
+
+    if page is None:
+        for attempt in range(_MAX_CHECKPOINTED_PAGE_ATTEMPTS):
+            try:
+                dict_response = _send_post_request(
+                    url, payload, size, offset, session, retries
+                )
+            except PageFetchException as e:
+                raise MissingPagesException(
+                    f"Could not load page at offset {offset}: {e}. "
+                    f"{len(checkpoint)} loaded pages are saved in {checkpoint.directory}, run the search again to resume."
+                ) from e
+            page = dict_response.get("data", [])
+            if len(page) == expected:
+                break
+            logger.warning(
+                f"Page at offset {offset} returned {len(page)} records, expected {expected}."
+                f" Attempt {attempt + 1} of {_MAX_CHECKPOINTED_PAGE_ATTEMPTS}"
+            )
+        else:
+            raise MissingPagesException(
+                f"Could not load page at offset {offset}. "
+                f"{len(checkpoint)} loaded pages are saved in {checkpoint.directory}, run the search again to resume."
+            )
+
+        checkpoint.save(key, offset, page, total)
+
+    # noinspection PyBroadException
+    try:
+        progress_bar.update(size)
+    except Exception:
+        logger.warn("Could not update progress bar")
+
+    return page
+
+
+def _send_post_request(
+    url,
+    payload,
+    size,
+    offset,
+    session=None,
+    retries: int = _PAGE_RETRIES,
+    decode: bool = True,
+):
+    """
+    Send a page request, retrying up to `retries` times with jittered backoff if the request fails.
+
+    Returns the decoded response, or the undecoded response body if not `decode`.
+    """
+    logger.debug(f"Sending post request, offset: {offset}, size: {size}")
+
+    payload_with_offset = _with_page(payload, size, offset)
+
+    return _with_retries(
+        lambda: _handle_response(
+            _post(url, payload_with_offset, session),
+            payload_with_offset,
+            decode,
+        ),
+        retries,
+    )
+
+
+def _with_retries(send: Callable[[], Any], retries: int) -> Any:
+    """Call `send`, retrying up to `retries` times with jittered backoff while it raises a retryable failure."""
+    attempt = 0
+    while True:
+        try:
+            return send()
+        except PageFetchException as e:
+            if attempt == retries or not _is_retryable(e):
+                raise
+
+            attempt += 1
+            delay = _jittered_backoff(attempt)
+            logger.warning(
+                f"{e}. Retrying in {delay:.1f}s, retry {attempt} of {retries}"
+            )
+            time.sleep(delay)
+
+
+def _post(url, payload: Dict, session: Session = None) -> Response:
+    """Send a POST request, raising a `PageFetchException` if no response is received."""
+    try:
+        return retry_post(url, json=payload, session=session)
+    except (ConnectionError, ChunkedEncodingError, Timeout) as e:
+        raise PageFetchException(
+            f"Request failed: {e}",
+            offset=payload.get("offset"),
+            payload_hash=_payload_hash(payload),
+        ) from e
+
+
+def _get(url, params: Dict, session: Session = None) -> Response:
+    """Send a GET request, raising a `PageFetchException` if no response is received."""
+    try:
+        return retry_get(url, session=session)
+    except (ConnectionError, ChunkedEncodingError, Timeout) as e:
+        raise PageFetchException(
+            f"Request failed: {e}", payload_hash=_payload_hash(params)
+        ) from e
+
+
+def _is_retryable(e: PageFetchException) -> bool:
+    return (
+        e.status_code is None or e.status_code == 429 or e.status_code >= 500
+    )
+
+
+def _jittered_backoff(attempt: int) -> float:
+    return (
+        _PAGE_BACKOFF_FACTOR * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+    )
+
+
+def _payload_hash(payload: Dict) -> str:
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+
+
+def _create_url(path: str, api_key: str) -> str:
+    return f"{API_URL}{path}?_sdk=python_v{__version__}&apikey={api_key}"
+
+
+def _with_page(payload: Dict, size: int, offset: int) -> Dict:
+    """A copy of the search payload, requesting the page of `size` records at `offset`."""
     payload_with_offset = copy.deepcopy(payload)
 
     payload_with_offset["offset"] = offset
@@ -144,47 +917,71 @@ def _send_post_request(url, payload, size, offset) -> Dict:
     payload_with_offset["size"] = size
     payload_with_offset["cm_size"] = size
 
-    response = retry_post(url, json=payload_with_offset)
+    return payload_with_offset
 
-    return _handle_response(response, payload_with_offset)
 
+def _handle_response(
+    response: Response, payload: Dict = None, decode: bool = True
+):
+    """
+    Decode the response, raising a `PageFetchException` if the request failed or the response isn't JSON.
 
-def _handle_response(response: Response, payload: Dict = None) -> Dict:
-    if not response.ok:
-        logger.error(response.reason)
-        logger.error(response.status_code)
-        logger.error(response)
+    If not `decode`, the response body is returned undecoded, once the response status is checked.
+    """
+    payload = payload or {}
+    offset = payload.get("offset")
+    payload_hash = _payload_hash(payload)
 
+    if not response.ok:
+        logger.debug(f"payload: {payload}")
         # noinspection PyBroadException
         try:
-            logger.error(response.json())
+            logger.debug(response.json())
         except Exception:
             pass
 
-        logger.error(f"payload: {payload}")
-        json = {}
-    else:
-        try:
-            json = response.json()
-        except JSONDecodeError:
-            logger.error("Could not decode response")
-            json = {}
-        except Exception as e:
-            logger.error(e)
-            json = {}
+        raise PageFetchException(
+            f"Request failed: {response.reason}",
+            status_code=response.status_code,
+            offset=offset,
+            payload_hash=payload_hash,
+        )
 
-    return json
+    if not decode:
+        return response.content
+
+    try:
+        return decode_json(response.content)
+    except ValueError as e:
+        raise PageFetchException(
+            f"Could not decode response: {e}",
+            offset=offset,
+            payload_hash=payload_hash,
+        ) from e
 
 
 __client__ = None
+__client_lock__ = threading.Lock()
+
+
+def _reset_client_lock() -> None:
+    # A thread of the parent may have held the lock while forking, the child starts with a released lock
+    global __client_lock__
+    __client_lock__ = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_client_lock)
 
 
 def default_client() -> VortexaClient:
-    """Instantiate VortexaClient as global variable."""
+    """Instantiate VortexaClient as global variable, once, whatever the number of threads calling."""
     global __client__
 
     if __client__ is None:
-        __client__ = create_client()
+        with __client_lock__:
+            if __client__ is None:
+                __client__ = create_client()
 
     return __client__
 
@@ -195,24 +992,43 @@ def create_client() -> VortexaClient:
 
     api_key = _load_api_key()
     verify_api_key_format(api_key)
-    _warn_user_if_sdk_version_outdated()
+    _check_sdk_version_in_background()
 
     return VortexaClient(api_key=api_key)
 
 
 def set_client(client) -> None:
     """Set the global client, used by all endpoints."""
+    # IDs resolved with the previous client may not hold with the new one
+    from vortexasdk.conversions.conversions import clear_resolved_ids
+
     global __client__
-    __client__ = client
+    with __client_lock__:
+        __client__ = client
+    clear_resolved_ids()
     logger.debug(
         f"global __client__ has been set {__client__.__class__.__name__} \n"
     )
 
 
+def _check_sdk_version_in_background() -> None:
+    """Warn users if their SDK version is outdated, without blocking, unless disabled with `VORTEXA_VERSION_CHECK`."""
+    if not VERSION_CHECK:
+        return
+
+    threading.Thread(
+        target=_warn_user_if_sdk_version_outdated,
+        name="vortexasdk-version-check",
+        daemon=True,
+    ).start()
+
+
 def _warn_user_if_sdk_version_outdated() -> None:
     """Warn users if their SDK version is outdated"""
     try:
-        latest_sdk_version, sdk_outdated_check = is_sdk_version_outdated()
+        latest_sdk_version, sdk_outdated_check = is_sdk_version_outdated(
+            VERSION_CHECK_FILE
+        )
         if sdk_outdated_check:
             logger.warning(
                 f"You are using {sdk_pkg_name} version {__version__}, however version {latest_sdk_version} is available.\n"
@@ -0,0 +1,141 @@
+"""
+Registry of the kind of values held by each flattened column, and parsing of timestamp columns.
+
+The kind of a column is looked up by its full flattened path, e.g. `origin.start_timestamp`, then by its field,
+the last component of the path, e.g. `start_timestamp`. Fields ending with `timestamp` are timestamps, as are the
+`key`s of time series, the start of each time bucket.
+`to_df(parse_timestamps=True)`, `to_columns` and `to_arrow` all convert columns according to this registry.
+"""
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TIMESTAMP = "timestamp"
+CATEGORY = "category"
+INTEGER = "integer"
+FLOAT = "float"
+OTHER = "other"
+
+KINDS = (TIMESTAMP, CATEGORY, INTEGER, FLOAT, OTHER)
+
+# Kinds of fields, shared by every path ending with the field. Repetitive labels are categories, worth
+# dictionary encoding.
+_FIELD_KINDS: Dict[str, str] = {
+    **{
+        field: CATEGORY
+        for field in (
+            "label",
+            "layer",
+            "source",
+            "event_type",
+            "vessel_class",
+            "status",
+            "name",
+            "tag",
+        )
+    },
+    **{
+        field: INTEGER
+        for field in (
+            "quantity",
+            "imo",
+            "mmsi",
+            "dwt",
+            "cubic_capacity",
+            "year",
+            "count",
+        )
+    },
+    **{field: FLOAT for field in ("probability", "value")},
+    # The start of each time bucket of a time series
+    "key": TIMESTAMP,
+}
+
+# Kinds of full flattened paths, taking precedence over the kinds of fields.
+_PATH_KINDS: Dict[str, str] = {}
+
+
+def register_column_kind(name: str, kind: str) -> None:
+    """
+    Register the kind of values held by a column.
+
+    # Arguments
+        name: A flattened path, e.g. `origin.start_timestamp`, or a field shared by all paths ending with it,
+            e.g. `start_timestamp`.
+        kind: One of `TIMESTAMP`, `CATEGORY`, `INTEGER`, `FLOAT`, or `OTHER`.
+
+    """
+    if kind not in KINDS:
+        raise ValueError(
+            f"Unknown column kind {kind}, expected one of {KINDS}"
+        )
+
+    if "." in name:
+        _PATH_KINDS[name] = kind
+    else:
+        _FIELD_KINDS[name] = kind
+
+
+def column_kind(column: str) -> str:
+    """
+    Look up the kind of values held in a flattened column.
+
+    # Arguments
+        column: The flattened column name, e.g. `events.cargo_port_load_event.0.end_timestamp`
+
+    # Returns
+    One of `TIMESTAMP`, `CATEGORY`, `INTEGER`, `FLOAT`, or `OTHER`.
+
+    # Example
+    ```python
+    >>> column_kind('vessels.0.corporate_entities.charterer.label')
+    'category'
+
+    ```
+    """
+    if column in _PATH_KINDS:
+        return _PATH_KINDS[column]
+
+    field = column.rsplit(".", 1)[-1]
+
+    if field in _FIELD_KINDS:
+        return _FIELD_KINDS[field]
+    elif field.endswith("timestamp"):
+        return TIMESTAMP
+    else:
+        return OTHER
+
+
+def timestamp_columns(columns: Iterable[str]) -> List[str]:
+    """The columns holding timestamps."""
+    return [c for c in columns if column_kind(c) == TIMESTAMP]
+
+
+def parse_timestamps(values) -> "pd.Series":
+    """
+    Parse ISO 8601 timestamps into a `datetime64[ns, UTC]` series, in a single vectorised call.
+
+    Missing and invalid timestamps are parsed as `NaT`.
+    """
+    import pandas as pd
+
+    series = pd.Series(values, dtype=object)
+    series = series.where(series.notna(), None)
+
+    parsed = pd.to_datetime(
+        series, utc=True, errors="coerce", **_timestamp_format()
+    )
+    # pandas 2 infers the resolution from the timestamps, keep nanoseconds whatever the timestamps
+    return parsed.astype("datetime64[ns, UTC]")
+
+
+@lru_cache(maxsize=None)
+def _timestamp_format() -> Dict[str, str]:
+    import pandas as pd
+
+    # pandas 2 infers a single format for all timestamps of a column, unless told timestamps may vary.
+    return (
+        {"format": "ISO8601"} if int(pd.__version__.split(".")[0]) >= 2 else {}
+    )
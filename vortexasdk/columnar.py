@@ -0,0 +1,250 @@
+"""
+Hold search results as columns of NumPy arrays, built once from the raw records of a search.
+
+Labels are dictionary encoded, stored as integer codes into an array of distinct labels, timestamps are parsed once
+into `int64` milliseconds since the epoch, and quantities are `int64`. Selecting columns, slicing rows and
+converting to NumPy share the stored arrays rather than copying them.
+"""
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from vortexasdk.column_types import (
+    CATEGORY,
+    FLOAT,
+    INTEGER,
+    OTHER,
+    TIMESTAMP,
+    column_kind,
+    parse_timestamps,
+)
+from vortexasdk.logger import get_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = get_logger(__name__)
+
+# Stored in timestamp columns for missing timestamps, `NaT` once viewed as `datetime64[ms]`.
+MISSING_TIMESTAMP = np.iinfo(np.int64).min
+
+# Stored in category columns for missing labels.
+MISSING_CODE = -1
+
+
+class ColumnStore:
+    """
+    Columns of search results, one NumPy array per column.
+
+    Category columns hold `int32` codes, `-1` for missing labels, into the column's `categories`.
+    Timestamp columns hold `int64` milliseconds since the epoch, `MISSING_TIMESTAMP` for missing timestamps.
+
+    # Arguments
+        arrays: A dictionary mapping each column name to its array of values.
+        categories: A dictionary mapping each category column name to its array of distinct labels.
+
+    # Example
+
+    ```python
+    >>> store = CargoMovements().search(filter_activity="loading_state").to_columns() # doctest: +SKIP
+    >>> crude = store.filter(store.equals("product.group.label", "Crude")) # doctest: +SKIP
+    >>> crude["quantity"].sum() # doctest: +SKIP
+    >>> crude.select(["vessels.0.name", "quantity"]).to_pandas() # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        arrays: Dict[str, np.ndarray],
+        categories: Dict[str, np.ndarray] = None,
+    ):
+        self._arrays = arrays
+        self._categories = categories or {}
+
+    @classmethod
+    def from_columns(
+        cls, data: Dict[str, List], parse_timestamps: bool = True
+    ) -> "ColumnStore":
+        """
+        Build a store from a dictionary mapping each column name to its list of raw values.
+
+        Columns are converted according to their kind in `vortexasdk.column_types`. Without `parse_timestamps`,
+        timestamps are kept as ISO 8601 strings.
+        """
+        logger.debug(f"Creating column store with {len(data)} columns")
+
+        arrays, categories = {}, {}
+        for column, values in data.items():
+            kind = column_kind(column)
+            if kind == TIMESTAMP and not parse_timestamps:
+                arrays[column] = _create_array(OTHER, values)
+            elif kind == CATEGORY:
+                arrays[column], categories[column] = _encode(values)
+            else:
+                arrays[column] = _create_array(kind, values)
+
+        return cls(arrays, categories)
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of the columns."""
+        return list(self._arrays.keys())
+
+    def __len__(self) -> int:
+        return len(next(iter(self._arrays.values()), ()))
+
+    def __getitem__(self, item: Union[str, slice]):
+        """
+        The array of a column, or a store holding a slice of the rows.
+
+        Category columns are returned as arrays of labels, see `codes` for their stored codes.
+        """
+        if isinstance(item, slice):
+            return self._with_rows(item)
+
+        return self.to_numpy(item)
+
+    def codes(self, column: str) -> np.ndarray:
+        """The stored array of a column: codes of category columns, milliseconds since the epoch of timestamps."""
+        return self._arrays[column]
+
+    def categories(self, column: str) -> np.ndarray:
+        """The distinct labels of a category column."""
+        return self._categories[column]
+
+    def select(self, columns: Iterable[str]) -> "ColumnStore":
+        """A store holding the given columns, sharing their arrays."""
+        columns = list(columns)
+        return ColumnStore(
+            {c: self._arrays[c] for c in columns},
+            {c: self._categories[c] for c in columns if c in self._categories},
+        )
+
+    def filter(self, mask: np.ndarray) -> "ColumnStore":
+        """A store holding the rows where the boolean `mask` is `True`."""
+        return self._with_rows(np.asarray(mask, dtype=bool))
+
+    def equals(self, column: str, value) -> np.ndarray:
+        """
+        A boolean mask of the rows where `column` equals `value`.
+
+        Category columns are compared on their codes, without decoding labels.
+        """
+        if column not in self._categories:
+            return self.to_numpy(column) == value
+
+        matches = np.flatnonzero(self._categories[column] == value)
+        if len(matches) == 0:
+            return np.zeros(len(self), dtype=bool)
+        return self._arrays[column] == matches[0]
+
+    def isin(self, column: str, values: Iterable) -> np.ndarray:
+        """A boolean mask of the rows where `column` equals any of `values`."""
+        values = list(values)
+        if column not in self._categories:
+            return np.isin(self.to_numpy(column), values)
+
+        codes = np.flatnonzero(np.isin(self._categories[column], values))
+        return np.isin(self._arrays[column], codes)
+
+    def to_numpy(self, column: str) -> np.ndarray:
+        """
+        The values of a column as a NumPy array.
+
+        Timestamps are a `datetime64[ms]` view of the stored array, numeric columns are the stored array itself.
+        Category columns are decoded into an array of labels, `None` for missing labels.
+        """
+        array = self._arrays[column]
+        if column in self._categories:
+            labels = np.append(self._categories[column], None)
+            return labels[array]
+        if array.dtype == np.int64 and column_kind(column) == TIMESTAMP:
+            return array.view("datetime64[ms]")
+        return array
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """
+        Represent the columns as a `pd.DataFrame`.
+
+        Category columns become `pd.Categorical`s built from the stored codes. Parsed timestamps become
+        `datetime64[ns, UTC]`, converted from the stored milliseconds.
+        """
+        import pandas as pd
+
+        data = {}
+        for column, array in self._arrays.items():
+            if column in self._categories:
+                data[column] = pd.Categorical.from_codes(
+                    array, categories=self._categories[column]
+                )
+            elif array.dtype == np.int64 and column_kind(column) == TIMESTAMP:
+                data[column] = pd.DatetimeIndex(
+                    array.view("datetime64[ms]").astype("datetime64[ns]")
+                ).tz_localize("UTC")
+            else:
+                data[column] = self.to_numpy(column)
+
+        return pd.DataFrame(data, columns=self.columns, copy=False)
+
+    def __repr__(self) -> str:
+        return f"ColumnStore({len(self)} rows, {len(self._arrays)} columns)"
+
+    def _with_rows(self, rows: Union[slice, np.ndarray]) -> "ColumnStore":
+        return ColumnStore(
+            {c: array[rows] for c, array in self._arrays.items()},
+            self._categories,
+        )
+
+
+def _encode(values: List):
+    labels: Dict = {}
+    codes = np.fromiter(
+        (
+            MISSING_CODE
+            if _is_missing(v)
+            else labels.setdefault(str(v), len(labels))
+            for v in values
+        ),
+        dtype=np.int32,
+        count=len(values),
+    )
+    categories = np.array(list(labels.keys()), dtype=object)
+
+    return codes, categories
+
+
+def _create_array(kind: str, values: List) -> np.ndarray:
+    if kind == TIMESTAMP:
+        return _parse_timestamps(values)
+
+    if kind in (INTEGER, FLOAT):
+        cleaned = [np.nan if _is_missing(v) else v for v in values]
+        # noinspection PyBroadException
+        try:
+            array = np.array(cleaned, dtype=np.float64)
+        except Exception:
+            logger.debug(f"Could not convert values to {kind}")
+            return np.array(values, dtype=object)
+
+        if kind == INTEGER and not np.isnan(array).any():
+            return array.astype(np.int64)
+        return array
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = [None if _is_missing(v) else v for v in values]
+    return array
+
+
+def _parse_timestamps(values: List) -> np.ndarray:
+    parsed = parse_timestamps(values)
+
+    return (
+        parsed.dt.tz_convert(None)
+        .values.astype("datetime64[ms]")
+        .view(np.int64)
+    )
+
+
+def _is_missing(value: Optional[object]) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
@@ -2,3 +2,30 @@ import os
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_FILE = os.getenv("LOG_FILE", None)
+
+# Cache reference data in this directory, no cache is used when unset.
+CACHE_DIR = os.getenv("VORTEXA_CACHE_DIR", None)
+CACHE_MAX_ENTRIES = int(os.getenv("VORTEXA_CACHE_MAX_ENTRIES", 1000))
+
+# Names resolved to IDs by the conversions are reused for this many seconds, at most this many names are held.
+RESOLVED_IDS_TTL = float(os.getenv("VORTEXA_RESOLVED_IDS_TTL", 24 * 60 * 60))
+RESOLVED_IDS_MAX_ENTRIES = int(
+    os.getenv("VORTEXA_RESOLVED_IDS_MAX_ENTRIES", 10000)
+)
+
+# JSON decoder used for API responses, one of "auto", "orjson", "msgspec" or "json".
+JSON_DECODER = os.getenv("VORTEXA_JSON_DECODER", "auto")
+
+# Check whether a newer SDK version is available on PyPI, in a background thread, when the client is created.
+VERSION_CHECK = os.getenv("VORTEXA_VERSION_CHECK", "true").lower() not in (
+    "0",
+    "false",
+    "no",
+)
+# The latest SDK version found is saved to this file, and reused for a day.
+VERSION_CHECK_FILE = os.getenv(
+    "VORTEXA_VERSION_CHECK_FILE",
+    os.path.join(
+        os.path.expanduser("~"), ".vortexasdk", "latest_version.json"
+    ),
+)
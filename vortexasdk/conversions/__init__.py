@@ -1,5 +1,17 @@
 """Conversions between various entites."""
-from vortexasdk.conversions.corporations import convert_to_corporation_ids
-from vortexasdk.conversions.geographies import convert_to_geography_ids
-from vortexasdk.conversions.products import convert_to_product_ids
-from vortexasdk.conversions.vessels import convert_to_vessel_ids
+from vortexasdk.conversions.corporations import (
+    convert_to_corporation_ids,
+    convert_to_corporation_ids_bulk,
+)
+from vortexasdk.conversions.geographies import (
+    convert_to_geography_ids,
+    convert_to_geography_ids_bulk,
+)
+from vortexasdk.conversions.products import (
+    convert_to_product_ids,
+    convert_to_product_ids_bulk,
+)
+from vortexasdk.conversions.vessels import (
+    convert_to_vessel_ids,
+    convert_to_vessel_ids_bulk,
+)
@@ -1,38 +1,217 @@
-from typing import List
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple
 
 from vortexasdk.api import ID
-from vortexasdk.api.id import split_ids_other
+from vortexasdk.api.id import is_valid_id, split_ids_other
 from vortexasdk.api.shared_types import IDsNames
+from vortexasdk.config import RESOLVED_IDS_MAX_ENTRIES, RESOLVED_IDS_TTL
 from vortexasdk.logger import get_logger
 from vortexasdk.operations import Search
+from vortexasdk.reference_index import ReferenceIndex
 from vortexasdk.utils import convert_to_list
 
 logger = get_logger(__name__)
 
+# Maximum number of terms sent in a single search request.
+_MAX_TERMS_PER_SEARCH = 500
+
+ResolvedKey = Tuple[str, str, Hashable, Optional[bool]]
+
+
+class ResolvedIds:
+    """
+    IDs already resolved, keyed by (resource, search parameter, value, exact_term_match).
+
+    The IDs of a whole search, not matched to each value, are keyed on the tuple of values searched, with
+    `exact_term_match=None`.
+
+    IDs expire `ttl` seconds after being resolved, and the least recently used are evicted once more than
+    `max_entries` are held.
+    """
+
+    def __init__(
+        self,
+        ttl: float = RESOLVED_IDS_TTL,
+        max_entries: int = RESOLVED_IDS_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[ResolvedKey, Tuple[float, List[ID]]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: ResolvedKey) -> Optional[List[ID]]:
+        """The IDs resolved for `key`, or `None` if they were never resolved or have expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, ids = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return ids
+
+    def set(self, key: ResolvedKey, ids: List[ID]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self, resource: str = None) -> None:
+        """Forget the resolved IDs, only those of `resource` if given."""
+        with self._lock:
+            if resource is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == resource]:
+                    del self._entries[key]
+
+
+__resolved_ids__ = ResolvedIds()
+
+
+def clear_resolved_ids(resource: str = None) -> None:
+    """Forget the IDs names were resolved to, only those of `resource` if given, e.g. once reference data changed."""
+    __resolved_ids__.clear(resource)
+
 
 def _convert_to_ids(ids_or_names: IDsNames, searcher: Search) -> List[ID]:
-    """Convert containing a mix of IDs and names to a list of IDs."""
-    ids_or_names_list = convert_to_list(ids_or_names)
+    """Convert containing a mix of IDs and names to a list of IDs: the IDs given, then the IDs of every record found."""
+    ids, others = split_ids_other(convert_to_list(ids_or_names))
 
-    ids, others = split_ids_other(ids_or_names_list)
-    if len(others) == 0:
-        return ids
-    else:
-        return ids + _search_ids(searcher, term=others)
+    return ids + _search_ids(searcher, "term", others)
 
 
-def _search_ids(searcher: Search, **kwargs) -> List[ID]:
-    """Find IDs matching a given list of search terms."""
-    logger.info(
-        f"Searching {searcher.__class__.__name__} matching search terms: {kwargs}"
-    )
+def _search_ids(searcher: Search, param: str, values: List) -> List[ID]:
+    """
+    Find the IDs of every record returned searching `values` with `param`.
+
+    Values are searched in batches of up to `_MAX_TERMS_PER_SEARCH`, and the IDs of each batch are remembered for
+    later calls.
+    """
+    resource = searcher._resource
+    found: List[ID] = []
+
+    for batch in _batches(list(dict.fromkeys(values)), _MAX_TERMS_PER_SEARCH):
+        key = (resource, param, tuple(batch), None)
+        ids = __resolved_ids__.get(key)
+        if ids is None:
+            logger.info(
+                f"Searching {searcher.__class__.__name__} matching {param}: {batch}"
+            )
+            ids = [r["id"] for r in searcher.search(**{param: batch})]
+            __resolved_ids__.set(key, ids)
+        found.extend(ids)
+
+    logger.info(f"Found {len(found)} {searcher.__class__.__name__}")
 
-    results = searcher.search(**kwargs)
+    return list(dict.fromkeys(found))
 
-    id_to_name = {r["id"]: r["name"] for r in results}
 
-    logger.info(
-        f"Found {len(results)} {searcher.__class__.__name__}: {id_to_name}"
+def _convert_to_ids_bulk(
+    ids_or_names: IDsNames, searcher: Search, exact_term_match: bool = True
+) -> Dict[str, List[ID]]:
+    """
+    Convert each of a mix of IDs and names to the IDs it matches.
+
+    Names are de-duplicated, and all the names not resolved by an earlier call are searched in as few
+    requests as possible, each request searching up to `_MAX_TERMS_PER_SEARCH` terms.
+
+    # Arguments
+        ids_or_names: IDs, or names to convert to IDs.
+        searcher: The reference endpoint searched.
+        exact_term_match: Only match records whose name or related names equal the name (ignoring case),
+            otherwise match records whose name or related names contain the name.
+
+    # Returns
+    A dictionary mapping each ID or name to the list of IDs it matches.
+
+    """
+
+    def match(index: ReferenceIndex, name) -> List[Dict]:
+        return index.exact(name) if exact_term_match else index.search(name)
+
+    return _resolve_bulk(
+        convert_to_list(ids_or_names),
+        searcher,
+        "term",
+        exact_term_match,
+        match,
     )
 
-    return list(id_to_name.keys())
+
+def _resolve_bulk(
+    values: List,
+    searcher: Search,
+    param: str,
+    exact_term_match: bool,
+    match: Callable[[ReferenceIndex, Hashable], List[Dict]],
+) -> Dict:
+    """Resolve each value to the IDs of records it matches, searching unresolved values with `param`."""
+    resource = searcher._resource
+    unique = list(dict.fromkeys(values))
+
+    resolved: Dict = {}
+    unresolved = []
+    for value in unique:
+        if is_valid_id(value):
+            resolved[value] = [value]
+            continue
+
+        ids = __resolved_ids__.get((resource, param, value, exact_term_match))
+        if ids is None:
+            unresolved.append(value)
+        else:
+            resolved[value] = ids
+
+    if unresolved:
+        logger.info(
+            f"Resolving {len(unresolved)} of {len(unique)} values with {searcher.__class__.__name__}"
+        )
+
+    for batch in _batches(unresolved, _MAX_TERMS_PER_SEARCH):
+        index = ReferenceIndex(list(searcher.search(**{param: batch})))
+
+        for value in batch:
+            ids = [r["id"] for r in match(index, value)]
+            __resolved_ids__.set(
+                (resource, param, value, exact_term_match), ids
+            )
+            resolved[value] = ids
+
+    _report(searcher, resolved)
+
+    return resolved
+
+
+def _report(searcher: Search, resolved: Dict[str, List[ID]]) -> None:
+    missing = [name for name, ids in resolved.items() if len(ids) == 0]
+    ambiguous = {name: ids for name, ids in resolved.items() if len(ids) > 1}
+
+    if missing:
+        logger.warning(
+            f"No {searcher.__class__.__name__} found matching: {missing}"
+        )
+    if ambiguous:
+        logger.info(
+            f"Several {searcher.__class__.__name__} found matching: {ambiguous}"
+        )
+
+
+def _batches(values: List, size: int) -> Iterator[List]:
+    iterator = iter(values)
+    batch = list(islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
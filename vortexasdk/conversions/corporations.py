@@ -1,8 +1,11 @@
-from typing import List, Union
+from typing import Dict, List, Union
 
 from vortexasdk.endpoints.corporations import Corporations
 from vortexasdk.api import ID
-from vortexasdk.conversions.conversions import _convert_to_ids
+from vortexasdk.conversions.conversions import (
+    _convert_to_ids,
+    _convert_to_ids_bulk,
+)
 
 
 def convert_to_corporation_ids(
@@ -19,3 +22,31 @@ def convert_to_corporation_ids(
     ```
     """
     return _convert_to_ids(ids_or_names_list, Corporations())
+
+
+def convert_to_corporation_ids_bulk(
+    ids_or_names_list: List[Union[ID, str]], exact_term_match: bool = True
+) -> Dict[str, List[ID]]:
+    """
+    Convert each of a list of names or IDs to the corporation ids it matches.
+
+    Names are de-duplicated, searched in as few requests as possible, and remembered for later calls.
+    Names matching no corporation, or several corporation ids, are logged.
+
+    # Arguments
+        ids_or_names_list: Names or IDs to convert.
+        exact_term_match: Only match names equal to the given name (ignoring case), otherwise match names
+            containing the given name.
+
+    # Returns
+    A dictionary mapping each name or ID to the list of corporation ids it matches.
+
+    # Example
+    ```
+    >>> convert_to_corporation_ids_bulk(["DHT", "Exon"]) # doctest: +SKIP
+
+    ```
+    """
+    return _convert_to_ids_bulk(
+        ids_or_names_list, Corporations(), exact_term_match=exact_term_match
+    )
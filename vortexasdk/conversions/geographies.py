@@ -1,8 +1,11 @@
-from typing import List, Union
+from typing import Dict, List, Union
 
 from vortexasdk.endpoints.geographies import Geographies
 from vortexasdk.api import ID
-from vortexasdk.conversions.conversions import _convert_to_ids
+from vortexasdk.conversions.conversions import (
+    _convert_to_ids,
+    _convert_to_ids_bulk,
+)
 
 
 def convert_to_geography_ids(
@@ -27,3 +30,31 @@ def convert_to_geography_ids(
 
     """
     return _convert_to_ids(ids_or_names_list, Geographies())
+
+
+def convert_to_geography_ids_bulk(
+    ids_or_names_list: List[Union[ID, str]], exact_term_match: bool = True
+) -> Dict[str, List[ID]]:
+    """
+    Convert each of a list of names or IDs to the geography ids it matches.
+
+    Names are de-duplicated, searched in as few requests as possible, and remembered for later calls.
+    Names matching no geography, or several geography ids, are logged.
+
+    # Arguments
+        ids_or_names_list: Names or IDs to convert.
+        exact_term_match: Only match names equal to the given name (ignoring case), otherwise match names
+            containing the given name.
+
+    # Returns
+    A dictionary mapping each name or ID to the list of geography ids it matches.
+
+    # Example
+    ```
+    >>> convert_to_geography_ids_bulk(["Rotterdam [NL]", "Fujairah [AE]"]) # doctest: +SKIP
+
+    ```
+    """
+    return _convert_to_ids_bulk(
+        ids_or_names_list, Geographies(), exact_term_match=exact_term_match
+    )
@@ -1,8 +1,12 @@
-from typing import List, Union
+from typing import Dict, List, Union
 
 from vortexasdk.api import ID
 from vortexasdk.api.id import split_ids_other
-from vortexasdk.conversions.conversions import _search_ids
+from vortexasdk.conversions.conversions import (
+    _convert_to_ids_bulk,
+    _resolve_bulk,
+    _search_ids,
+)
 from vortexasdk.endpoints.vessels import AVAILABLE_VESSEL_CLASSES, Vessels
 from vortexasdk.utils import convert_to_list
 
@@ -20,35 +24,63 @@ def convert_to_vessel_ids(
 
     ```
     """
+    ids, others = split_ids_other(convert_to_list(vessel_attributes))
 
+    vessel_classes = [e for e in others if _is_vessel_class(e)]
+    names_imos_mmsis = [e for e in others if not _is_vessel_class(e)]
+
+    searched = _search_ids(
+        Vessels(), "vessel_classes", vessel_classes
+    ) + _search_ids(Vessels(), "term", names_imos_mmsis)
+
+    return ids + list(dict.fromkeys(searched))
+
+
+def convert_to_vessel_ids_bulk(
+    vessel_attributes: Union[List[Union[ID, str, int]], ID, str, int],
+    exact_term_match: bool = True,
+) -> Dict[Union[ID, str, int], List[ID]]:
+    """
+    Convert each of a mixed list of names, IDs, IMOs, MMSIs or vessel classes to the vessel ids it matches.
+
+    Values are de-duplicated, searched in as few requests as possible, and remembered for later calls.
+    Values matching no vessel, or several vessels, are logged.
+
+    # Arguments
+        vessel_attributes: Names, IDs, IMOs, MMSIs or vessel classes to convert.
+        exact_term_match: Only match names equal to the given name (ignoring case), otherwise match names
+            containing the given name. IMOs and MMSIs are always matched exactly.
+
+    # Returns
+    A dictionary mapping each value to the list of vessel ids it matches.
+
+    # Example
+    ```
+    >>> convert_to_vessel_ids_bulk(["Stallion", 9464326, 477639900, 'vlcc']) # doctest: +SKIP
+
+    ```
+    """
     vessel_attributes_list = convert_to_list(vessel_attributes)
-    ids, others = split_ids_other(vessel_attributes_list)
-
-    vessel_classes = []
-    names_imos_mmsis = []
-    for e in others:
-        if _is_vessel_class(e):
-            vessel_classes.append(e)
-        else:
-            names_imos_mmsis.append(e)
-
-    vessels_matched_on_vessel_class = (
-        _search_ids(Vessels(), vessel_classes=vessel_classes)
-        if len(vessel_classes) > 0
-        else []
-    )
 
-    vessels_matched_on_name_imo_mmsi = (
-        _search_ids(Vessels(), term=names_imos_mmsis)
-        if len(names_imos_mmsis) > 0
-        else []
-    )
+    vessel_classes = [e for e in vessel_attributes_list if _is_vessel_class(e)]
+    others = [e for e in vessel_attributes_list if not _is_vessel_class(e)]
 
-    return (
-        ids
-        + vessels_matched_on_vessel_class
-        + vessels_matched_on_name_imo_mmsi
-    )
+    resolved = {
+        **_convert_to_ids_bulk(others, Vessels(), exact_term_match),
+        **_resolve_bulk(
+            vessel_classes,
+            Vessels(),
+            "vessel_classes",
+            True,
+            lambda index, vessel_class: [
+                r
+                for r in index.records
+                if r.get("vessel_class") == vessel_class.lower()
+            ],
+        ),
+    }
+
+    return {e: resolved[e] for e in dict.fromkeys(vessel_attributes_list)}
 
 
 def _is_vessel_class(potential_vessel_class) -> bool:
@@ -1,9 +1,33 @@
-"""Vortexa endpoints."""
-from vortexasdk.endpoints.attributes import Attributes
-from vortexasdk.endpoints.cargo_movements import CargoMovements
-from vortexasdk.endpoints.cargo_timeseries import CargoTimeSeries
-from vortexasdk.endpoints.vessel_movements import VesselMovements
-from vortexasdk.endpoints.corporations import Corporations
-from vortexasdk.endpoints.geographies import Geographies
-from vortexasdk.endpoints.products import Products
-from vortexasdk.endpoints.vessels import Vessels
+"""
+Vortexa endpoints.
+
+Endpoints are imported on first access, so importing the package doesn't import every endpoint's dependencies.
+"""
+import importlib
+
+# The module defining each endpoint.
+_ENDPOINTS = {
+    "Attributes": "vortexasdk.endpoints.attributes",
+    "CargoMovements": "vortexasdk.endpoints.cargo_movements",
+    "CargoTimeSeries": "vortexasdk.endpoints.cargo_timeseries",
+    "VesselMovements": "vortexasdk.endpoints.vessel_movements",
+    "Corporations": "vortexasdk.endpoints.corporations",
+    "Geographies": "vortexasdk.endpoints.geographies",
+    "Products": "vortexasdk.endpoints.products",
+    "Vessels": "vortexasdk.endpoints.vessels",
+}
+
+__all__ = list(_ENDPOINTS)
+
+
+def __getattr__(name: str):
+    if name not in _ENDPOINTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_ENDPOINTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
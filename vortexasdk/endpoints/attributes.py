@@ -1,5 +1,5 @@
 """Attributes Endpoint."""
-from typing import List, Union
+from typing import Dict, List, Union
 from vortexasdk.endpoints.endpoints import ATTRIBUTES_REFERENCE
 from vortexasdk.endpoints.attributes_result import AttributeResult
 from vortexasdk.operations import Reference, Search
@@ -84,11 +84,38 @@ class Attributes(Reference, Search):
         |  1 | 478fca39000c49d6 | Unkown     | scrubber    |
 
         """
+        search_params = self._search_params(type=type, term=term, ids=ids)
 
-        search_params = {
+        return AttributeResult(super().search(**search_params))
+
+    async def search_async(self, *args, **kwargs) -> AttributeResult:
+        """
+        Find attributes matching the given search arguments, without blocking the event loop.
+
+        Awaitable variant of `search`, taking the same arguments. All pages are requested concurrently with the global
+        `AsyncVortexaClient`.
+
+        # Returns
+        `AttributeResult`, as `search` does.
+
+        # Example
+
+        >>> from vortexasdk import Attributes
+        >>> result = await Attributes().search_async(type="scrubber") # doctest: +SKIP
+
+        """
+        search_params = self._search_params(*args, **kwargs)
+
+        return AttributeResult(await super().search_async(**search_params))
+
+    def _search_params(
+        self,
+        type: str = None,
+        term: Union[str, List[str]] = None,
+        ids: Union[str, List[str]] = None,
+    ) -> Dict:
+        return {
             "term": [str(e) for e in convert_to_list(term)],
             "ids": convert_to_list(ids),
             "type": type,
         }
-
-        return AttributeResult(super().search(**search_params))
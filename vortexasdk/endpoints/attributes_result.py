@@ -1,12 +1,17 @@
-from typing import List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List
 
 from vortexasdk.api import Attribute
 from vortexasdk.api.search_result import Result
-from vortexasdk.result_conversions import create_dataframe, create_list
+from vortexasdk.result_conversions import (
+    create_columns,
+    create_dataframe,
+    create_list,
+)
 from vortexasdk.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
 
@@ -18,7 +23,7 @@ class AttributeResult(Result):
         # noinspection PyTypeChecker
         return create_list(super().to_list(), Attribute)
 
-    def to_df(self, columns=None) -> pd.DataFrame:
+    def to_df(self, columns=None) -> "pd.DataFrame":
         """
         Represent attributes as a `pd.DataFrame`.
 
@@ -38,5 +43,12 @@ class AttributeResult(Result):
             logger_description="Attributes",
         )
 
+    def _to_columns(self, columns=None) -> Dict[str, List]:
+        return create_columns(
+            columns=columns,
+            default_columns=DEFAULT_COLUMNS,
+            data=super().to_list(),
+        )
+
 
 DEFAULT_COLUMNS = ["id", "name", "type"]
@@ -1,18 +1,23 @@
 import functools
-import os
-from multiprocessing.pool import Pool
-from typing import List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List
 
 from vortexasdk.api import CargoMovement
 from vortexasdk.api.entity_flattening import (
     convert_cargo_movement_to_flat_dict,
 )
+from vortexasdk.api.entity_projection import CARGO_MOVEMENT_PROJECTOR
 from vortexasdk.api.search_result import Result
-from vortexasdk.result_conversions import create_dataframe, create_list
+from vortexasdk.result_conversions import (
+    create_columns,
+    create_dataframe,
+    create_list,
+    map_records,
+)
 from vortexasdk.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
 
@@ -29,7 +34,7 @@ class CargoMovementsResult(Result):
         # noinspection PyTypeChecker
         return create_list(super().to_list(), CargoMovement)
 
-    def to_df(self, columns=None) -> pd.DataFrame:
+    def to_df(self, columns=None, parse_timestamps=False) -> "pd.DataFrame":
         """
         Represent cargo movements as a `pd.DataFrame`.
 
@@ -37,6 +42,7 @@ class CargoMovementsResult(Result):
             columns: Output columns present in the `pd.DataFrame`.
             Enter `columns='all'` to return all available columns.
             Enter `columns=None` to use `cargo_movements.DEFAULT_COLUMNS`.
+            parse_timestamps: Parse timestamp columns into `datetime64[ns, UTC]`, instead of ISO 8601 strings.
 
         # Returns
         `pd.DataFrame`, one row per cargo movement.
@@ -535,24 +541,35 @@ class CargoMovementsResult(Result):
         ```
 
         """
-        if columns is None:
-            columns = DEFAULT_COLUMNS
-
-        flatten = functools.partial(
-            convert_cargo_movement_to_flat_dict, cols=columns
-        )
-
-        logger.debug("Converting each CargoMovement to a flat dictionary")
-        with Pool(os.cpu_count()) as pool:
-            records = pool.map(flatten, super().to_list())
-
         return create_dataframe(
             columns=columns,
             default_columns=DEFAULT_COLUMNS,
-            data=records,
+            data=self._to_columns(columns),
             logger_description="CargoMovements",
+            parse_timestamps=parse_timestamps,
         )
 
+    def _to_columns(self, columns=None) -> Dict[str, List]:
+        if columns is None:
+            columns = DEFAULT_COLUMNS
+
+        if columns == "all":
+            logger.debug("Converting each CargoMovement to a flat dictionary")
+            flatten = functools.partial(
+                convert_cargo_movement_to_flat_dict, cols=columns
+            )
+
+            return create_columns(
+                columns=columns,
+                default_columns=DEFAULT_COLUMNS,
+                data=map_records(flatten, super().to_list()),
+            )
+        else:
+            logger.debug(
+                "Projecting each CargoMovement onto the given columns"
+            )
+            return CARGO_MOVEMENT_PROJECTOR.project(super().to_list(), columns)
+
 
 DEFAULT_COLUMNS = [
     "events.cargo_port_load_event.0.location.port.label",
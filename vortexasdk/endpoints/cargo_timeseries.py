@@ -1,6 +1,6 @@
 """Time Series Endpoint."""
 from datetime import datetime
-from typing import List, Union
+from typing import Dict, Iterator, List, Union
 
 from vortexasdk.api.shared_types import to_ISODate
 from vortexasdk.endpoints.endpoints import CARGO_TIMESERIES_RESOURCE
@@ -148,7 +148,89 @@ class CargoTimeSeries(Search):
 
 
         """
-        api_params = {
+        api_params = self._search_params(
+            filter_activity=filter_activity,
+            timeseries_activity=timeseries_activity,
+            timeseries_frequency=timeseries_frequency,
+            timeseries_unit=timeseries_unit,
+            filter_time_min=filter_time_min,
+            filter_time_max=filter_time_max,
+            filter_charterers=filter_charterers,
+            filter_destinations=filter_destinations,
+            filter_origins=filter_origins,
+            filter_owners=filter_owners,
+            filter_products=filter_products,
+            filter_vessels=filter_vessels,
+            filter_storage_locations=filter_storage_locations,
+            filter_ship_to_ship_locations=filter_ship_to_ship_locations,
+            filter_waypoints=filter_waypoints,
+            disable_geographic_exclusion_rules=disable_geographic_exclusion_rules,
+            timeseries_activity_time_span_min=timeseries_activity_time_span_min,
+            timeseries_activity_time_span_max=timeseries_activity_time_span_max,
+        )
+
+        return TimeSeriesResult(super().search(**api_params))
+
+    async def search_async(self, *args, **kwargs) -> TimeSeriesResult:
+        """
+        Find aggregated flows matching the given search arguments, without blocking the event loop.
+
+        Awaitable variant of `search`, taking the same arguments. All pages are requested concurrently with the global
+        `AsyncVortexaClient`.
+
+        # Returns
+        `TimeSeriesResult`, as `search` does.
+
+        # Example
+
+        >>> from vortexasdk import CargoTimeSeries
+        >>> result = await CargoTimeSeries().search_async(timeseries_frequency='month', timeseries_unit='bpd', filter_activity='loading_state', filter_time_min=datetime(2018, 1, 1), filter_time_max=datetime(2018, 12, 31)) # doctest: +SKIP
+
+        """
+        api_params = self._search_params(*args, **kwargs)
+
+        return TimeSeriesResult(await super().search_async(**api_params))
+
+    def iter_pages(self, *args, **kwargs) -> Iterator[List[dict]]:
+        """
+        Find aggregated flows matching the given search arguments, yielding each page of records as soon as it's loaded.
+
+        Takes the same arguments as `search`. See `Search.iter_pages` for how pages are loaded.
+
+        # Returns
+        An iterator of pages, each page being a list of records.
+
+        # Example
+
+        >>> from vortexasdk import CargoTimeSeries
+        >>> for page in CargoTimeSeries().iter_pages(timeseries_frequency='month', timeseries_unit='bpd', filter_activity='loading_state', filter_time_min=datetime(2018, 1, 1), filter_time_max=datetime(2018, 12, 31)): # doctest: +SKIP
+        ...     print(len(page))
+
+        """
+        return super().iter_pages(**self._search_params(*args, **kwargs))
+
+    def _search_params(
+        self,
+        filter_activity: str,
+        timeseries_activity: str = None,
+        timeseries_frequency: str = "day",
+        timeseries_unit: str = "b",
+        filter_time_min: datetime = datetime(2019, 10, 1, 0),
+        filter_time_max: datetime = datetime(2019, 10, 1, 1),
+        filter_charterers: Union[str, List[str]] = None,
+        filter_destinations: Union[str, List[str]] = None,
+        filter_origins: Union[str, List[str]] = None,
+        filter_owners: Union[str, List[str]] = None,
+        filter_products: Union[str, List[str]] = None,
+        filter_vessels: Union[str, List[str]] = None,
+        filter_storage_locations: Union[str, List[str]] = None,
+        filter_ship_to_ship_locations: Union[str, List[str]] = None,
+        filter_waypoints: Union[str, List[str]] = None,
+        disable_geographic_exclusion_rules: bool = None,
+        timeseries_activity_time_span_min: int = None,
+        timeseries_activity_time_span_max: int = None,
+    ) -> Dict:
+        return {
             "filter_activity": filter_activity,
             "filter_time_min": to_ISODate(filter_time_min),
             "filter_time_max": to_ISODate(filter_time_max),
@@ -173,5 +255,3 @@ class CargoTimeSeries(Search):
             "timeseries_activity": timeseries_activity or filter_activity,
             "size": self._MAX_PAGE_RESULT_SIZE,
         }
-
-        return TimeSeriesResult(super().search(**api_params))
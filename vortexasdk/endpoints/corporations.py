@@ -67,12 +67,41 @@ class Corporations(Reference, Search):
         [VortexaAPI Corporation Reference](https://docs.vortexa.com/reference/POST/reference/charterers)
 
         """
-        api_params = convert_values_to_list({"term": term})
+        api_params = self._search_params(term=term)
 
         return CorporationsResult(
             super().search(exact_term_match=exact_term_match, **api_params)
         )
 
+    async def search_async(
+        self, *args, exact_term_match: bool = False, **kwargs
+    ) -> CorporationsResult:
+        """
+        Find corporations matching the given search arguments, without blocking the event loop.
+
+        Awaitable variant of `search`, taking the same arguments. All pages are requested concurrently with the global
+        `AsyncVortexaClient`.
+
+        # Returns
+        `CorporationsResult`, as `search` does.
+
+        # Example
+
+        >>> from vortexasdk import Corporations
+        >>> result = await Corporations().search_async(term="do") # doctest: +SKIP
+
+        """
+        api_params = self._search_params(*args, **kwargs)
+
+        return CorporationsResult(
+            await super().search_async(
+                exact_term_match=exact_term_match, **api_params
+            )
+        )
+
+    def _search_params(self, term: Union[str, List[str]] = None) -> Dict:
+        return convert_values_to_list({"term": term})
+
     def reference(self, id: ID) -> Dict:
         """
         Perform a corporation lookup.
@@ -1,11 +1,16 @@
-from typing import List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List
 
 from vortexasdk.api import Corporation
 from vortexasdk.api.search_result import Result
 from vortexasdk.logger import get_logger
-from vortexasdk.result_conversions import create_dataframe, create_list
+from vortexasdk.result_conversions import (
+    create_columns,
+    create_dataframe,
+    create_list,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = get_logger(__name__)
 
@@ -18,7 +23,7 @@ class CorporationsResult(Result):
         # noinspection PyTypeChecker
         return create_list(super().to_list(), Corporation)
 
-    def to_df(self, columns=None) -> pd.DataFrame:
+    def to_df(self, columns=None) -> "pd.DataFrame":
         """
         Represent corporations as a `pd.DataFrame`.
 
@@ -38,5 +43,12 @@ class CorporationsResult(Result):
             logger_description="Corporations",
         )
 
+    def _to_columns(self, columns=None) -> Dict[str, List]:
+        return create_columns(
+            columns=columns,
+            default_columns=DEFAULT_COLUMNS,
+            data=super().to_list(),
+        )
+
 
 DEFAULT_COLUMNS = ["id", "name", "corporate_entity_type"]
@@ -64,12 +64,41 @@ class Geographies(Reference, Search):
         |  2 | 8b4273e3181f2d... | Liverpool Docks        | ['terminal'] |
         |  3 | 98c50b0d2ee2b1... | Liverpool Bulk Liquids | ['terminal'] |
         """
-        api_params = convert_values_to_list({"term": term})
+        api_params = self._search_params(term=term)
 
         return GeographyResult(
             super().search(exact_term_match=exact_term_match, **api_params)
         )
 
+    async def search_async(
+        self, *args, exact_term_match: bool = False, **kwargs
+    ) -> GeographyResult:
+        """
+        Find geographies matching the given search arguments, without blocking the event loop.
+
+        Awaitable variant of `search`, taking the same arguments. All pages are requested concurrently with the global
+        `AsyncVortexaClient`.
+
+        # Returns
+        `GeographyResult`, as `search` does.
+
+        # Example
+
+        >>> from vortexasdk import Geographies
+        >>> result = await Geographies().search_async(term="rotterdam") # doctest: +SKIP
+
+        """
+        api_params = self._search_params(*args, **kwargs)
+
+        return GeographyResult(
+            await super().search_async(
+                exact_term_match=exact_term_match, **api_params
+            )
+        )
+
+    def _search_params(self, term: Union[str, List[str]] = None) -> Dict:
+        return convert_values_to_list({"term": term})
+
     def reference(self, id: ID) -> Dict:
         """
         Perform a geography lookup.
@@ -68,17 +68,53 @@ class Products(Reference, Search):
         [VortexaAPI Product Reference](https://docs.vortexa.com/reference/POST/reference/products)
 
         """
-        api_params = {
+        api_params = self._search_params(
+            term=term, ids=ids, product_parent=product_parent,
+        )
+
+        return ProductResult(
+            super().search(exact_term_match=exact_term_match, **api_params)
+        )
+
+    async def search_async(
+        self, *args, exact_term_match: bool = False, **kwargs
+    ) -> ProductResult:
+        """
+        Find products matching the given search arguments, without blocking the event loop.
+
+        Awaitable variant of `search`, taking the same arguments. All pages are requested concurrently with the global
+        `AsyncVortexaClient`.
+
+        # Returns
+        `ProductResult`, as `search` does.
+
+        # Example
+
+        >>> from vortexasdk import Products
+        >>> result = await Products().search_async(term="diesel") # doctest: +SKIP
+
+        """
+        api_params = self._search_params(*args, **kwargs)
+
+        return ProductResult(
+            await super().search_async(
+                exact_term_match=exact_term_match, **api_params
+            )
+        )
+
+    def _search_params(
+        self,
+        term: Union[str, List[str]] = None,
+        ids: Union[str, List[str]] = None,
+        product_parent: Union[str, List[str]] = None,
+    ) -> Dict:
+        return {
             "term": convert_to_list(term),
             "ids": convert_to_list(ids),
             "product_parent": convert_to_list(product_parent),
             "allowTopLevelProducts": True,
         }
 
-        return ProductResult(
-            super().search(exact_term_match=exact_term_match, **api_params)
-        )
-
     def reference(self, id: ID) -> Dict:
         """
         Perform a product lookup.
@@ -1,12 +1,17 @@
-from typing import List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List
 
 from vortexasdk.api import Product
 from vortexasdk.api.entity_flattening import flatten_dictionary
 from vortexasdk.api.search_result import Result
 from vortexasdk.logger import get_logger
-from vortexasdk.result_conversions import create_dataframe, create_list
+from vortexasdk.result_conversions import (
+    create_columns,
+    create_dataframe,
+    create_list,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = get_logger(__name__)
 
@@ -19,7 +24,7 @@ class ProductResult(Result):
         # noinspection PyTypeChecker
         return create_list(super().to_list(), Product)
 
-    def to_df(self, columns=None) -> pd.DataFrame:
+    def to_df(self, columns=None) -> "pd.DataFrame":
         """
         Represent products as a `pd.DataFrame`.
 
@@ -41,5 +46,14 @@ class ProductResult(Result):
             logger_description="Products",
         )
 
+    def _to_columns(self, columns=None) -> Dict[str, List]:
+        flattened_dicts = [flatten_dictionary(p) for p in super().to_list()]
+
+        return create_columns(
+            columns=columns,
+            default_columns=DEFAULT_COLUMNS,
+            data=flattened_dicts,
+        )
+
 
 DEFAULT_COLUMNS = ["id", "name", "layer.0", "parent.0.name"]
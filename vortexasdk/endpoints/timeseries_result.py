@@ -1,11 +1,16 @@
-from typing import List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List
 
 from vortexasdk.api.search_result import Result
 from vortexasdk.api.timeseries_item import TimeSeriesItem
 from vortexasdk.logger import get_logger
-from vortexasdk.result_conversions import create_dataframe, create_list
+from vortexasdk.result_conversions import (
+    create_columns,
+    create_dataframe,
+    create_list,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = get_logger(__name__)
 
@@ -18,11 +23,16 @@ class TimeSeriesResult(Result):
         # noinspection PyTypeChecker
         return create_list(super().to_list(), TimeSeriesItem)
 
-    def to_df(self, columns=None) -> pd.DataFrame:
+    def to_df(self, columns=None, parse_timestamps=False) -> "pd.DataFrame":
         """Represents the timeseries as a dataframe.
 
+        # Arguments
+            columns: Output columns present in the `pd.DataFrame`.
+            Enter `columns=None` to use `timeseries_result.DEFAULT_COLUMNS`.
+            parse_timestamps: Parse the `key` column into `datetime64[ns, UTC]`, instead of ISO 8601 strings.
+
         Returns a `pd.DataFrame`, of time series items with columns:
-         key: The time series key
+         key: The time series key, the start of the time bucket
          value: The value of the time series for a given key
          count: The number of records contributing to this time series record.
 
@@ -38,6 +48,14 @@ class TimeSeriesResult(Result):
             default_columns=DEFAULT_COLUMNS,
             data=super().to_list(),
             logger_description="TimeSeries",
+            parse_timestamps=parse_timestamps,
+        )
+
+    def _to_columns(self, columns=None) -> Dict[str, List]:
+        return create_columns(
+            columns=columns,
+            default_columns=DEFAULT_COLUMNS,
+            data=super().to_list(),
         )
 
 
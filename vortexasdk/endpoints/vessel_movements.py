@@ -1,6 +1,6 @@
 """Vessel Movements Endpoint."""
 from datetime import datetime
-from typing import List, Union
+from typing import Dict, Iterator, List, Union
 
 from vortexasdk.api import ID
 from vortexasdk.api.shared_types import to_ISODate
@@ -152,6 +152,108 @@ class VesselMovements(Search):
         [Vessel Movements Endpoint Further Documentation](https://docs.vortexa.com/reference/POST/vessel-movements/search)
 
         """
+        api_params = self._search_params(
+            filter_time_min=filter_time_min,
+            filter_time_max=filter_time_max,
+            unit=unit,
+            filter_activity=filter_activity,
+            filter_charterers=filter_charterers,
+            filter_destinations=filter_destinations,
+            filter_origins=filter_origins,
+            filter_owners=filter_owners,
+            filter_products=filter_products,
+            filter_vessels=filter_vessels,
+            filter_vessel_classes=filter_vessel_classes,
+            filter_vessel_status=filter_vessel_status,
+            filter_vessel_age_min=filter_vessel_age_min,
+            filter_vessel_age_max=filter_vessel_age_max,
+            filter_vessel_scrubbers=filter_vessel_scrubbers,
+            filter_vessel_flags=filter_vessel_flags,
+            filter_vessel_ice_class=filter_vessel_ice_class,
+            filter_vessel_propulsion=filter_vessel_propulsion,
+            exclude_origins=exclude_origins,
+            exclude_destinations=exclude_destinations,
+            exclude_products=exclude_products,
+            exclude_vessels=exclude_vessels,
+            exclude_vessel_classes=exclude_vessel_classes,
+            exclude_charterers=exclude_charterers,
+            exclude_owners=exclude_owners,
+            exclude_vessel_flags=exclude_vessel_flags,
+            exclude_vessel_ice_class=exclude_vessel_ice_class,
+            exclude_vessel_propulsion=exclude_vessel_propulsion,
+        )
+
+        return VesselMovementsResult(super().search(**api_params))
+
+    async def search_async(self, *args, **kwargs) -> VesselMovementsResult:
+        """
+        Find vessel movements matching the given search arguments, without blocking the event loop.
+
+        Awaitable variant of `search`, taking the same arguments. All pages are requested concurrently with the global
+        `AsyncVortexaClient`.
+
+        # Returns
+        `VesselMovementsResult`, as `search` does.
+
+        # Example
+
+        >>> from vortexasdk import VesselMovements
+        >>> result = await VesselMovements().search_async(filter_time_min=datetime(2017, 10, 1), filter_time_max=datetime(2017, 10, 2)) # doctest: +SKIP
+
+        """
+        api_params = self._search_params(*args, **kwargs)
+
+        return VesselMovementsResult(await super().search_async(**api_params))
+
+    def iter_pages(self, *args, **kwargs) -> Iterator[List[dict]]:
+        """
+        Find vessel movements matching the given search arguments, yielding each page of records as soon as it's loaded.
+
+        Takes the same arguments as `search`. See `Search.iter_pages` for how pages are loaded.
+
+        # Returns
+        An iterator of pages, each page being a list of records.
+
+        # Example
+
+        >>> from vortexasdk import VesselMovements
+        >>> for page in VesselMovements().iter_pages(filter_time_min=datetime(2017, 10, 1), filter_time_max=datetime(2017, 10, 2)): # doctest: +SKIP
+        ...     print(len(page))
+
+        """
+        return super().iter_pages(**self._search_params(*args, **kwargs))
+
+    def _search_params(
+        self,
+        filter_time_min: datetime = datetime(2019, 10, 1, 0),
+        filter_time_max: datetime = datetime(2019, 10, 1, 1),
+        unit: str = "b",
+        filter_activity: str = None,
+        filter_charterers: Union[ID, List[ID]] = None,
+        filter_destinations: Union[ID, List[ID]] = None,
+        filter_origins: Union[ID, List[ID]] = None,
+        filter_owners: Union[ID, List[ID]] = None,
+        filter_products: Union[ID, List[ID]] = None,
+        filter_vessels: Union[ID, List[ID]] = None,
+        filter_vessel_classes: Union[ID, List[ID]] = None,
+        filter_vessel_status: str = None,
+        filter_vessel_age_min: int = None,
+        filter_vessel_age_max: int = None,
+        filter_vessel_scrubbers: str = "disabled",
+        filter_vessel_flags: Union[ID, List[ID]] = None,
+        filter_vessel_ice_class: Union[ID, List[ID]] = None,
+        filter_vessel_propulsion: Union[ID, List[ID]] = None,
+        exclude_origins: Union[ID, List[ID]] = None,
+        exclude_destinations: Union[ID, List[ID]] = None,
+        exclude_products: Union[ID, List[ID]] = None,
+        exclude_vessels: Union[ID, List[ID]] = None,
+        exclude_vessel_classes: Union[ID, List[ID]] = None,
+        exclude_charterers: Union[ID, List[ID]] = None,
+        exclude_owners: Union[ID, List[ID]] = None,
+        exclude_vessel_flags: Union[ID, List[ID]] = None,
+        exclude_vessel_ice_class: Union[ID, List[ID]] = None,
+        exclude_vessel_propulsion: Union[ID, List[ID]] = None,
+    ) -> Dict:
         exclude_params = {
             "filter_origins": convert_to_list(exclude_origins),
             "filter_destinations": convert_to_list(exclude_destinations),
@@ -169,7 +271,7 @@ class VesselMovements(Search):
             ),
         }
 
-        api_params = {
+        return {
             "filter_activity": filter_activity,
             "filter_time_min": to_ISODate(filter_time_min),
             "filter_time_max": to_ISODate(filter_time_max),
@@ -195,5 +297,3 @@ class VesselMovements(Search):
             "exclude": exclude_params,
             "size": self._MAX_PAGE_RESULT_SIZE,
         }
-
-        return VesselMovementsResult(super().search(**api_params))
@@ -1,18 +1,23 @@
 import functools
-import os
-from multiprocessing.pool import Pool
-from typing import List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List
 
 from vortexasdk.api import VesselMovement
 from vortexasdk.api.entity_flattening import (
     convert_vessel_movement_to_flat_dict,
 )
+from vortexasdk.api.entity_projection import VESSEL_MOVEMENT_PROJECTOR
 from vortexasdk.api.search_result import Result
-from vortexasdk.result_conversions import create_dataframe, create_list
+from vortexasdk.result_conversions import (
+    create_columns,
+    create_dataframe,
+    create_list,
+    map_records,
+)
 from vortexasdk.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
 
@@ -29,7 +34,7 @@ class VesselMovementsResult(Result):
         # noinspection PyTypeChecker
         return create_list(super().to_list(), VesselMovement)
 
-    def to_df(self, columns=None) -> pd.DataFrame:
+    def to_df(self, columns=None, parse_timestamps=False) -> "pd.DataFrame":
         """
         Represent vessel movements as a `pd.DataFrame`.
 
@@ -37,6 +42,7 @@ class VesselMovementsResult(Result):
             columns: Output columns present in the `pd.DataFrame`.
             Enter `columns='all'` to return all available columns.
             Enter `columns=None` to use `vessel_movements.DEFAULT_COLUMNS`.
+            parse_timestamps: Parse timestamp columns into `datetime64[ns, UTC]`, instead of ISO 8601 strings.
 
         # Returns
         `pd.DataFrame`, one row per `VesselMovement`.
@@ -470,24 +476,37 @@ class VesselMovementsResult(Result):
         ```
 
         """
-        if columns is None:
-            columns = DEFAULT_COLUMNS
-
-        logger.debug("Converting each VesselMovement to a flat dictionary")
-        flatten = functools.partial(
-            convert_vessel_movement_to_flat_dict, cols=columns
-        )
-
-        with Pool(os.cpu_count()) as pool:
-            records = pool.map(flatten, super().to_list())
-
         return create_dataframe(
             columns=columns,
             default_columns=DEFAULT_COLUMNS,
-            data=records,
+            data=self._to_columns(columns),
             logger_description="VesselMovements",
+            parse_timestamps=parse_timestamps,
         )
 
+    def _to_columns(self, columns=None) -> Dict[str, List]:
+        if columns is None:
+            columns = DEFAULT_COLUMNS
+
+        if columns == "all":
+            logger.debug("Converting each VesselMovement to a flat dictionary")
+            flatten = functools.partial(
+                convert_vessel_movement_to_flat_dict, cols=columns
+            )
+
+            return create_columns(
+                columns=columns,
+                default_columns=DEFAULT_COLUMNS,
+                data=map_records(flatten, super().to_list()),
+            )
+        else:
+            logger.debug(
+                "Projecting each VesselMovement onto the given columns"
+            )
+            return VESSEL_MOVEMENT_PROJECTOR.project(
+                super().to_list(), columns
+            )
+
 
 DEFAULT_COLUMNS = [
     "vessel.name",
@@ -94,7 +94,53 @@ class Vessels(Reference, Search):
         [VortexaAPI Vessel Reference](https://docs.vortexa.com/reference/POST/reference/vessels)
 
         """
-        api_params = {
+        api_params = self._search_params(
+            term=term,
+            ids=ids,
+            vessel_classes=vessel_classes,
+            vessel_product_types=vessel_product_types,
+            vessel_scrubbers=vessel_scrubbers,
+        )
+
+        return VesselsResult(
+            super().search(exact_term_match=exact_term_match, **api_params)
+        )
+
+    async def search_async(
+        self, *args, exact_term_match: bool = False, **kwargs
+    ) -> VesselsResult:
+        """
+        Find vessels matching the given search arguments, without blocking the event loop.
+
+        Awaitable variant of `search`, taking the same arguments. All pages are requested concurrently with the global
+        `AsyncVortexaClient`.
+
+        # Returns
+        `VesselsResult`, as `search` does.
+
+        # Example
+
+        >>> from vortexasdk import Vessels
+        >>> result = await Vessels().search_async(term="ocean") # doctest: +SKIP
+
+        """
+        api_params = self._search_params(*args, **kwargs)
+
+        return VesselsResult(
+            await super().search_async(
+                exact_term_match=exact_term_match, **api_params
+            )
+        )
+
+    def _search_params(
+        self,
+        term: Union[str, List[str]] = None,
+        ids: Union[str, List[str]] = None,
+        vessel_classes: Union[str, List[str]] = None,
+        vessel_product_types: Union[ID, List[ID]] = None,
+        vessel_scrubbers: str = "disabled",
+    ) -> Dict:
+        return {
             "term": [str(e) for e in convert_to_list(term)],
             "ids": convert_to_list(ids),
             "vessel_product_types": convert_to_list(vessel_product_types),
@@ -104,10 +150,6 @@ class Vessels(Reference, Search):
             "vessel_scrubbers": vessel_scrubbers,
         }
 
-        return VesselsResult(
-            super().search(exact_term_match=exact_term_match, **api_params)
-        )
-
     def reference(self, id: ID) -> Dict:
         """
         Perform a vessel lookup.
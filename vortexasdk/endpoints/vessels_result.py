@@ -1,11 +1,16 @@
-from typing import List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List
 
 from vortexasdk.logger import get_logger
 from vortexasdk.api import Vessel
 from vortexasdk.api.search_result import Result
-from vortexasdk.result_conversions import create_dataframe, create_list
+from vortexasdk.result_conversions import (
+    create_columns,
+    create_dataframe,
+    create_list,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = get_logger(__name__)
 
@@ -18,7 +23,7 @@ class VesselsResult(Result):
         # noinspection PyTypeChecker
         return create_list(super().to_list(), Vessel)
 
-    def to_df(self, columns=None) -> pd.DataFrame:
+    def to_df(self, columns=None) -> "pd.DataFrame":
         """
         Represent vessels as a `pd.DataFrame`.
 
@@ -38,5 +43,12 @@ class VesselsResult(Result):
             logger_description="Vessels",
         )
 
+    def _to_columns(self, columns=None) -> Dict[str, List]:
+        return create_columns(
+            columns=columns,
+            default_columns=DEFAULT_COLUMNS,
+            data=super().to_list(),
+        )
+
 
 DEFAULT_COLUMNS = ["id", "name", "imo", "vessel_class"]
@@ -2,3 +2,55 @@ class InvalidAPIDataResponseException(Exception):
     """Vortexa API returned Faulty Data, contact support."""
 
     pass
+
+
+class MissingPagesException(Exception):
+    """Some pages of a search could not be loaded."""
+
+    pass
+
+
+class PageFetchException(Exception):
+    """
+    A request to the Vortexa API failed.
+
+    # Arguments
+        message: What went wrong.
+        status_code: The HTTP status of the response, `None` if no response was received.
+        offset: The offset of the page requested, `None` for requests that aren't paginated.
+        payload_hash: A hash of the request payload, identifying the search across logs.
+
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int = None,
+        offset: int = None,
+        payload_hash: str = None,
+    ):
+        super().__init__(
+            f"{message} (status: {status_code}, offset: {offset}, payload: {payload_hash})"
+        )
+        self.status_code = status_code
+        self.offset = offset
+        self.payload_hash = payload_hash
+
+
+class PartialResultException(Exception):
+    """
+    Some pages of a search failed, after exhausting their retries.
+
+    # Arguments
+        records: The records of the pages that loaded.
+        failures: The exception raised by each failed page.
+
+    """
+
+    def __init__(self, records: list, failures: list):
+        offsets = [f.offset for f in failures]
+        super().__init__(
+            f"{len(failures)} pages failed to load, at offsets {offsets}. {len(records)} records loaded."
+        )
+        self.records = records
+        self.failures = failures
@@ -0,0 +1,93 @@
+"""
+Decode JSON response bodies with the fastest decoder installed.
+
+`orjson` is used if installed, then `msgspec`, falling back to the standard library's `json` module.
+Set the `VORTEXA_JSON_DECODER` environment variable, or call `set_json_decoder`, to choose a decoder.
+"""
+import json
+from typing import Any, Callable, Dict, Union
+
+from vortexasdk.config import JSON_DECODER
+from vortexasdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+Decoder = Callable[[Union[bytes, str]], Any]
+
+
+def _orjson_decoder() -> Decoder:
+    import orjson
+
+    def decode(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return decode
+
+
+def _msgspec_decoder() -> Decoder:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def decode(content):
+        try:
+            return decoder.decode(content)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return decode
+
+
+def _stdlib_decoder() -> Decoder:
+    return json.loads
+
+
+# Decoder backends, fastest first.
+DECODERS: Dict[str, Callable[[], Decoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": _stdlib_decoder,
+}
+
+
+def create_json_decoder(name: str = "auto") -> Decoder:
+    """
+    Create a JSON decoder.
+
+    # Arguments
+        name: One of `orjson`, `msgspec` or `json`. `auto` picks the fastest decoder installed.
+
+    # Returns
+    A function decoding `bytes` or `str` to python objects, raising `ValueError` on invalid JSON.
+
+    """
+    if name != "auto":
+        return DECODERS[name]()
+
+    for backend, create in DECODERS.items():
+        try:
+            decoder = create()
+        except ImportError:
+            continue
+        logger.debug(f"Decoding JSON with {backend}")
+        return decoder
+
+    return _stdlib_decoder()
+
+
+__decoder__: Decoder = create_json_decoder(JSON_DECODER)
+
+
+def decode_json(content: Union[bytes, str]) -> Any:
+    """Decode a JSON document with the global decoder, raising `ValueError` on invalid JSON."""
+    return __decoder__(content)
+
+
+def set_json_decoder(name: str) -> None:
+    """Set the global decoder, see `create_json_decoder`."""
+    global __decoder__
+    __decoder__ = create_json_decoder(name)
+    logger.debug(f"JSON decoder has been set to {name}")
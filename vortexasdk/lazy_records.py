@@ -0,0 +1,180 @@
+"""
+Hold the records of a search as undecoded pages, decoding each page only when one of its records is accessed.
+
+With `VortexaClient(lazy=True)`, `search` returns a `LazyRecords` sequence instead of a list. Indexing, slicing
+and iterating decode the pages holding the records accessed, `len()` decodes nothing, and records converted to
+dataclasses by `to_list()` are converted once, then memoised.
+"""
+import copy
+from bisect import bisect_right
+from itertools import accumulate
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from vortexasdk.exceptions import MissingPagesException, PageFetchException
+from vortexasdk.json_decoding import decode_json
+from vortexasdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RawPage:
+    """
+    A page of records, kept as the response body received from the API.
+
+    # Arguments
+        content: The undecoded response body.
+        n_records: The number of records the page holds.
+        offset: The offset of the page.
+
+    """
+
+    __slots__ = ("content", "n_records", "offset")
+
+    def __init__(self, content: bytes, n_records: int, offset: int = None):
+        self.content = content
+        self.n_records = n_records
+        self.offset = offset
+
+    def __len__(self) -> int:
+        return self.n_records
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.decode())
+
+    def decode(self) -> List[Dict]:
+        """Decode the page's records, raising if the page doesn't hold the expected number of records."""
+        try:
+            records = decode_json(self.content).get("data", [])
+        except ValueError as e:
+            raise PageFetchException(
+                f"Could not decode response: {e}", offset=self.offset
+            ) from e
+
+        if len(records) != self.n_records:
+            raise MissingPagesException(
+                f"Page at offset {self.offset} holds {len(records)} records, expected {self.n_records}"
+            )
+
+        return records
+
+
+Page = Union[RawPage, List[Dict]]
+
+
+class LazyRecords(Sequence):
+    """
+    A read-only sequence of the records of `pages`, decoding each page on first access.
+
+    # Arguments
+        pages: Pages of records, each either a `RawPage` or a list of decoded records.
+        convert: Function applied to each record on access, its results are memoised.
+
+    # Example
+
+    ```python
+    >>> client = VortexaClient(api_key="...", lazy=True) # doctest: +SKIP
+    >>> result = CargoMovements().search(filter_activity="loading_state") # doctest: +SKIP
+    >>> result[0:10] # doctest: +SKIP
+    >>> result.head(10).to_df() # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self, pages: Sequence[Page], convert: Callable[[Dict], Any] = None
+    ):
+        self._pages = list(pages)
+        self._ends = list(accumulate(len(page) for page in self._pages))
+        self._convert = convert
+
+        self._decoded: Dict[int, List[Dict]] = {}
+        self._converted: Dict[int, Any] = {}
+        self._mapped: Dict[Callable, "LazyRecords"] = {}
+
+    def map(self, convert: Callable[[Dict], Any]) -> "LazyRecords":
+        """
+        The records converted with `convert`, converting each record on access.
+
+        Mapped sequences share their pages' decoded records, and are memoised per `convert` function.
+        """
+        if convert not in self._mapped:
+            mapped = LazyRecords([], convert)
+            mapped._pages, mapped._ends = self._pages, self._ends
+            mapped._decoded = self._decoded
+            self._mapped[convert] = mapped
+
+        return self._mapped[convert]
+
+    def copy(self) -> "LazyRecords":
+        """A copy sharing the undecoded pages, and decoding its own records, so its records can be modified."""
+        return LazyRecords(
+            [
+                page if isinstance(page, RawPage) else copy.deepcopy(page)
+                for page in self._pages
+            ],
+            self._convert,
+        )
+
+    @property
+    def decoded_pages(self) -> int:
+        """The number of pages decoded so far."""
+        return len(self._decoded)
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._record(i) for i in range(*item.indices(len(self)))]
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("LazyRecords index out of range")
+
+        return self._record(item)
+
+    def __iter__(self) -> Iterator:
+        start = 0
+        for number, end in enumerate(self._ends):
+            records = self._page(number)
+            for i in range(start, end):
+                yield self._converted_record(i, records[i - start])
+            start = end
+
+    def __repr__(self) -> str:
+        return f"LazyRecords({len(self)} records, {self.decoded_pages} of {len(self._pages)} pages decoded)"
+
+    def _record(self, i: int):
+        number = bisect_right(self._ends, i)
+        start = self._ends[number - 1] if number > 0 else 0
+
+        return self._converted_record(i, self._page(number)[i - start])
+
+    def _converted_record(self, i: int, record: Dict):
+        if self._convert is None:
+            return record
+        if i not in self._converted:
+            self._converted[i] = self._convert(record)
+        return self._converted[i]
+
+    def _page(self, number: int) -> List[Dict]:
+        records: Optional[List[Dict]] = self._decoded.get(number)
+        if records is None:
+            page = self._pages[number]
+            records = page.decode() if isinstance(page, RawPage) else page
+            self._decoded[number] = records
+            logger.debug(
+                f"Decoded page {number + 1} of {len(self._pages)}, {len(records)} records"
+            )
+
+        return records
@@ -13,6 +13,10 @@ def get_logger(logger_name):
     logger = logging.getLogger(logger_name)
     logger.setLevel(LOG_LEVEL)
 
+    if logger.handlers:
+        # Already configured, by an earlier call for the same name
+        return logger
+
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(FORMATTER)
     logger.addHandler(console_handler)
@@ -1,14 +1,28 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from vortexasdk.api.id import ID
-from vortexasdk.client import default_client
+from vortexasdk.cache import cached_response, cached_response_async
 from vortexasdk.exceptions import InvalidAPIDataResponseException
 from vortexasdk.logger import get_logger
+from vortexasdk.reference_index import reference_index
 from vortexasdk.utils import filter_exact_match
 
 logger = get_logger(__name__)
 
 
+def _default_client():
+    # Clients are imported on first request, so importing the endpoints doesn't import `requests`
+    from vortexasdk.client import default_client
+
+    return default_client()
+
+
+def _default_async_client():
+    from vortexasdk.async_client import default_async_client
+
+    return default_async_client()
+
+
 class Reference:
     """Lookup Vortexa Reference Data using an entity ID."""
 
@@ -26,6 +40,8 @@ class Reference:
         """
         Lookup reference data using ID.
 
+        Responses are cached on local disk when a cache is set, see `vortexasdk.cache`.
+
         # Arguments
             id: ID of the entity we're looking up
 
@@ -41,15 +57,52 @@ class Reference:
             f"Looking up {self.__class__.__name__} reference data with id: {id}"
         )
 
-        data = default_client().get_reference(self._resource, id)
+        index = reference_index(self._resource)
+        if index is not None and index.get(id) is not None:
+            logger.debug(f"Found {id} in the reference index")
+            return index.get(id)
 
-        assert len(data) <= 1, InvalidAPIDataResponseException(
-            f"Server error: more than one record returned matching ID {id}"
+        data = cached_response(
+            self._resource,
+            {"reference_id": id},
+            lambda: _default_client().get_reference(self._resource, id),
         )
-        try:
-            return data[0]
-        except IndexError:
-            return {}
+
+        return _single_record(data, id)
+
+    async def reference_async(self, id: ID) -> Dict:
+        """
+        Lookup reference data using ID, without blocking the event loop.
+
+        Awaitable variant of `reference`, sending the request with the global `AsyncVortexaClient`.
+
+        # Arguments
+            id: ID of the entity we're looking up
+
+        # Returns
+        An entity matching the ID
+
+        # Examples
+
+        >>> await Reference("/reference/geographies").reference_async(id='cfb8c4ef76585c3a37792b643791a0f4ff6d5656d5508927d8017319e21f2fca') # doctest: +SKIP
+
+        """
+        logger.info(
+            f"Looking up {self.__class__.__name__} reference data with id: {id}"
+        )
+
+        index = reference_index(self._resource)
+        if index is not None and index.get(id) is not None:
+            logger.debug(f"Found {id} in the reference index")
+            return index.get(id)
+
+        data = await cached_response_async(
+            self._resource,
+            {"reference_id": id},
+            lambda: _default_async_client().get_reference(self._resource, id),
+        )
+
+        return _single_record(data, id)
 
 
 class Search:
@@ -71,6 +124,9 @@ class Search:
         """
         Search Reference data filtering on `params`.
 
+        Responses of reference endpoints are cached on local disk when a cache is set, see `vortexasdk.cache`.
+        Searches on terms and IDs are answered locally when the resource is indexed, see `vortexasdk.reference_index`.
+
         # Arguments
             exact_term_match: Optional argument to filter names on exact matches
             api_params: Search parameters to be passed on to the API
@@ -83,8 +139,113 @@ class Search:
         >>> Search("/reference/vessels").search(term="DHT") # doctest: +SKIP
 
         """
+        index = reference_index(self._resource)
+        if index is not None and index.can_answer(api_params):
+            logger.info(
+                f"Searching {self.__class__.__name__} in the reference index"
+            )
+            return self._filter_search_result(
+                index.answer(api_params), exact_term_match, api_params
+            )
+
+        logger.info(f"Searching {self.__class__.__name__}")
+        api_result = cached_response(
+            self._resource,
+            api_params,
+            lambda: _default_client().search(self._resource, **api_params),
+        )
+
+        return self._filter_search_result(
+            api_result, exact_term_match, api_params
+        )
+
+    async def search_async(
+        self, exact_term_match: bool = None, **api_params
+    ) -> List[dict]:
+        """
+        Search Reference data filtering on `params`, without blocking the event loop.
+
+        Awaitable variant of `search`, sending all page requests concurrently with the global `AsyncVortexaClient`.
+        Responses are cached and searches answered from the reference index as `search` does.
+
+        # Arguments
+            exact_term_match: Optional argument to filter names on exact matches
+            api_params: Search parameters to be passed on to the API
+
+        # Returns
+        Result of VortexaAPI call from hitting querying the `resource` endpoint filtering with `params`.
+
+        # Examples
+
+        >>> await Search("/reference/vessels").search_async(term="DHT") # doctest: +SKIP
+
+        """
+        index = reference_index(self._resource)
+        if index is not None and index.can_answer(api_params):
+            logger.info(
+                f"Searching {self.__class__.__name__} in the reference index"
+            )
+            return self._filter_search_result(
+                index.answer(api_params), exact_term_match, api_params
+            )
+
         logger.info(f"Searching {self.__class__.__name__}")
-        api_result = default_client().search(self._resource, **api_params)
+        api_result = await cached_response_async(
+            self._resource,
+            api_params,
+            lambda: _default_async_client().search(
+                self._resource, **api_params
+            ),
+        )
+
+        return self._filter_search_result(
+            api_result, exact_term_match, api_params
+        )
+
+    def iter_pages(self, **api_params) -> Iterator[List[dict]]:
+        """
+        Search `resource` filtering on `params`, yielding each page of records as soon as it's loaded.
+
+        Only a bounded number of pages are loaded ahead of the page being consumed, so pages can be processed
+        (flattened, written to disk...) while the remaining pages are still downloading, with constant memory.
+
+        Endpoints taking search arguments, such as `CargoMovements`, build the parameters from the same arguments as
+        their `search`.
+
+        # Arguments
+            api_params: Search parameters to be passed on to the API
+
+        # Returns
+        An iterator of pages, each page being a list of records.
+
+        # Examples
+
+        >>> from vortexasdk import CargoMovements
+        >>> for page in CargoMovements().iter_pages(filter_activity="loading_state", filter_time_min=datetime(2019, 1, 1), filter_time_max=datetime(2019, 2, 1)): # doctest: +SKIP
+        ...     print(len(page))
+
+        """
+        logger.info(f"Searching {self.__class__.__name__}, page by page")
+        return _default_client().iter_pages(self._resource, **api_params)
+
+    def search_iter(self, *args, **kwargs) -> Iterator[dict]:
+        """
+        Search `resource` filtering on `params`, yielding each record as soon as its page is loaded.
+
+        Takes the same arguments as `iter_pages`.
+
+        # Examples
+
+        >>> from vortexasdk import VesselMovements
+        >>> ids = [vm["vessel_movement_id"] for vm in VesselMovements().search_iter(filter_time_min=datetime(2019, 1, 1), filter_time_max=datetime(2019, 2, 1))] # doctest: +SKIP
+
+        """
+        for page in self.iter_pages(*args, **kwargs):
+            yield from page
+
+    def _filter_search_result(
+        self, api_result: List[dict], exact_term_match: bool, api_params: Dict
+    ) -> List[dict]:
         logger.debug(
             f"{len(api_result)} results received from {self._resource}"
         )
@@ -94,3 +255,13 @@ class Search:
             return filter_exact_match(api_params["term"], api_result)
         else:
             return api_result
+
+
+def _single_record(data: List[Dict], id: ID) -> Dict:
+    assert len(data) <= 1, InvalidAPIDataResponseException(
+        f"Server error: more than one record returned matching ID {id}"
+    )
+    try:
+        return data[0]
+    except IndexError:
+        return {}
@@ -0,0 +1,247 @@
+"""
+Answer reference data lookups locally, from an in-memory index of a whole reference resource.
+
+Once a resource is indexed with `load_reference_index`, `Search.search`, `Reference.reference` and the
+`conversions` helpers answer term and ID lookups on that resource from the index, without calling the API.
+"""
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from vortexasdk.api.id import ID
+from vortexasdk.logger import get_logger
+from vortexasdk.utils import convert_to_list, filter_empty_values
+
+logger = get_logger(__name__)
+
+# Search parameters that don't filter results, when set to these values.
+_NEUTRAL_PARAMS = {
+    "vessel_scrubbers": "disabled",
+    "allowTopLevelProducts": True,
+}
+
+# Search parameters the index can answer.
+_INDEXED_PARAMS = {"term", "ids"}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class ReferenceIndex:
+    """
+    In-memory index of reference records, with hash maps on ID, name, related names, IMO and MMSI,
+    and a trigram index of names for partial and fuzzy matches.
+
+    # Arguments
+        records: All the raw records of a reference resource.
+
+    # Example
+
+    ```python
+    >>> index = ReferenceIndex([{"id": "1", "name": "Rotterdam [NL]", "related_names": ["Rotterdam"]}])
+    >>> [r["id"] for r in index.search("rotter")]
+    ['1']
+    >>> [r["id"] for r in index.fuzzy("Roterdam")]
+    ['1']
+
+    ```
+    """
+
+    def __init__(self, records: List[Dict]):
+        self.records = records
+
+        self._by_id: Dict[ID, Dict] = {}
+        self._by_name: Dict[str, List[int]] = defaultdict(list)
+        self._by_number: Dict[int, List[int]] = defaultdict(list)
+        self._by_trigram: Dict[str, Set[str]] = defaultdict(set)
+
+        for i, record in enumerate(records):
+            self._by_id[record["id"]] = record
+
+            for name in _names(record):
+                self._by_name[name].append(i)
+
+            for key in ("imo", "mmsi"):
+                number = record.get(key)
+                if number is not None:
+                    self._by_number[int(number)].append(i)
+
+        for name in self._by_name:
+            for trigram in _trigrams(name):
+                self._by_trigram[trigram].add(name)
+
+        logger.debug(
+            f"Indexed {len(records)} records, {len(self._by_name)} names"
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, id: ID) -> Optional[Dict]:
+        """Return the record with a given ID, or `None`."""
+        return self._by_id.get(id)
+
+    def exact(self, name: str) -> List[Dict]:
+        """
+        Return the records whose name or related names match `name`, ignoring case and whitespace.
+
+        Numeric names also match records on IMO or MMSI.
+        """
+        normalised = _normalise(name)
+        positions = list(self._by_name.get(normalised, []))
+        if normalised.isdigit():
+            positions.extend(self._by_number.get(int(normalised), []))
+
+        return self._records_at(positions)
+
+    def search(self, term: str) -> List[Dict]:
+        """
+        Return the records whose name or related names contain `term`, ignoring case and whitespace.
+
+        Numeric terms also match records on IMO or MMSI.
+        """
+        return self._records_at(self._positions_matching(term))
+
+    def fuzzy(
+        self, term: str, limit: int = 10, cutoff: float = 0.5
+    ) -> List[Dict]:
+        """
+        Return the records whose names are most similar to `term`, most similar first.
+
+        Similarity is the Dice coefficient of the names' trigrams, names scoring below `cutoff` aren't returned.
+        """
+        query = _trigrams(_normalise(term))
+        if not query:
+            return self.exact(term)
+
+        shared: Dict[str, int] = defaultdict(int)
+        for trigram in query:
+            for name in self._by_trigram.get(trigram, ()):
+                shared[name] += 1
+
+        scores = {
+            name: 2 * n / (len(query) + len(_trigrams(name)))
+            for name, n in shared.items()
+        }
+        best = sorted(
+            (name for name, score in scores.items() if score >= cutoff),
+            key=lambda name: -scores[name],
+        )
+
+        positions = dict.fromkeys(
+            p for name in best for p in self._by_name[name]
+        )
+        return [self.records[p] for p in positions][:limit]
+
+    def can_answer(self, api_params: Dict) -> bool:
+        """Check whether the search parameters only filter on terms and IDs, which the index can answer."""
+        params = {
+            k: v
+            for k, v in filter_empty_values(api_params).items()
+            if _NEUTRAL_PARAMS.get(k, object()) != v
+        }
+        return set(params.keys()) <= _INDEXED_PARAMS
+
+    def answer(self, api_params: Dict) -> List[Dict]:
+        """Answer a search filtering on `term` and `ids`, combined in an AND manner."""
+        terms = [str(t) for t in convert_to_list(api_params.get("term"))]
+        ids = convert_to_list(api_params.get("ids"))
+
+        if terms:
+            results = self._records_at(
+                p for t in terms for p in self._positions_matching(t)
+            )
+        else:
+            results = list(self.records)
+
+        if ids:
+            allowed = set(ids)
+            results = [r for r in results if r["id"] in allowed]
+
+        return results
+
+    def _positions_matching(self, term: str) -> List[int]:
+        normalised = _normalise(term)
+        positions: List[int] = []
+        if normalised.isdigit():
+            positions.extend(self._by_number.get(int(normalised), []))
+        for name in self._names_containing(normalised):
+            positions.extend(self._by_name[name])
+        return positions
+
+    def _names_containing(self, normalised: str) -> Iterable[str]:
+        query = _trigrams(normalised)
+        if not query:
+            # Too short for trigrams, check every name
+            candidates: Iterable[str] = self._by_name.keys()
+        else:
+            candidates = set.intersection(
+                *(self._by_trigram.get(t, set()) for t in query)
+            )
+
+        return [name for name in candidates if normalised in name]
+
+    def _records_at(self, positions: Iterable[int]) -> List[Dict]:
+        return [self.records[p] for p in dict.fromkeys(sorted(positions))]
+
+
+def _normalise(name: str) -> str:
+    return _WHITESPACE.sub(" ", str(name)).strip().casefold()
+
+
+def _names(record: Dict) -> Set[str]:
+    names = [record.get("name")] + convert_to_list(record.get("related_names"))
+    return {_normalise(n) for n in names if n}
+
+
+def _trigrams(name: str) -> Set[str]:
+    return {"".join(t) for t in zip(name, name[1:], name[2:])}
+
+
+__indexes__: Dict[str, ReferenceIndex] = {}
+
+
+def reference_index(resource: str) -> Optional[ReferenceIndex]:
+    """Return the index of `resource`, or `None` if `resource` isn't indexed."""
+    return __indexes__.get(resource)
+
+
+def set_reference_index(
+    resource: str, index: Optional[ReferenceIndex]
+) -> None:
+    """Set the index used to answer lookups on `resource`. Pass `None` to answer lookups from the API again."""
+    from vortexasdk.conversions.conversions import clear_resolved_ids
+
+    if index is None:
+        __indexes__.pop(resource, None)
+    else:
+        __indexes__[resource] = index
+    clear_resolved_ids(resource)
+    logger.debug(f"Reference index of {resource} has been set")
+
+
+def load_reference_index(endpoint) -> ReferenceIndex:
+    """
+    Load all the records of a reference endpoint, and index them to answer lookups on the endpoint locally.
+
+    # Arguments
+        endpoint: A reference endpoint with a `load_all` method, e.g. `Geographies()`.
+
+    # Returns
+    The `ReferenceIndex` of the endpoint.
+
+    # Example
+
+    ```python
+    >>> from vortexasdk import Geographies
+    >>> load_reference_index(Geographies()) # doctest: +SKIP
+    >>> Geographies().search(term="Rotterdam", exact_term_match=True).to_list() # doctest: +SKIP
+
+    ```
+    """
+    logger.info(f"Indexing {endpoint.__class__.__name__} reference data")
+    set_reference_index(endpoint._resource, None)
+
+    index = ReferenceIndex(endpoint.load_all()._records)
+    set_reference_index(endpoint._resource, index)
+
+    return index
@@ -1,37 +1,91 @@
-from typing import Union, List
+import os
+from multiprocessing.pool import Pool
+from typing import TYPE_CHECKING, Callable, Dict, List, Union
 
+from vortexasdk.api.entity_projection import MISSING
 from vortexasdk.api.serdes import FromDictMixin
+from vortexasdk import column_types
+from vortexasdk.lazy_records import LazyRecords
 from vortexasdk.logger import get_logger
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = get_logger(__name__)
 
+# Starting a process pool costs more than converting a few records in the current process.
+_MIN_RECORDS_FOR_MULTIPROCESSING = 1000
+
 
 def create_list(list_of_dicts, output_class: FromDictMixin) -> List:
-    """Convert each list element into an instance of the output class."""
+    """
+    Convert each list element into an instance of the output class.
+
+    `LazyRecords` are converted lazily, each record being converted once, when it's accessed.
+    """
+    if isinstance(list_of_dicts, LazyRecords):
+        return list_of_dicts.map(output_class.from_dict)
+
     logger.debug(f"Converting list of dictionaries to list of {output_class}")
     return [output_class.from_dict(d) for d in list_of_dicts]
 
 
+def map_records(func: Callable, records: List) -> List:
+    """Apply `func` to each record, using a process pool only when there are enough records to outweigh its cost."""
+    if len(records) < _MIN_RECORDS_FOR_MULTIPROCESSING:
+        return [func(r) for r in records]
+
+    with Pool(os.cpu_count()) as pool:
+        return pool.map(func, records)
+
+
 def create_dataframe(
     columns: Union[None, List[str]],
     default_columns: List[str],
     data: List[dict],
     logger_description: str,
-) -> pd.DataFrame:
+    parse_timestamps: bool = False,
+) -> "pd.DataFrame":
     """
     :param columns: Columns to be used in the dataframe
     :param default_columns: Default columns to be used if columns is None
     :param data: records that will be present in the dataframe
     :param logger_description: name of the type of record created. Used for logging.
+    :param parse_timestamps: Parse timestamp columns, as registered in `column_types`, into `datetime64[ns, UTC]`
     :return: pd.DataFrame of records with specified columns
     """
+    import pandas as pd
+
     logger.debug(f"Creating DataFrame of {logger_description}")
 
     if columns is None:
-        return pd.DataFrame(data=data, columns=default_columns)
+        df = pd.DataFrame(data=data, columns=default_columns)
     elif columns == "all":
-        return pd.DataFrame(data=data)
+        df = pd.DataFrame(data=data)
     else:
-        return pd.DataFrame(data=data, columns=columns)
+        df = pd.DataFrame(data=data, columns=columns)
+
+    if parse_timestamps:
+        for column in column_types.timestamp_columns(df.columns):
+            df[column] = column_types.parse_timestamps(df[column])
+
+    return df
+
+
+def create_columns(
+    columns: Union[None, str, List[str]],
+    default_columns: List[str],
+    data: List[dict],
+) -> Dict[str, List]:
+    """
+    :param columns: Columns to be used, `'all'` to use every key present in any record
+    :param default_columns: Default columns to be used if columns is None
+    :param data: records holding the values of each column
+    :return: Dictionary mapping each column to its list of values, one value per record
+    """
+    if columns is None:
+        columns = default_columns
+    elif columns == "all":
+        columns = list(dict.fromkeys(k for d in data for k in d.keys()))
+
+    return {c: [d.get(c, MISSING) for d in data] for c in columns}
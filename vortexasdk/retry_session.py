@@ -11,8 +11,15 @@ def _requests_retry_session(
     backoff_factor=1,
     status_forcelist=(500, 502, 504),
     session=None,
+    pool_connections=1,
+    pool_maxsize=1,
 ) -> Session:
-    """Instantiate a session with Retry backoff."""
+    """
+    Instantiate a session with Retry backoff.
+
+    The session keeps up to `pool_maxsize` connections alive per host, so requests made through the same
+    session reuse TCP/TLS connections rather than opening a new connection each time.
+    """
     session = session or Session()
 
     retry = Retry(
@@ -26,18 +33,43 @@ def _requests_retry_session(
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
     return session
 
 
-def retry_get(*args, **kwargs) -> Response:
+def create_pooled_session(pool_maxsize: int) -> Session:
+    """
+    Create a long-lived session, holding a pool of up to `pool_maxsize` keep-alive connections.
+
+    The session is safe to share between the threads used to load pages in parallel, as long as the
+    pool is at least as large as the number of threads. Callers are responsible for closing the session.
+
+    The session doesn't retry failed requests: callers retry within their own budget, e.g. `page_retries`.
+    """
+    return _requests_retry_session(retries=0, pool_maxsize=pool_maxsize)
+
+
+def retry_get(*args, session: Session = None, **kwargs) -> Response:
+    """Send a GET request, reusing `session` if given, else using a short-lived session."""
+    if session is not None:
+        return session.get(headers=_HEADERS, *args, **kwargs)
+
     with _requests_retry_session() as s:
         return s.get(headers=_HEADERS, *args, **kwargs)
 
 
-def retry_post(*args, **kwargs) -> Response:
+def retry_post(*args, session: Session = None, **kwargs) -> Response:
+    """Send a POST request, reusing `session` if given, else using a short-lived session."""
+    if session is not None:
+        return session.post(headers=_HEADERS, *args, **kwargs)
+
     with _requests_retry_session() as s:
         return s.post(headers=_HEADERS, *args, **kwargs)
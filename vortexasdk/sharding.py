@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from vortexasdk.api.shared_types import ISODate, to_ISODate
+
+TIME_MIN_KEY = "filter_time_min"
+TIME_MAX_KEY = "filter_time_max"
+
+# Keys uniquely identifying a record, used to remove records returned by more than one time window.
+RECORD_ID_KEYS = ("cargo_movement_id", "vessel_movement_id")
+
+
+class UnsplittableTimeWindowException(Exception):
+    """A time window matches too many records, and cannot be split into smaller windows."""
+
+    pass
+
+
+def has_time_window(payload: Dict) -> bool:
+    """Check whether the search payload is filtered on a time window."""
+    return TIME_MIN_KEY in payload and TIME_MAX_KEY in payload
+
+
+def split_time_window(
+    time_min: ISODate, time_max: ISODate
+) -> List[Tuple[ISODate, ISODate]]:
+    """
+    Split a time window in two halves.
+
+    Neighbouring windows share a boundary, so records on the boundary are returned by both windows.
+
+    # Arguments
+        time_min: The UTC start date of the window.
+        time_max: The UTC end date of the window.
+
+    # Returns
+    Two `(time_min, time_max)` windows, covering the original window.
+
+    """
+    start, end = _parse(time_min), _parse(time_max)
+    midpoint = start + (end - start) / 2
+
+    split = [(start, midpoint), (midpoint, end)]
+    if any(to_ISODate(s) == to_ISODate(e) for s, e in split):
+        raise UnsplittableTimeWindowException(
+            f"Cannot split time window {time_min} - {time_max} any further."
+        )
+
+    return [(to_ISODate(s), to_ISODate(e)) for s, e in split]
+
+
+def with_time_window(
+    payload: Dict, time_min: ISODate, time_max: ISODate
+) -> Dict:
+    """Copy the search payload, filtering on a new time window."""
+    return {**payload, TIME_MIN_KEY: time_min, TIME_MAX_KEY: time_max}
+
+
+def deduplicate_pages(pages: Iterable[List]) -> Iterator[List]:
+    """Remove records already yielded in an earlier page, identifying records by `RECORD_ID_KEYS`."""
+    seen: Set = set()
+    for page in pages:
+        yield deduplicate_records(page, seen)
+
+
+def deduplicate_records(records: List[Dict], seen: Set = None) -> List[Dict]:
+    """Remove duplicate records, and records whose ID is in `seen`. Records without an ID are kept."""
+    seen = set() if seen is None else seen
+
+    deduplicated = []
+    for record in records:
+        record_id = get_record_id(record)
+        if record_id is None:
+            deduplicated.append(record)
+        elif record_id not in seen:
+            seen.add(record_id)
+            deduplicated.append(record)
+
+    return deduplicated
+
+
+def get_record_id(record: Dict):
+    """The ID of a movement record, see `RECORD_ID_KEYS`, or `None` for records without an ID."""
+    for key in RECORD_ID_KEYS:
+        if key in record:
+            return record[key]
+    return None
+
+
+def _parse(iso_date: ISODate) -> datetime:
+    parsed = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
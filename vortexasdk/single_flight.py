@@ -0,0 +1,111 @@
+"""
+Coalesce identical concurrent requests, so that they share a single call to the API.
+
+The first caller of a key runs the request, callers of the same key arriving while it runs wait for, and share,
+its result, or its exception. With a `memo_ttl`, results are also reused by callers arriving up to `memo_ttl`
+seconds after the request completed. Given a `copy` function, each caller of a shared result gets its own copy.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from vortexasdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.completed_at: Optional[float] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time, sharing its outcome with all concurrent callers of the key.
+
+    # Arguments
+        memo_ttl: Seconds a successful result is reused for, once its call completed. `0` only shares calls in flight.
+
+    # Example
+
+    ```python
+    >>> flight = SingleFlight()
+    >>> flight.do(("search", "/v5/reference/geographies", '{"term": "Rotterdam"}'), lambda: 42)
+    42
+
+    ```
+    """
+
+    def __init__(self, memo_ttl: float = 0):
+        self.memo_ttl = memo_ttl
+        self.coalesced = 0
+
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        copy: Callable[[Any], Any] = None,
+    ) -> Any:
+        """
+        Return the result of `func()`, shared with the concurrent, or memoised, call of `key` if there is one.
+
+        With `copy`, a result shared with other callers is copied for each caller, so that a caller modifying its
+        result doesn't modify the others'. A result no other caller shares is returned as it is.
+        """
+        with self._lock:
+            self._forget_expired()
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+                self.coalesced += 1
+
+        if leader:
+            self._run(key, call, func)
+        else:
+            logger.debug(f"Sharing the result of an identical request: {key}")
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        if copy is None or (leader and not self._is_shared(key, call)):
+            return call.result
+        return copy(call.result)
+
+    def _is_shared(self, key: Hashable, call: _Call) -> bool:
+        # Once the call is forgotten, no other caller can join it
+        with self._lock:
+            return call.followers > 0 or self._calls.get(key) is call
+
+    def _run(self, key: Hashable, call: _Call, func: Callable[[], Any]):
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+        finally:
+            call.completed_at = time.monotonic()
+            if call.error is not None or self.memo_ttl <= 0:
+                with self._lock:
+                    if self._calls.get(key) is call:
+                        del self._calls[key]
+            call.done.set()
+
+    def _forget_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            key
+            for key, call in self._calls.items()
+            if call.completed_at is not None
+            and call.completed_at + self.memo_ttl <= now
+        ]
+        for key in expired:
+            del self._calls[key]
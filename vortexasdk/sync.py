@@ -0,0 +1,316 @@
+"""
+Keep a local copy of the movements matching a search up to date, downloading only the movements that may have changed.
+
+Movements are stored in a SQLite database, keyed on their `cargo_movement_id` or `vessel_movement_id`, along with a
+hash of their content. The search's time range is split into fixed time windows. The first sync loads every window,
+later syncs only load again the windows ending less than `lookback` before the previous sync, where movements may
+still be revised. Changed movements are updated, new movements inserted, and movements no longer returned by any
+window are marked as deleted.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from vortexasdk.api.shared_types import to_ISODate
+from vortexasdk.logger import get_logger
+from vortexasdk.sharding import TIME_MAX_KEY, TIME_MIN_KEY, get_record_id
+
+logger = get_logger(__name__)
+
+DEFAULT_LOOKBACK = timedelta(days=7)
+DEFAULT_WINDOW = timedelta(days=1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    scope TEXT NOT NULL,
+    id TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    record TEXT NOT NULL,
+    deleted INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (scope, id)
+);
+CREATE TABLE IF NOT EXISTS window_records (
+    scope TEXT NOT NULL,
+    window_start TEXT NOT NULL,
+    id TEXT NOT NULL,
+    PRIMARY KEY (scope, window_start, id)
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    scope TEXT PRIMARY KEY,
+    synced_until TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class SyncReport:
+    """The changes made to the local store by a sync."""
+
+    windows: int = 0
+    fetched: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+
+class MovementStore:
+    """
+    Local store of movements, in a SQLite database.
+
+    Each synced search has its own scope, so a database can hold the movements of several searches.
+
+    # Arguments
+        path: The SQLite database file, created if it doesn't exist.
+
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def records(self, scope: str, include_deleted: bool = False) -> List[Dict]:
+        """The stored records of `scope`, including the records marked as deleted if `include_deleted`."""
+        query = "SELECT record FROM records WHERE scope = ?"
+        if not include_deleted:
+            query += " AND deleted = 0"
+
+        with self._lock:
+            rows = self._connection.execute(query, (scope,)).fetchall()
+
+        return [json.loads(record) for record, in rows]
+
+    def deleted_ids(self, scope: str) -> List[str]:
+        """The IDs of the records of `scope` marked as deleted."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id FROM records WHERE scope = ? AND deleted = 1",
+                (scope,),
+            ).fetchall()
+
+        return [id for id, in rows]
+
+    def synced_until(self, scope: str) -> Optional[datetime]:
+        """The end of the time range synced by the last sync of `scope`, or `None` if `scope` was never synced."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT synced_until FROM syncs WHERE scope = ?", (scope,)
+            ).fetchone()
+
+        return None if row is None else datetime.fromisoformat(row[0])
+
+    def save_window(
+        self,
+        scope: str,
+        window_start: datetime,
+        records: List[Dict],
+        report: SyncReport,
+    ) -> None:
+        """
+        Replace the records returned by a time window, upserting changed records.
+
+        Records no longer returned by any window of `scope` are marked as deleted.
+        """
+        start = window_start.isoformat()
+        now = time.time()
+
+        with self._lock, self._connection:
+            previous = {
+                id
+                for id, in self._connection.execute(
+                    "SELECT id FROM window_records WHERE scope = ? AND window_start = ?",
+                    (scope, start),
+                )
+            }
+
+            ids = set()
+            for record in records:
+                id = get_record_id(record)
+                if id is None:
+                    logger.warning("Skipping a record without an ID")
+                    continue
+                ids.add(id)
+                self._upsert(scope, id, record, now, report)
+
+            self._connection.execute(
+                "DELETE FROM window_records WHERE scope = ? AND window_start = ?",
+                (scope, start),
+            )
+            self._connection.executemany(
+                "INSERT INTO window_records VALUES (?, ?, ?)",
+                [(scope, start, id) for id in ids],
+            )
+
+            for id in previous - ids:
+                self._delete_if_orphaned(scope, id, now, report)
+
+    def set_synced_until(self, scope: str, synced_until: datetime) -> None:
+        """Record the end of the time range synced."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO syncs VALUES (?, ?)",
+                (scope, synced_until.isoformat()),
+            )
+
+    def _upsert(
+        self, scope: str, id: str, record: Dict, now: float, report: SyncReport
+    ) -> None:
+        content = json.dumps(record, sort_keys=True)
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+
+        row = self._connection.execute(
+            "SELECT hash, deleted FROM records WHERE scope = ? AND id = ?",
+            (scope, id),
+        ).fetchone()
+
+        if row is not None and row == (content_hash, 0):
+            report.unchanged += 1
+            return
+
+        if row is None:
+            report.inserted += 1
+        else:
+            report.updated += 1
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, 0, ?)",
+            (scope, id, content_hash, content, now),
+        )
+
+    def _delete_if_orphaned(
+        self, scope: str, id: str, now: float, report: SyncReport
+    ) -> None:
+        in_window = self._connection.execute(
+            "SELECT 1 FROM window_records WHERE scope = ? AND id = ? LIMIT 1",
+            (scope, id),
+        ).fetchone()
+        if in_window is not None:
+            return
+
+        updated = self._connection.execute(
+            "UPDATE records SET deleted = 1, updated_at = ? WHERE scope = ? AND id = ? AND deleted = 0",
+            (now, scope, id),
+        ).rowcount
+        report.deleted += updated
+
+
+def sync(
+    store_path: str,
+    endpoint,
+    filters: Dict,
+    lookback: timedelta = DEFAULT_LOOKBACK,
+    window: timedelta = DEFAULT_WINDOW,
+    now: datetime = None,
+) -> SyncReport:
+    """
+    Sync the movements matching a search into a local store.
+
+    # Arguments
+        store_path: The SQLite database file holding the store, created if it doesn't exist.
+        endpoint: A movements endpoint, `CargoMovements()` or `VesselMovements()`.
+        filters: The search parameters of `endpoint.search`. `filter_time_min` is required, `filter_time_max`
+            defaults to `now`, so that each sync extends the synced range up to the time of the sync.
+        lookback: How long movements may be revised for. Windows ending less than `lookback` before the
+            previous sync are loaded again.
+        window: The duration of each time window loaded.
+        now: The time of the sync, in UTC. Defaults to the current time.
+
+    # Returns
+    A `SyncReport` of the changes made to the store.
+
+    # Example
+
+    ```python
+    >>> from datetime import datetime, timedelta
+    >>> from vortexasdk import CargoMovements
+    >>> filters = {"filter_activity": "loading_state", "filter_time_min": datetime(2020, 1, 1)}
+    >>> sync("movements.sqlite", CargoMovements(), filters, lookback=timedelta(days=14)) # doctest: +SKIP
+    SyncReport(windows=15, fetched=4211, inserted=12, updated=37, unchanged=4162, deleted=2)
+    >>> with MovementStore("movements.sqlite") as store: # doctest: +SKIP
+    ...     records = store.records(sync_scope(CargoMovements(), filters))
+
+    ```
+    """
+    now = now or datetime.utcnow()
+    time_min = filters[TIME_MIN_KEY]
+    time_max = filters.get(TIME_MAX_KEY) or now
+    scope = sync_scope(endpoint, filters)
+
+    report = SyncReport()
+    with MovementStore(store_path) as store:
+        synced_until = store.synced_until(scope)
+        start = (
+            time_min
+            if synced_until is None
+            else max(time_min, synced_until - lookback)
+        )
+        logger.info(
+            f"Syncing {endpoint.__class__.__name__} from {start} to {time_max}"
+            f", previously synced until {synced_until}"
+        )
+
+        for window_start, window_end in _windows(
+            time_min, start, time_max, window
+        ):
+            records = list(
+                endpoint.search(
+                    **{
+                        **filters,
+                        TIME_MIN_KEY: window_start,
+                        TIME_MAX_KEY: window_end,
+                    }
+                )
+            )
+            report.windows += 1
+            report.fetched += len(records)
+            store.save_window(scope, window_start, records, report)
+
+        store.set_synced_until(scope, time_max)
+
+    logger.info(f"Sync complete: {report}")
+    return report
+
+
+def sync_scope(endpoint, filters: Dict) -> str:
+    """Identify a synced search by its resource and filters, whatever the end of its time range."""
+    search = {
+        k: to_ISODate(v) if isinstance(v, datetime) else v
+        for k, v in filters.items()
+        if k != TIME_MAX_KEY
+    }
+    canonical = json.dumps(
+        {"resource": endpoint._resource, "filters": search},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def _windows(
+    time_min: datetime, start: datetime, time_max: datetime, window: timedelta
+) -> Iterator[Tuple[datetime, datetime]]:
+    """Windows aligned on `time_min`, from the window holding `start` up to `time_max`."""
+    window_start = time_min + ((start - time_min) // window) * window
+    while window_start < time_max:
+        yield window_start, min(window_start + window, time_max)
+        window_start += window
@@ -1,7 +1,8 @@
 from typing import Dict, List, Union
 import json
+import os
+import time
 from urllib.request import urlopen
-from distutils.version import LooseVersion
 from vortexasdk import __name__ as sdk_pkg_name
 from vortexasdk.version import __version__
 
@@ -32,8 +33,8 @@ def filter_exact_match(
         search_result: A list of dictionaries. Each dictionary must contain the key "name".
 
     """
-    allowed_names_list = convert_to_list(allowed_name)
-    return [s for s in search_result if s["name"] in allowed_names_list]
+    allowed_names = set(convert_to_list(allowed_name))
+    return [s for s in search_result if s["name"] in allowed_names]
 
 
 def filter_empty_values(data: Dict) -> Dict:
@@ -48,6 +49,8 @@ def get_latest_sdk_version() -> str:
     with urlopen(url) as u:
         data = json.loads(u.read())
 
+    from distutils.version import LooseVersion
+
     versions = data["releases"].keys()
     sorted_versions = sorted(versions, key=LooseVersion)
     latest_version = sorted_versions[-1]
@@ -55,9 +58,47 @@ def get_latest_sdk_version() -> str:
     return latest_version
 
 
-def is_sdk_version_outdated():
-    """Checks whether SDK version is outdated."""
+def get_latest_sdk_version_cached(
+    path: str, max_age: float = 24 * 60 * 60
+) -> str:
+    """
+    Retrieves the latest SDK version, from the file at `path` if it was saved less than `max_age` seconds ago,
+    else from PyPI, saving it to `path`.
+    """
+    try:
+        with open(path, "r") as f:
+            saved = json.load(f)
+        if time.time() - saved["checked_at"] < max_age:
+            return saved["latest_version"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
     latest_version = get_latest_sdk_version()
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(
+                {"latest_version": latest_version, "checked_at": time.time()},
+                f,
+            )
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+    return latest_version
+
+
+def is_sdk_version_outdated(cache_path: str = None):
+    """Checks whether SDK version is outdated, reusing the latest version saved at `cache_path` if given."""
+    latest_version = (
+        get_latest_sdk_version()
+        if cache_path is None
+        else get_latest_sdk_version_cached(cache_path)
+    )
+    from distutils.version import LooseVersion
+
     if LooseVersion(__version__) < latest_version:
         return latest_version, True
     else: